@@ -1,3418 +1,4588 @@
-#!/usr/bin/env python3
-"""
-Sistema de Análisis de Satélites
-NASA Space App Challenge 2025
-
-Este sistema permite:
-1. Obtener datos de satélites desde Celestrak usando Skyfield
-2. Buscar satélites por nombre
-3. Calcular órbitas y posiciones futuras
-4. Predecir posibles colisiones en los próximos 4 días
-5. Visualizar trayectorias orbitales
-
-Autor: NASA Space App Team
-Fecha: Octubre 2025
-"""
-
-import requests
-import numpy as np
-import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
-import json
-import os
-from skyfield.api import load, EarthSatellite
-from skyfield.timelib import Time
-import pandas as pd
-from typing import List, Dict, Tuple, Optional
-import warnings
-warnings.filterwarnings('ignore')
-
-# Importaciones científicas avanzadas
-try:
-    from scipy.special import erfc
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
-    print("⚠️ SciPy no disponible - usando métodos alternativos para probabilidad")
-
-# Importaciones para visualización 3D
-from mpl_toolkits.mplot3d import Axes3D
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-
-
-class SatelliteAnalyzer:
-    """
-    Clase principal para análisis de satélites usando Skyfield y datos de Celestrak
-    """
-    
-    def __init__(self):
-        """Inicializar el analizador de satélites"""
-        self.ts = load.timescale()
-        self.satellites = {}
-        self.tle_data = {}
-        self.earth = load('de421.bsp')['earth']
-        
-        # Inicializar nuevos componentes avanzados
-        self.realistic_propagator = RealisticOrbitPropagator()
-        self.advanced_collision_analyzer = AdvancedCollisionAnalyzer()
-        self.uncertainty_model = UncertaintyModel()
-        
-        print("🛰️  Inicializando Sistema de Análisis de Satélites...")
-        print("🔬 Componentes avanzados cargados:")
-        print("   ✅ Propagador orbital realista (J2 + arrastre)")
-        print("   ✅ Analizador de colisiones probabilístico")
-        print("   ✅ Modelo de incertidumbre no-lineal")
-        
-    def download_tle_data(self, tle_url: str = None) -> bool:
-        """
-        Descargar datos TLE (Two-Line Elements) desde Celestrak
-        
-        Args:
-            tle_url: URL personalizada para datos TLE
-            
-        Returns:
-            bool: True si la descarga fue exitosa
-        """
-        try:
-            # URLs de diferentes categorías de satélites de Celestrak
-            urls = {
-                'active': 'https://celestrak.org/NORAD/elements/gp.php?GROUP=active&FORMAT=tle',
-                'stations': 'https://celestrak.org/NORAD/elements/gp.php?GROUP=stations&FORMAT=tle',
-                'weather': 'https://celestrak.org/NORAD/elements/gp.php?GROUP=weather&FORMAT=tle',
-                'communications': 'https://celestrak.org/NORAD/elements/gp.php?GROUP=active&FORMAT=tle',
-                'navigation': 'https://celestrak.org/NORAD/elements/gp.php?GROUP=gps-ops&FORMAT=tle'
-            }
-            
-            if tle_url:
-                urls['custom'] = tle_url
-                
-            print("📡 Descargando datos TLE desde Celestrak...")
-            
-            all_satellites = {}
-            for category, url in urls.items():
-                try:
-                    response = requests.get(url, timeout=30)
-                    response.raise_for_status()
-                    
-                    # Parsear datos TLE
-                    lines = response.text.strip().split('\n')
-                    i = 0
-                    while i < len(lines) - 2:
-                        if lines[i].strip() and not lines[i].startswith('#'):
-                            name = lines[i].strip()
-                            line1 = lines[i + 1].strip()
-                            line2 = lines[i + 2].strip()
-                            
-                            if line1.startswith('1 ') and line2.startswith('2 '):
-                                # Crear satélite usando Skyfield
-                                satellite = EarthSatellite(line1, line2, name, self.ts)
-                                all_satellites[name] = {
-                                    'satellite': satellite,
-                                    'line1': line1,
-                                    'line2': line2,
-                                    'category': category
-                                }
-                        i += 3
-                        
-                    print(f"   ✅ {category}: {len([s for s in all_satellites.values() if s['category'] == category])} satélites")
-                    
-                except Exception as e:
-                    print(f"   ❌ Error descargando {category}: {str(e)}")
-                    continue
-            
-            self.satellites = all_satellites
-            print(f"🎯 Total de satélites cargados: {len(self.satellites)}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error descargando datos TLE: {str(e)}")
-            return False
-    
-    def export_satellites_list(self, filename: str = "satelites_disponibles.txt") -> bool:
-        """
-        Exportar lista de todos los satélites disponibles a un archivo de texto
-        
-        Args:
-            filename: Nombre del archivo a crear
-            
-        Returns:
-            bool: True si la exportación fue exitosa
-        """
-        try:
-            if not self.satellites:
-                print("❌ No hay satélites cargados. Ejecuta download_tle_data() primero.")
-                return False
-            
-            # Organizar satélites por categoría
-            satellites_by_category = {}
-            for name, data in self.satellites.items():
-                category = data['category']
-                if category not in satellites_by_category:
-                    satellites_by_category[category] = []
-                satellites_by_category[category].append(name)
-            
-            # Ordenar satélites alfabéticamente dentro de cada categoría
-            for category in satellites_by_category:
-                satellites_by_category[category].sort()
-            
-            # Crear el archivo de texto
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write("=" * 80 + "\n")
-                f.write("LISTA DE SATÉLITES DISPONIBLES\n")
-                f.write("Sistema de Análisis de Satélites - NASA Space App Challenge 2025\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Fecha de generación: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total de satélites: {len(self.satellites)}\n")
-                f.write("=" * 80 + "\n\n")
-                
-                # Escribir resumen por categoría
-                f.write("RESUMEN POR CATEGORÍA:\n")
-                f.write("-" * 40 + "\n")
-                total_count = 0
-                for category, sat_list in satellites_by_category.items():
-                    count = len(sat_list)
-                    total_count += count
-                    f.write(f"{category.capitalize():20s}: {count:5d} satélites\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"{'TOTAL':20s}: {total_count:5d} satélites\n\n")
-                
-                # Escribir lista detallada por categoría
-                for category, sat_list in satellites_by_category.items():
-                    f.write("=" * 80 + "\n")
-                    f.write(f"CATEGORÍA: {category.upper()}\n")
-                    f.write(f"Total en esta categoría: {len(sat_list)} satélites\n")
-                    f.write("=" * 80 + "\n")
-                    
-                    for i, sat_name in enumerate(sat_list, 1):
-                        f.write(f"{i:4d}. {sat_name}\n")
-                    
-                    f.write("\n")
-                
-                # Agregar lista alfabética completa
-                f.write("=" * 80 + "\n")
-                f.write("LISTA ALFABÉTICA COMPLETA\n")
-                f.write("=" * 80 + "\n")
-                
-                all_satellites = sorted(self.satellites.keys())
-                for i, sat_name in enumerate(all_satellites, 1):
-                    category = self.satellites[sat_name]['category']
-                    f.write(f"{i:5d}. {sat_name:<50s} [{category}]\n")
-                
-                # Agregar información útil al final
-                f.write("\n" + "=" * 80 + "\n")
-                f.write("INSTRUCCIONES DE USO:\n")
-                f.write("=" * 80 + "\n")
-                f.write("1. Copia el nombre exacto del satélite que deseas analizar\n")
-                f.write("2. Pégalo en el programa cuando se solicite el nombre\n")
-                f.write("3. Los nombres son sensibles a mayúsculas y minúsculas\n")
-                f.write("4. Usa Ctrl+F para buscar satélites específicos en este archivo\n\n")
-                
-                f.write("EJEMPLOS DE SATÉLITES INTERESANTES:\n")
-                f.write("-" * 40 + "\n")
-                
-                # Buscar algunos satélites interesantes como ejemplos
-                interesting_examples = []
-                search_terms = ["ISS", "HUBBLE", "NOAA", "GPS", "STARLINK", "GOES"]
-                
-                for term in search_terms:
-                    matches = [name for name in all_satellites if term in name.upper()]
-                    if matches:
-                        interesting_examples.append(f"• {matches[0]} (búsqueda: '{term}')")
-                
-                for example in interesting_examples:
-                    f.write(f"{example}\n")
-                
-                f.write("\n" + "=" * 80 + "\n")
-                f.write("¡Explora el cosmos, un satélite a la vez! 🛰️🌌\n")
-                f.write("=" * 80 + "\n")
-            
-            print(f"✅ Lista de satélites exportada exitosamente:")
-            print(f"   📁 Archivo: {filename}")
-            print(f"   🛰️  Total de satélites: {len(self.satellites)}")
-            print(f"   📂 Categorías: {len(satellites_by_category)}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error exportando lista de satélites: {str(e)}")
-            return False
-    
-    def search_satellite(self, search_term: str) -> List[str]:
-        """
-        Buscar satélites por nombre
-        
-        Args:
-            search_term: Término de búsqueda
-            
-        Returns:
-            List[str]: Lista de nombres de satélites que coinciden
-        """
-        search_term = search_term.lower()
-        matches = []
-        
-        for name in self.satellites.keys():
-            if search_term in name.lower():
-                matches.append(name)
-                
-        return sorted(matches)
-    
-    def get_popular_satellites(self) -> Dict[str, List[str]]:
-        """
-        Obtener una lista de satélites populares organizados por categoría
-        
-        Returns:
-            Dict: Diccionario con categorías y satélites populares
-        """
-        popular_categories = {
-            'Estaciones Espaciales': ['ISS', 'ZARYA', 'TIANGONG'],
-            'Telescopios Espaciales': ['HUBBLE', 'SPITZER', 'CHANDRA'],
-            'Satélites Meteorológicos': ['NOAA', 'GOES', 'METEOSAT'],
-            'Navegación GPS': ['GPS', 'NAVSTAR', 'GLONASS'],
-            'Comunicaciones': ['STARLINK', 'INTELSAT', 'IRIDIUM'],
-            'Observación Terrestre': ['LANDSAT', 'AQUA', 'TERRA', 'SENTINEL']
-        }
-        
-        found_satellites = {}
-        
-        for category, search_terms in popular_categories.items():
-            found_satellites[category] = []
-            for term in search_terms:
-                matches = self.search_satellite(term)
-                if matches:
-                    # Agregar los primeros 3 matches de cada término
-                    found_satellites[category].extend(matches[:3])
-            
-            # Remover duplicados y limitar a 5 por categoría
-            found_satellites[category] = list(dict.fromkeys(found_satellites[category]))[:5]
-        
-        return found_satellites
-    
-    def suggest_satellites(self, partial_name: str) -> List[str]:
-        """
-        Sugerir satélites basándose en un nombre parcial
-        
-        Args:
-            partial_name: Nombre parcial del satélite
-            
-        Returns:
-            List[str]: Lista de sugerencias
-        """
-        if len(partial_name) < 2:
-            return []
-        
-        partial_name = partial_name.lower()
-        suggestions = []
-        
-        # Buscar coincidencias exactas al inicio del nombre
-        for name in self.satellites.keys():
-            if name.lower().startswith(partial_name):
-                suggestions.append(name)
-        
-        # Si no hay suficientes, buscar coincidencias en cualquier parte
-        if len(suggestions) < 10:
-            for name in self.satellites.keys():
-                if partial_name in name.lower() and name not in suggestions:
-                    suggestions.append(name)
-        
-        return sorted(suggestions)[:15]  # Limitar a 15 sugerencias
-    
-    def browse_satellites_by_category(self) -> Dict[str, List[str]]:
-        """
-        Navegar satélites organizados por categoría
-        
-        Returns:
-            Dict: Satélites organizados por categoría con muestras
-        """
-        satellites_by_category = {}
-        
-        for name, data in self.satellites.items():
-            category = data['category']
-            if category not in satellites_by_category:
-                satellites_by_category[category] = []
-            satellites_by_category[category].append(name)
-        
-        # Ordenar y limitar para navegación fácil
-        for category in satellites_by_category:
-            satellites_by_category[category] = sorted(satellites_by_category[category])
-        
-        return satellites_by_category
-    
-    def show_satellite_examples(self) -> None:
-        """
-        Mostrar ejemplos de satélites interesantes con descripción
-        """
-        examples = {
-            "🏠 Estaciones Espaciales": {
-                "search_terms": ["ISS", "ZARYA", "TIANGONG"],
-                "description": "Laboratorios orbitales tripulados"
-            },
-            "🔭 Telescopios Espaciales": {
-                "search_terms": ["HUBBLE", "SPITZER", "KEPLER"],
-                "description": "Observatorios astronómicos en el espacio"
-            },
-            "🌤️ Satélites Meteorológicos": {
-                "search_terms": ["NOAA", "GOES", "METEOSAT"],
-                "description": "Monitoreo del clima y tiempo"
-            },
-            "🗺️ Navegación GPS": {
-                "search_terms": ["GPS", "NAVSTAR", "GALILEO"],
-                "description": "Sistemas de posicionamiento global"
-            },
-            "📡 Comunicaciones": {
-                "search_terms": ["STARLINK", "IRIDIUM", "INTELSAT"],
-                "description": "Internet y telecomunicaciones"
-            },
-            "🌍 Observación Terrestre": {
-                "search_terms": ["LANDSAT", "AQUA", "TERRA"],
-                "description": "Monitoreo ambiental y recursos"
-            }
-        }
-        
-        print("\n🌟 EJEMPLOS DE SATÉLITES INTERESANTES:")
-        print("=" * 60)
-        
-        for category, info in examples.items():
-            print(f"\n{category}")
-            print(f"📝 {info['description']}")
-            found_examples = []
-            
-            for term in info['search_terms']:
-                matches = self.search_satellite(term)
-                if matches:
-                    found_examples.extend(matches[:2])  # Máximo 2 por término
-            
-            # Mostrar ejemplos únicos
-            unique_examples = list(dict.fromkeys(found_examples))[:3]
-            for i, example in enumerate(unique_examples, 1):
-                print(f"   {i}. {example}")
-            
-            if not unique_examples:
-                print("   (No se encontraron ejemplos en los datos actuales)")
-        
-        print(f"\n💡 TIP: Usa la opción 1 para buscar cualquiera de estos nombres")
-        print(f"🔍 Ejemplo: busca 'ISS' para encontrar la Estación Espacial Internacional")
-    
-    def smart_search(self, search_term: str) -> Dict:
-        """
-        Búsqueda inteligente que proporciona resultados y sugerencias
-        
-        Args:
-            search_term: Término de búsqueda
-            
-        Returns:
-            Dict: Resultados detallados con sugerencias
-        """
-        results = {
-            'exact_matches': [],
-            'partial_matches': [],
-            'suggestions': [],
-            'category_matches': {},
-            'total_found': 0
-        }
-        
-        if not search_term or len(search_term) < 2:
-            return results
-        
-        search_lower = search_term.lower()
-        
-        # Buscar coincidencias exactas
-        for name in self.satellites.keys():
-            name_lower = name.lower()
-            if search_lower == name_lower:
-                results['exact_matches'].append(name)
-            elif search_lower in name_lower:
-                results['partial_matches'].append(name)
-        
-        # Organizar por categoría
-        for name in results['partial_matches']:
-            category = self.satellites[name]['category']
-            if category not in results['category_matches']:
-                results['category_matches'][category] = []
-            results['category_matches'][category].append(name)
-        
-        # Generar sugerencias si hay pocos resultados
-        if len(results['partial_matches']) < 10:
-            results['suggestions'] = self.suggest_satellites(search_term)
-        
-        results['total_found'] = len(results['exact_matches']) + len(results['partial_matches'])
-        
-        return results
-    
-    def get_satellite_info(self, satellite_name: str) -> Optional[Dict]:
-        """
-        Obtener información detallada de un satélite
-        
-        Args:
-            satellite_name: Nombre del satélite
-            
-        Returns:
-            Dict: Información del satélite o None si no se encuentra
-        """
-        if satellite_name not in self.satellites:
-            return None
-            
-        sat_data = self.satellites[satellite_name]
-        satellite = sat_data['satellite']
-        
-        # Tiempo actual
-        now = self.ts.now()
-        
-        # Calcular posición actual
-        geocentric = satellite.at(now)
-        subpoint = geocentric.subpoint()
-        
-        # Extraer elementos orbitales del TLE
-        line1 = sat_data['line1']
-        line2 = sat_data['line2']
-        
-        # Parsear elementos orbitales
-        inclination = float(line2[8:16])
-        raan = float(line2[17:25])  # Right Ascension of Ascending Node
-        eccentricity = float('0.' + line2[26:33])
-        arg_perigee = float(line2[34:42])
-        mean_anomaly = float(line2[43:51])
-        mean_motion = float(line2[52:63])
-        
-        # Calcular período orbital
-        period_minutes = 1440 / mean_motion  # minutos
-        period_hours = period_minutes / 60
-        
-        # Calcular altitud aproximada
-        # Usando la tercera ley de Kepler: n = sqrt(GM/a³)
-        GM = 398600.4418  # km³/s²
-        n_rad_per_sec = mean_motion * 2 * np.pi / 86400  # radianes por segundo
-        semi_major_axis = (GM / (n_rad_per_sec ** 2)) ** (1/3)
-        
-        altitude_km = semi_major_axis - 6371  # Radio terrestre aprox
-        
-        info = {
-            'name': satellite_name,
-            'category': sat_data['category'],
-            'current_position': {
-                'latitude': subpoint.latitude.degrees,
-                'longitude': subpoint.longitude.degrees,
-                'altitude_km': subpoint.elevation.km
-            },
-            'orbital_elements': {
-                'inclination_deg': inclination,
-                'raan_deg': raan,
-                'eccentricity': eccentricity,
-                'argument_of_perigee_deg': arg_perigee,
-                'mean_anomaly_deg': mean_anomaly,
-                'mean_motion_rev_per_day': mean_motion,
-                'period_hours': period_hours,
-                'semi_major_axis_km': semi_major_axis,
-                'approx_altitude_km': altitude_km
-            },
-            'tle_data': {
-                'line1': line1,
-                'line2': line2
-            }
-        }
-        
-        return info
-    
-    def calculate_future_positions(self, satellite_name: str, days_ahead: int = 180) -> List[Dict]:
-        """
-        Calcular posiciones futuras del satélite
-        
-        Args:
-            satellite_name: Nombre del satélite
-            days_ahead: Días hacia el futuro para calcular
-            
-        Returns:
-            List[Dict]: Posiciones futuras del satélite
-        """
-        try:
-            if satellite_name not in self.satellites:
-                print(f"❌ Satélite '{satellite_name}' no encontrado en la base de datos")
-                # Buscar coincidencias parciales
-                matches = [name for name in self.satellites.keys() if satellite_name.lower() in name.lower()]
-                if matches:
-                    print(f"💡 ¿Te refieres a alguno de estos?")
-                    for i, match in enumerate(matches[:5], 1):
-                        print(f"   {i}. {match}")
-                return []
-                
-            satellite = self.satellites[satellite_name]['satellite']
-            print(f"✅ Calculando posiciones para: {satellite_name}")
-            
-            # Crear timestamps para los próximos días
-            start_time = self.ts.now()
-            positions = []
-            
-            # Calcular posiciones cada 12 horas
-            total_points = days_ahead * 2  # Cada 12 horas = 2 puntos por día
-            print(f"📊 Calculando {total_points} posiciones para {days_ahead} días...")
-            
-            for hours in range(0, days_ahead * 24, 12):
-                try:
-                    t = self.ts.tt_jd(start_time.tt + hours / 24)
-                    geocentric = satellite.at(t)
-                    subpoint = geocentric.subpoint()
-                    
-                    positions.append({
-                        'datetime': t.utc_datetime(),
-                        'latitude': subpoint.latitude.degrees,
-                        'longitude': subpoint.longitude.degrees,
-                        'altitude_km': subpoint.elevation.km,
-                        'x_km': geocentric.position.km[0],
-                        'y_km': geocentric.position.km[1],
-                        'z_km': geocentric.position.km[2]
-                    })
-                except Exception as calc_error:
-                    print(f"⚠️  Error calculando posición para hora {hours}: {calc_error}")
-                    continue
-                    
-            print(f"✅ Calculadas {len(positions)} posiciones exitosamente")
-            return positions
-            
-        except Exception as e:
-            print(f"❌ Error en calculate_future_positions: {str(e)}")
-            return []
-    
-    def analyze_collision_risk(self, satellite1_name: str, satellite2_name: str = None, 
-                             threshold_km: float = 10.0, days_ahead: int = 180) -> Dict:
-        """
-        Analizar riesgo de colisión entre satélites
-        
-        Args:
-            satellite1_name: Primer satélite
-            satellite2_name: Segundo satélite (si None, analiza contra todos)
-            threshold_km: Distancia mínima para considerar riesgo
-            days_ahead: Días a analizar hacia el futuro
-            
-        Returns:
-            Dict: Análisis de riesgo de colisión
-        """
-        if satellite1_name not in self.satellites:
-            return {'error': f'Satélite {satellite1_name} no encontrado'}
-            
-        sat1 = self.satellites[satellite1_name]['satellite']
-        close_encounters = []
-        
-        # Determinar satélites a analizar
-        satellites_to_check = {}
-        if satellite2_name:
-            if satellite2_name in self.satellites:
-                satellites_to_check[satellite2_name] = self.satellites[satellite2_name]
-        else:
-            # Analizar contra una muestra de satélites (primeros 100 para eficiencia)
-            sat_names = list(self.satellites.keys())[:100]
-            for name in sat_names:
-                if name != satellite1_name:
-                    satellites_to_check[name] = self.satellites[name]
-        
-        print(f"🔍 Analizando {len(satellites_to_check)} satélites para posibles colisiones...")
-        
-        # Analizar cada 6 horas durante el período especificado
-        for hours in range(0, days_ahead * 24, 6):
-            t = self.ts.tt_jd(self.ts.now().tt + hours / 24)
-            pos1 = sat1.at(t)
-            
-            for sat2_name, sat2_data in satellites_to_check.items():
-                sat2 = sat2_data['satellite']
-                pos2 = sat2.at(t)
-                
-                # Calcular distancia entre satélites
-                distance_km = np.linalg.norm(
-                    np.array(pos1.position.km) - np.array(pos2.position.km)
-                )
-                
-                if distance_km < threshold_km:
-                    close_encounters.append({
-                        'datetime': t.utc_datetime(),
-                        'satellite2': sat2_name,
-                        'distance_km': distance_km,
-                        'satellite1_pos': pos1.position.km,
-                        'satellite2_pos': pos2.position.km
-                    })
-        
-        # Calcular estadísticas de riesgo
-        risk_level = 'BAJO'
-        if close_encounters:
-            min_distance = min(enc['distance_km'] for enc in close_encounters)
-            if min_distance < 1.0:
-                risk_level = 'CRÍTICO'
-            elif min_distance < 5.0:
-                risk_level = 'ALTO'
-            else:
-                risk_level = 'MEDIO'
-        
-        return {
-            'satellite': satellite1_name,
-            'analysis_period_days': days_ahead,
-            'threshold_km': threshold_km,
-            'close_encounters': close_encounters,
-            'risk_level': risk_level,
-            'total_encounters': len(close_encounters),
-            'satellites_analyzed': len(satellites_to_check)
-        }
-    
-    def advanced_collision_analysis(self, satellite1_name: str, satellite2_name: str = None, 
-                                  threshold_km: float = 10.0, days_ahead: int = 7) -> Dict:
-        """
-        Análisis AVANZADO de colisión con probabilidad estadística real
-        
-        Incluye:
-        - Perturbaciones orbitales (J2, arrastre atmosférico)
-        - Elipsoides de incertidumbre
-        - Probabilidad de colisión estadística
-        - Propagación de incertidumbre
-        
-        Args:
-            satellite1_name: Primer satélite
-            satellite2_name: Segundo satélite (si None, analiza contra muestra)
-            threshold_km: Distancia para análisis detallado
-            days_ahead: Días a analizar
-            
-        Returns:
-            Dict: Análisis probabilístico de colisión
-        """
-        try:
-            if satellite1_name not in self.satellites:
-                return {'error': f'Satélite {satellite1_name} no encontrado'}
-                
-            sat1 = self.satellites[satellite1_name]['satellite']
-            detailed_analysis = []
-            
-            # Determinar satélites para análisis
-            satellites_to_check = {}
-            if satellite2_name:
-                if satellite2_name in self.satellites:
-                    satellites_to_check[satellite2_name] = self.satellites[satellite2_name]
-            else:
-                # Usar muestra más pequeña para análisis detallado
-                sat_names = list(self.satellites.keys())[:20]
-                for name in sat_names:
-                    if name != satellite1_name:
-                        satellites_to_check[name] = self.satellites[name]
-            
-            print(f"🔬 Análisis avanzado de colisión para {len(satellites_to_check)} satélites...")
-            print("   📊 Calculando perturbaciones orbitales...")
-            print("   🎯 Evaluando probabilidades estadísticas...")
-            
-            # Analizar cada 12 horas (más detallado)
-            for hours in range(0, days_ahead * 24, 12):
-                t = self.ts.tt_jd(self.ts.now().tt + hours / 24)
-                
-                # Posición y velocidad del satélite 1 con perturbaciones
-                pos1_raw = sat1.at(t)
-                
-                # Agregar perturbaciones realistas
-                perturbations1 = self.realistic_propagator.calculate_perturbations(pos1_raw, t)
-                drag1 = self.realistic_propagator.atmospheric_drag(pos1_raw, t)
-                
-                # Calcular altitud para el modelo de incertidumbre
-                altitude1 = np.linalg.norm(pos1_raw.position.km) - 6371
-                
-                for sat2_name, sat2_data in satellites_to_check.items():
-                    sat2 = sat2_data['satellite']
-                    pos2_raw = sat2.at(t)
-                    
-                    # Perturbaciones para satélite 2
-                    perturbations2 = self.realistic_propagator.calculate_perturbations(pos2_raw, t)
-                    drag2 = self.realistic_propagator.atmospheric_drag(pos2_raw, t)
-                    
-                    altitude2 = np.linalg.norm(pos2_raw.position.km) - 6371
-                    
-                    # Calcular distancia básica
-                    distance_km = np.linalg.norm(
-                        np.array(pos1_raw.position.km) - np.array(pos2_raw.position.km)
-                    )
-                    
-                    if distance_km < threshold_km:
-                        # Preparar datos para análisis probabilístico
-                        sat1_data_analysis = {
-                            'position': pos1_raw.position.km,
-                            'velocity': pos1_raw.velocity.km_per_s,
-                            'altitude': altitude1,
-                            'radius': 5.0,  # metros (estimación)
-                            'perturbations': perturbations1 + drag1
-                        }
-                        
-                        sat2_data_analysis = {
-                            'position': pos2_raw.position.km,
-                            'velocity': pos2_raw.velocity.km_per_s,
-                            'altitude': altitude2,
-                            'radius': 5.0,  # metros (estimación)
-                            'perturbations': perturbations2 + drag2
-                        }
-                        
-                        # Calcular probabilidad de colisión avanzada
-                        collision_prob = self.advanced_collision_analyzer.calculate_collision_probability(
-                            sat1_data_analysis, sat2_data_analysis, time_window_hours=24
-                        )
-                        
-                        # Propagar incertidumbre
-                        orbital_period1 = 2 * np.pi * np.sqrt(
-                            (np.linalg.norm(pos1_raw.position.km) * 1000)**3 / 
-                            (3.986004418e14)  # GM de la Tierra
-                        ) / 3600  # convertir a horas
-                        
-                        uncertainty1 = self.uncertainty_model.propagate_uncertainty(
-                            hours, orbital_period1, 'moderate'
-                        )
-                        
-                        detailed_analysis.append({
-                            'datetime': t.utc_datetime(),
-                            'satellite2': sat2_name,
-                            'distance_km': distance_km,
-                            'collision_probability': collision_prob.get('probability', 0),
-                            'miss_distance_km': collision_prob.get('miss_distance_km', distance_km),
-                            'combined_radius_km': collision_prob.get('combined_radius_km', 0.01),
-                            'risk_level': collision_prob.get('risk_level', 'BAJO'),
-                            'uncertainty_ellipsoid': collision_prob.get('uncertainty_ellipsoid'),
-                            'position_uncertainty_km': uncertainty1.get('total_position_uncertainty_km', 0),
-                            'perturbations_applied': True,
-                            'hours_from_now': hours,
-                            'sat1_altitude_km': altitude1,
-                            'sat2_altitude_km': altitude2
-                        })
-            
-            # Estadísticas avanzadas
-            if detailed_analysis:
-                # Encuentro más crítico
-                max_prob_encounter = max(detailed_analysis, key=lambda x: x['collision_probability'])
-                min_distance_encounter = min(detailed_analysis, key=lambda x: x['distance_km'])
-                
-                # Nivel de riesgo global
-                max_probability = max(enc['collision_probability'] for enc in detailed_analysis)
-                min_distance = min(enc['distance_km'] for enc in detailed_analysis)
-                
-                if max_probability > 1e-4 or min_distance < 1.0:
-                    global_risk = 'CRÍTICO'
-                elif max_probability > 1e-6 or min_distance < 5.0:
-                    global_risk = 'ALTO'
-                elif max_probability > 1e-8 or min_distance < 10.0:
-                    global_risk = 'MODERADO'
-                else:
-                    global_risk = 'BAJO'
-            else:
-                max_prob_encounter = None
-                min_distance_encounter = None
-                global_risk = 'BAJO'
-                max_probability = 0
-                min_distance = float('inf')
-            
-            return {
-                'satellite': satellite1_name,
-                'analysis_type': 'AVANZADO_PROBABILÍSTICO',
-                'analysis_period_days': days_ahead,
-                'threshold_km': threshold_km,
-                'detailed_encounters': detailed_analysis,
-                'total_encounters': len(detailed_analysis),
-                'global_risk_level': global_risk,
-                'max_collision_probability': max_probability,
-                'min_distance_km': min_distance,
-                'most_critical_encounter': max_prob_encounter,
-                'closest_encounter': min_distance_encounter,
-                'satellites_analyzed': len(satellites_to_check),
-                'perturbations_included': ['J2', 'atmospheric_drag'],
-                'uncertainty_modeling': True,
-                'statistical_analysis': True
-            }
-            
-        except Exception as e:
-            return {
-                'error': f'Error en análisis avanzado: {str(e)}',
-                'satellite': satellite1_name
-            }
-    
-    def calculate_maneuver_time(self, v_rel: float, R_req: float = 1000.0, 
-                              sigma_0: float = 100.0, k: float = 0.001, n: float = 3.0) -> Dict:
-        """
-        Calcular el tiempo necesario para iniciar maniobras de evasión de colisión
-        
-        Basado en la ecuación: t ≥ (R_req + n·σ₀) / (v_rel − n·k)
-        
-        Args:
-            v_rel: Velocidad relativa entre objetos (m/s)
-                  En LEO: ~100 m/s hasta ~14,000 m/s (encuentros frontales)
-            R_req: Distancia de seguridad deseada (m). Ej: 100-1000 m
-            sigma_0: Incertidumbre posicional actual (1-sigma, m)
-            k: Tasa de crecimiento de incertidumbre (m/s)
-            n: Factor de confianza (ej: 3 para 3σ)
-            
-        Returns:
-            Dict: Análisis del tiempo de maniobra
-        """
-        try:
-            # Validar parámetros de entrada
-            if v_rel <= 0:
-                return {'error': 'La velocidad relativa debe ser positiva'}
-            
-            if R_req <= 0:
-                return {'error': 'La distancia de seguridad debe ser positiva'}
-            
-            if sigma_0 < 0:
-                return {'error': 'La incertidumbre posicional no puede ser negativa'}
-            
-            # Calcular componentes de la ecuación
-            numerador = R_req + n * sigma_0
-            denominador = v_rel - n * k
-            
-            # Verificar que el denominador sea positivo
-            if denominador <= 0:
-                return {
-                    'error': 'Configuración inválida',
-                    'reason': 'La velocidad relativa es insuficiente comparada con el crecimiento de incertidumbre',
-                    'recommendation': 'Reducir el factor de confianza (n) o mejorar la precisión orbital (reducir k)',
-                    'v_rel': v_rel,
-                    'n_k': n * k,
-                    'deficit': abs(denominador)
-                }
-            
-            # Calcular tiempo de maniobra
-            t_maneuver_seconds = numerador / denominador
-            
-            # Convertir a diferentes unidades
-            t_minutes = t_maneuver_seconds / 60
-            t_hours = t_minutes / 60
-            t_days = t_hours / 24
-            
-            # Determinar criticidad basada en el tiempo disponible
-            if t_hours < 1:
-                criticidad = "🔴 CRÍTICO"
-                recomendacion = "Maniobra inmediata requerida"
-            elif t_hours < 6:
-                criticidad = "🟠 ALTO"
-                recomendacion = "Preparar maniobra en las próximas horas"
-            elif t_hours < 24:
-                criticidad = "🟡 MEDIO"
-                recomendacion = "Planificar maniobra para hoy"
-            elif t_days < 7:
-                criticidad = "🟢 BAJO"
-                recomendacion = "Maniobra puede planificarse con anticipación"
-            else:
-                criticidad = "🔵 MÍNIMO"
-                recomendacion = "Tiempo suficiente para análisis detallado"
-            
-            # Calcular escenarios alternativos
-            escenarios = []
-            
-            # Escenario conservador (n=2)
-            if n != 2:
-                t_conservador = (R_req + 2 * sigma_0) / (v_rel - 2 * k) if (v_rel - 2 * k) > 0 else None
-                if t_conservador:
-                    escenarios.append({
-                        'nombre': 'Conservador (2σ)',
-                        'tiempo_segundos': t_conservador,
-                        'tiempo_horas': t_conservador / 3600
-                    })
-            
-            # Escenario agresivo (n=1)
-            if n != 1:
-                t_agresivo = (R_req + 1 * sigma_0) / (v_rel - 1 * k) if (v_rel - 1 * k) > 0 else None
-                if t_agresivo:
-                    escenarios.append({
-                        'nombre': 'Agresivo (1σ)',
-                        'tiempo_segundos': t_agresivo,
-                        'tiempo_horas': t_agresivo / 3600
-                    })
-            
-            # Análisis de sensibilidad
-            sensibilidad = {
-                'impacto_v_rel': {
-                    'descripcion': 'Efecto de ±10% en velocidad relativa',
-                    'v_rel_high': v_rel * 1.1,
-                    't_high': (numerador) / (v_rel * 1.1 - n * k) if (v_rel * 1.1 - n * k) > 0 else None,
-                    'v_rel_low': v_rel * 0.9,
-                    't_low': (numerador) / (v_rel * 0.9 - n * k) if (v_rel * 0.9 - n * k) > 0 else None
-                },
-                'impacto_incertidumbre': {
-                    'descripcion': 'Efecto de ±50% en incertidumbre',
-                    'sigma_high': sigma_0 * 1.5,
-                    't_sigma_high': (R_req + n * sigma_0 * 1.5) / denominador,
-                    'sigma_low': sigma_0 * 0.5,
-                    't_sigma_low': (R_req + n * sigma_0 * 0.5) / denominador
-                }
-            }
-            
-            return {
-                'parametros': {
-                    'v_rel_ms': v_rel,
-                    'R_req_m': R_req,
-                    'sigma_0_m': sigma_0,
-                    'k_ms': k,
-                    'factor_confianza': n
-                },
-                'tiempo_maniobra': {
-                    'segundos': t_maneuver_seconds,
-                    'minutos': t_minutes,
-                    'horas': t_hours,
-                    'dias': t_days
-                },
-                'evaluacion': {
-                    'criticidad': criticidad,
-                    'recomendacion': recomendacion
-                },
-                'componentes_calculo': {
-                    'numerador': numerador,
-                    'denominador': denominador,
-                    'margen_seguridad': denominador - n * k
-                },
-                'escenarios_alternativos': escenarios,
-                'analisis_sensibilidad': sensibilidad,
-                'interpretacion': {
-                    'contexto_leo': self._get_leo_context(v_rel),
-                    'recomendaciones_operacionales': self._get_operational_recommendations(t_hours, v_rel)
-                }
-            }
-            
-        except Exception as e:
-            return {'error': f'Error en cálculo: {str(e)}'}
-    
-    def _get_leo_context(self, v_rel: float) -> Dict:
-        """Proporcionar contexto específico para órbitas LEO"""
-        if v_rel < 500:
-            tipo_encuentro = "Co-orbital o encuentro suave"
-            descripcion = "Satélites en órbitas similares con baja velocidad relativa"
-        elif v_rel < 2000:
-            tipo_encuentro = "Encuentro lateral"
-            descripcion = "Cruce de órbitas con ángulo moderado"
-        elif v_rel < 8000:
-            tipo_encuentro = "Encuentro perpendicular"
-            descripcion = "Órbitas con planos orbitales diferentes"
-        else:
-            tipo_encuentro = "Encuentro frontal"
-            descripcion = "Órbitas con inclinaciones opuestas - máximo riesgo"
-            
-        return {
-            'tipo_encuentro': tipo_encuentro,
-            'descripcion': descripcion,
-            'velocidad_relativa_ms': v_rel,
-            'velocidad_relativa_kmh': v_rel * 3.6
-        }
-    
-    def _get_operational_recommendations(self, t_hours: float, v_rel: float) -> List[str]:
-        """Generar recomendaciones operacionales específicas"""
-        recomendaciones = []
-        
-        if t_hours < 1:
-            recomendaciones.extend([
-                "🚨 Activar protocolo de emergencia",
-                "📡 Contactar inmediatamente con el centro de control",
-                "⚡ Ejecutar maniobra de emergencia pre-programada",
-                "📊 Monitoreo continuo de telemetría"
-            ])
-        elif t_hours < 6:
-            recomendaciones.extend([
-                "📋 Preparar plan de maniobra detallado",
-                "🔍 Refinar datos orbitales con mediciones adicionales",
-                "👥 Notificar a otros operadores satelitales",
-                "⚙️ Verificar sistemas de propulsión"
-            ])
-        elif t_hours < 24:
-            recomendaciones.extend([
-                "📈 Realizar análisis de conjunción detallado",
-                "🛰️ Considerar maniobras coordinadas si aplica",
-                "📡 Incrementar frecuencia de tracking",
-                "💾 Documentar procedimientos para caso similar"
-            ])
-        else:
-            recomendaciones.extend([
-                "🔬 Análisis exhaustivo de múltiples escenarios",
-                "🤝 Coordinación con agencias espaciales",
-                "📊 Optimización de combustible para maniobra",
-                "🎯 Planificación de maniobra de precisión"
-            ])
-            
-        # Recomendaciones específicas por velocidad relativa
-        if v_rel > 10000:
-            recomendaciones.append("⚠️ Encuentro de alta velocidad - considerar maniobra temprana")
-        elif v_rel < 500:
-            recomendaciones.append("🔄 Encuentro lento - maniobra de larga duración posible")
-            
-        return recomendaciones
-    
-    def plot_orbit(self, satellite_name: str, hours: int = 24) -> bool:
-        """
-        Visualizar la órbita de un satélite
-        
-        Args:
-            satellite_name: Nombre del satélite
-            hours: Horas de órbita a mostrar
-            
-        Returns:
-            bool: True si el plot fue exitoso
-        """
-        if satellite_name not in self.satellites:
-            print(f"❌ Satélite {satellite_name} no encontrado")
-            return False
-            
-        satellite = self.satellites[satellite_name]['satellite']
-        
-        # Calcular posiciones para la visualización
-        positions = []
-        times = []
-        
-        start_time = self.ts.now()
-        for minutes in range(0, hours * 60, 10):  # Cada 10 minutos
-            t = self.ts.tt_jd(start_time.tt + minutes / (24 * 60))
-            geocentric = satellite.at(t)
-            subpoint = geocentric.subpoint()
-            
-            positions.append([
-                subpoint.longitude.degrees,
-                subpoint.latitude.degrees
-            ])
-            times.append(t.utc_datetime())
-        
-        positions = np.array(positions)
-        
-        # Crear el plot
-        plt.figure(figsize=(15, 8))
-        
-        # Subplot 1: Trayectoria en mapa mundial
-        plt.subplot(1, 2, 1)
-        plt.plot(positions[:, 0], positions[:, 1], 'b-', linewidth=2, alpha=0.7)
-        plt.scatter(positions[0, 0], positions[0, 1], color='green', s=100, 
-                   label='Inicio', zorder=5)
-        plt.scatter(positions[-1, 0], positions[-1, 1], color='red', s=100, 
-                   label='Fin', zorder=5)
-        
-        plt.xlim(-180, 180)
-        plt.ylim(-90, 90)
-        plt.xlabel('Longitud (°)')
-        plt.ylabel('Latitud (°)')
-        plt.title(f'Trayectoria Orbital: {satellite_name}\n({hours} horas)')
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        # Agregar líneas de referencia
-        plt.axhline(y=0, color='k', linestyle='--', alpha=0.3)
-        plt.axvline(x=0, color='k', linestyle='--', alpha=0.3)
-        
-        # Subplot 2: Altitud vs tiempo
-        plt.subplot(1, 2, 2)
-        altitudes = []
-        for minutes in range(0, hours * 60, 10):
-            t = self.ts.tt_jd(start_time.tt + minutes / (24 * 60))
-            geocentric = satellite.at(t)
-            subpoint = geocentric.subpoint()
-            altitudes.append(subpoint.elevation.km)
-        
-        time_hours = [i/6 for i in range(len(altitudes))]  # Cada 10 min = 1/6 hora
-        plt.plot(time_hours, altitudes, 'r-', linewidth=2)
-        plt.xlabel('Tiempo (horas)')
-        plt.ylabel('Altitud (km)')
-        plt.title('Variación de Altitud')
-        plt.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        
-        # Guardar el plot
-        filename = f"orbit_{satellite_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"📊 Gráfico guardado como: {filename}")
-        
-        plt.show()
-        return True
-    
-    def plot_3d_earth_with_satellites(self, satellite_names: List[str], hours: int = 24) -> bool:
-        """
-        Visualización 3D de la Tierra con trayectorias de satélites
-        
-        Args:
-            satellite_names: Lista de nombres de satélites a visualizar
-            hours: Horas de órbita a mostrar
-            
-        Returns:
-            bool: True si la visualización fue exitosa
-        """
-        if not satellite_names:
-            print("❌ No se proporcionaron nombres de satélites")
-            return False
-        
-        # Verificar que los satélites existen
-        valid_satellites = []
-        for name in satellite_names:
-            if name in self.satellites:
-                valid_satellites.append(name)
-            else:
-                print(f"⚠️  Satélite {name} no encontrado")
-        
-        if not valid_satellites:
-            print("❌ No se encontraron satélites válidos")
-            return False
-        
-        print(f"🌍 Generando visualización 3D para {len(valid_satellites)} satélite(s)...")
-        
-        # Crear figura de Plotly
-        fig = go.Figure()
-        
-        # Agregar la Tierra como una esfera
-        u = np.linspace(0, 2 * np.pi, 50)
-        v = np.linspace(0, np.pi, 50)
-        x_earth = 6371 * np.outer(np.cos(u), np.sin(v))  # Radio de la Tierra: 6371 km
-        y_earth = 6371 * np.outer(np.sin(u), np.sin(v))
-        z_earth = 6371 * np.outer(np.ones(np.size(u)), np.cos(v))
-        
-        fig.add_trace(go.Surface(
-            x=x_earth, y=y_earth, z=z_earth,
-            colorscale='Blues',
-            opacity=0.7,
-            name='Tierra',
-            showscale=False,
-            hovertemplate='Tierra<extra></extra>'
-        ))
-        
-        # Colores para diferentes satélites
-        colors = ['red', 'blue', 'green', 'orange', 'purple', 'yellow', 'pink', 'cyan']
-        
-        # Agregar trayectorias de satélites
-        for i, satellite_name in enumerate(valid_satellites):
-            satellite = self.satellites[satellite_name]['satellite']
-            color = colors[i % len(colors)]
-            
-            # Calcular posiciones del satélite
-            positions_3d = []
-            times = []
-            
-            start_time = self.ts.now()
-            for minutes in range(0, hours * 60, 15):  # Cada 15 minutos para mejor rendimiento
-                t = self.ts.tt_jd(start_time.tt + minutes / (24 * 60))
-                geocentric = satellite.at(t)
-                
-                # Convertir a coordenadas cartesianas (km)
-                position = geocentric.position.km
-                positions_3d.append(position)
-                times.append(t.utc_datetime())
-            
-            positions_3d = np.array(positions_3d)
-            
-            # Agregar trayectoria del satélite
-            fig.add_trace(go.Scatter3d(
-                x=positions_3d[:, 0],
-                y=positions_3d[:, 1], 
-                z=positions_3d[:, 2],
-                mode='lines+markers',
-                line=dict(color=color, width=4),
-                marker=dict(size=3, color=color),
-                name=f'{satellite_name}',
-                hovertemplate=f'<b>{satellite_name}</b><br>' +
-                            'X: %{x:.1f} km<br>' +
-                            'Y: %{y:.1f} km<br>' +
-                            'Z: %{z:.1f} km<extra></extra>'
-            ))
-            
-            # Marcar posición inicial y final
-            fig.add_trace(go.Scatter3d(
-                x=[positions_3d[0, 0]],
-                y=[positions_3d[0, 1]],
-                z=[positions_3d[0, 2]],
-                mode='markers',
-                marker=dict(size=8, color='lightgreen', symbol='diamond'),
-                name=f'{satellite_name} - Inicio',
-                showlegend=False,
-                hovertemplate=f'<b>{satellite_name} - Inicio</b><br>' +
-                            'X: %{x:.1f} km<br>' +
-                            'Y: %{y:.1f} km<br>' +
-                            'Z: %{z:.1f} km<extra></extra>'
-            ))
-            
-            fig.add_trace(go.Scatter3d(
-                x=[positions_3d[-1, 0]],
-                y=[positions_3d[-1, 1]],
-                z=[positions_3d[-1, 2]],
-                mode='markers',
-                marker=dict(size=8, color='darkred', symbol='cross'),
-                name=f'{satellite_name} - Final',
-                showlegend=False,
-                hovertemplate=f'<b>{satellite_name} - Final</b><br>' +
-                            'X: %{x:.1f} km<br>' +
-                            'Y: %{y:.1f} km<br>' +
-                            'Z: %{z:.1f} km<extra></extra>'
-            ))
-        
-        # Configurar el layout
-        fig.update_layout(
-            title=f'🛰️ Visualización 3D: Satélites alrededor de la Tierra<br>' +
-                  f'<sub>Trayectorias de {hours} horas - {len(valid_satellites)} satélite(s)</sub>',
-            scene=dict(
-                xaxis_title='X (km)',
-                yaxis_title='Y (km)',
-                zaxis_title='Z (km)',
-                aspectmode='cube',
-                camera=dict(
-                    eye=dict(x=2, y=2, z=2)
-                ),
-                bgcolor='black'
-            ),
-            font=dict(size=12),
-            width=1000,
-            height=800,
-            margin=dict(l=0, r=0, t=50, b=0)
-        )
-        
-        # Mostrar la visualización
-        fig.show()
-        
-        # Guardar como HTML interactivo
-        filename = f"satellite_3d_visualization_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        fig.write_html(filename)
-        print(f"🌍 Visualización 3D guardada como: {filename}")
-        
-        return True
-    
-    def comprehensive_collision_analysis(self, satellite1_name: str, satellite2_name: str = None,
-                                       threshold_km: float = 10.0, days_ahead: int = 7) -> Dict:
-        """
-        Análisis completo de colisión incluyendo cálculo de tiempo de maniobra
-        
-        Args:
-            satellite1_name: Primer satélite a analizar
-            satellite2_name: Segundo satélite (si None, analiza contra muestra)
-            threshold_km: Distancia mínima para considerar riesgo (km)
-            days_ahead: Días a analizar hacia el futuro
-            
-        Returns:
-            Dict: Análisis completo de colisión y tiempo de maniobra
-        """
-        print(f"🔍 Iniciando análisis completo de colisión para {satellite1_name}...")
-        
-        # Realizar análisis de colisión básico
-        collision_analysis = self.analyze_collision_risk(
-            satellite1_name, satellite2_name, threshold_km, days_ahead
-        )
-        
-        if 'error' in collision_analysis:
-            return collision_analysis
-        
-        # Si hay encuentros cercanos, calcular parámetros de maniobra
-        maneuver_analyses = []
-        
-        if collision_analysis['close_encounters']:
-            print(f"⚠️  {len(collision_analysis['close_encounters'])} encuentros cercanos detectados")
-            
-            for encounter in collision_analysis['close_encounters'][:5]:  # Analizar los primeros 5
-                # Calcular velocidad relativa estimada para el encuentro
-                sat1_pos = np.array(encounter['satellite1_pos'])
-                sat2_pos = np.array(encounter['satellite2_pos'])
-                distance_km = encounter['distance_km']
-                
-                # Estimar velocidad relativa basada en la órbita LEO típica
-                # Para satélites LEO: velocidad orbital ~7.8 km/s
-                orbital_velocity = 7800  # m/s
-                
-                # Estimar velocidad relativa basada en el tipo de encuentro
-                if distance_km < 1:
-                    # Encuentro muy cercano, probablemente frontal
-                    v_rel_estimate = orbital_velocity * 1.8  # ~14,000 m/s
-                elif distance_km < 5:
-                    # Encuentro cercano, ángulo moderado  
-                    v_rel_estimate = orbital_velocity * 1.2  # ~9,400 m/s
-                else:
-                    # Encuentro lejano, paralelo
-                    v_rel_estimate = orbital_velocity * 0.2  # ~1,560 m/s
-                
-                # Parámetros típicos para análisis
-                params_scenarios = [
-                    {
-                        'nombre': 'Conservador',
-                        'R_req': 1000,  # 1 km de seguridad
-                        'sigma_0': 200,  # 200 m de incertidumbre
-                        'k': 0.002,     # Crecimiento moderado
-                        'n': 3          # 3 sigma
-                    },
-                    {
-                        'nombre': 'Estándar',
-                        'R_req': 500,   # 500 m de seguridad
-                        'sigma_0': 100,  # 100 m de incertidumbre
-                        'k': 0.001,     # Crecimiento normal
-                        'n': 2.5        # 2.5 sigma
-                    },
-                    {
-                        'nombre': 'Agresivo',
-                        'R_req': 200,   # 200 m de seguridad
-                        'sigma_0': 50,   # 50 m de incertidumbre
-                        'k': 0.0005,    # Bajo crecimiento
-                        'n': 2          # 2 sigma
-                    }
-                ]
-                
-                encounter_maneuvers = []
-                
-                for scenario in params_scenarios:
-                    maneuver_calc = self.calculate_maneuver_time(
-                        v_rel=v_rel_estimate,
-                        R_req=scenario['R_req'],
-                        sigma_0=scenario['sigma_0'],
-                        k=scenario['k'],
-                        n=scenario['n']
-                    )
-                    
-                    if 'error' not in maneuver_calc:
-                        encounter_maneuvers.append({
-                            'escenario': scenario['nombre'],
-                            'parametros': scenario,
-                            'tiempo_maniobra': maneuver_calc['tiempo_maniobra'],
-                            'criticidad': maneuver_calc['evaluacion']['criticidad'],
-                            'recomendacion': maneuver_calc['evaluacion']['recomendacion']
-                        })
-                
-                maneuver_analyses.append({
-                    'encuentro': {
-                        'fecha': encounter['datetime'].strftime('%Y-%m-%d %H:%M:%S UTC'),
-                        'satelite_2': encounter['satellite2'],
-                        'distancia_km': distance_km,
-                        'velocidad_relativa_estimada': v_rel_estimate
-                    },
-                    'analisis_maniobra': encounter_maneuvers
-                })
-        
-        # Generar recomendaciones generales
-        recomendaciones_generales = self._generate_general_recommendations(
-            collision_analysis, maneuver_analyses
-        )
-        
-        # Calcular tiempo hasta primer encuentro
-        tiempo_primer_encuentro = None
-        if collision_analysis['close_encounters']:
-            primer_encuentro = min(collision_analysis['close_encounters'], 
-                                 key=lambda x: x['datetime'])
-            tiempo_primer_encuentro = {
-                'fecha': primer_encuentro['datetime'],
-                'horas_restantes': (primer_encuentro['datetime'] - datetime.now()).total_seconds() / 3600,
-                'distancia_km': primer_encuentro['distance_km']
-            }
-        
-        return {
-            'analisis_colision': collision_analysis,
-            'analisis_maniobras': maneuver_analyses,
-            'tiempo_primer_encuentro': tiempo_primer_encuentro,
-            'recomendaciones_generales': recomendaciones_generales,
-            'resumen_ejecutivo': self._generate_executive_summary(
-                collision_analysis, maneuver_analyses, tiempo_primer_encuentro
-            )
-        }
-    
-    def _generate_general_recommendations(self, collision_analysis: Dict, 
-                                        maneuver_analyses: List[Dict]) -> List[str]:
-        """Generar recomendaciones generales basadas en el análisis"""
-        recommendations = []
-        
-        risk_level = collision_analysis.get('risk_level', 'BAJO')
-        total_encounters = collision_analysis.get('total_encounters', 0)
-        
-        if risk_level == 'CRÍTICO':
-            recommendations.extend([
-                "🚨 ALERTA CRÍTICA: Implementar protocolo de emergencia inmediatamente",
-                "📡 Establecer comunicación continua con centros de control",
-                "⚡ Preparar maniobra de emergencia automática",
-                "🎯 Considerar múltiples opciones de maniobra"
-            ])
-        elif risk_level == 'ALTO':
-            recommendations.extend([
-                "⚠️ RIESGO ALTO: Planificar maniobra en las próximas 24 horas",
-                "📊 Refinar datos orbitales con tracking adicional",
-                "🤝 Coordinar con otros operadores si es necesario",
-                "📋 Preparar plan de contingencia"
-            ])
-        elif risk_level == 'MEDIO':
-            recommendations.extend([
-                "🟡 RIESGO MEDIO: Monitoreo incrementado requerido",
-                "📈 Análisis detallado de conjunción",
-                "🔍 Evaluación de opciones de maniobra",
-                "📅 Planificación preventiva"
-            ])
-        
-        if total_encounters > 3:
-            recommendations.append(f"📊 Múltiples encuentros ({total_encounters}) - considerar cambio orbital mayor")
-        
-        if maneuver_analyses:
-            min_time = min([
-                min([m['tiempo_maniobra']['horas'] for m in analysis['analisis_maniobra']])
-                for analysis in maneuver_analyses if analysis['analisis_maniobra']
-            ], default=float('inf'))
-            
-            if min_time < 1:
-                recommendations.append("⏰ Tiempo de maniobra < 1 hora - Acción inmediata requerida")
-            elif min_time < 6:
-                recommendations.append("⏰ Tiempo de maniobra < 6 horas - Preparación urgente")
-        
-        return recommendations
-    
-    def _generate_executive_summary(self, collision_analysis: Dict, 
-                                  maneuver_analyses: List[Dict], 
-                                  primer_encuentro: Dict) -> Dict:
-        """Generar resumen ejecutivo del análisis"""
-        
-        summary = {
-            'satelite': collision_analysis.get('satellite', 'Desconocido'),
-            'nivel_riesgo': collision_analysis.get('risk_level', 'BAJO'),
-            'total_encuentros': collision_analysis.get('total_encounters', 0),
-            'periodo_analisis_dias': collision_analysis.get('analysis_period_days', 0)
-        }
-        
-        if primer_encuentro:
-            summary['primer_encuentro'] = {
-                'tiempo_horas': primer_encuentro['horas_restantes'],
-                'distancia_km': primer_encuentro['distancia_km'],
-                'fecha': primer_encuentro['fecha'].strftime('%Y-%m-%d %H:%M UTC')
-            }
-        
-        if maneuver_analyses:
-            # Tiempo mínimo de maniobra entre todos los escenarios
-            tiempos_maniobra = []
-            for analysis in maneuver_analyses:
-                for maneuver in analysis['analisis_maniobra']:
-                    tiempos_maniobra.append(maneuver['tiempo_maniobra']['horas'])
-            
-            if tiempos_maniobra:
-                summary['tiempo_maniobra'] = {
-                    'minimo_horas': min(tiempos_maniobra),
-                    'maximo_horas': max(tiempos_maniobra),
-                    'promedio_horas': sum(tiempos_maniobra) / len(tiempos_maniobra)
-                }
-        
-        # Determinar acción recomendada
-        if summary['nivel_riesgo'] == 'CRÍTICO':
-            summary['accion_recomendada'] = "MANIOBRA INMEDIATA"
-        elif summary['nivel_riesgo'] == 'ALTO':
-            summary['accion_recomendada'] = "PREPARAR MANIOBRA URGENTE"
-        elif summary['nivel_riesgo'] == 'MEDIO':
-            summary['accion_recomendada'] = "MONITOREO INCREMENTADO"
-        else:
-            summary['accion_recomendada'] = "SEGUIMIENTO RUTINARIO"
-        
-        return summary
-    
-    def find_collision_cases(self, threshold_km: float = 50.0, days_ahead: int = 7, 
-                           max_satellites: int = 500) -> List[Dict]:
-        """
-        Buscar casos reales de colisión entre satélites
-        Función específica para encontrar encuentros cercanos reales
-        
-        Args:
-            threshold_km: Distancia máxima para considerar encuentro cercano
-            days_ahead: Días a analizar
-            max_satellites: Máximo número de satélites a analizar
-            
-        Returns:
-            List[Dict]: Lista de casos de colisión encontrados
-        """
-        print(f"🔍 BÚSQUEDA EXHAUSTIVA DE CASOS DE COLISIÓN")
-        print(f"📊 Analizando hasta {max_satellites} satélites...")
-        print(f"📏 Umbral: {threshold_km} km | 📅 Período: {days_ahead} días")
-        print("-" * 60)
-        
-        collision_cases = []
-        satellites_list = list(self.satellites.keys())
-        
-        # Analizar una muestra más grande de satélites
-        sample_size = min(max_satellites, len(satellites_list))
-        sample_satellites = satellites_list[:sample_size]
-        
-        analyzed_pairs = set()  # Evitar analizar el mismo par dos veces
-        
-        for i, sat1_name in enumerate(sample_satellites):
-            if i % 50 == 0:  # Mostrar progreso cada 50 satélites
-                progress = (i / sample_size) * 100
-                print(f"📈 Progreso: {progress:.1f}% ({i}/{sample_size}) - Casos encontrados: {len(collision_cases)}")
-            
-            try:
-                sat1 = self.satellites[sat1_name]['satellite']
-                
-                # Analizar contra una submuestra de otros satélites
-                for j, sat2_name in enumerate(sample_satellites[i+1:i+51], i+1):  # Siguientes 50
-                    if j >= len(sample_satellites):
-                        break
-                        
-                    pair = tuple(sorted([sat1_name, sat2_name]))
-                    if pair in analyzed_pairs:
-                        continue
-                    analyzed_pairs.add(pair)
-                    
-                    try:
-                        sat2 = self.satellites[sat2_name]['satellite']
-                        
-                        # Verificar encuentros cada 2 horas para mayor precisión
-                        for hours in range(0, days_ahead * 24, 2):
-                            t = self.ts.tt_jd(self.ts.now().tt + hours / 24)
-                            
-                            pos1 = sat1.at(t)
-                            pos2 = sat2.at(t)
-                            
-                            # Calcular distancia
-                            distance_km = np.linalg.norm(
-                                np.array(pos1.position.km) - np.array(pos2.position.km)
-                            )
-                            
-                            if distance_km < threshold_km:
-                                # ¡Encontramos un caso de colisión!
-                                collision_cases.append({
-                                    'satellite1': sat1_name,
-                                    'satellite2': sat2_name,
-                                    'datetime': t.utc_datetime(),
-                                    'distance_km': distance_km,
-                                    'hours_from_now': hours,
-                                    'satellite1_pos': pos1.position.km,
-                                    'satellite2_pos': pos2.position.km,
-                                    'relative_velocity_estimated': self._estimate_relative_velocity(
-                                        pos1.position.km, pos2.position.km, distance_km
-                                    )
-                                })
-                                
-                                print(f"🚨 CASO ENCONTRADO: {sat1_name} vs {sat2_name}")
-                                print(f"   📅 {t.utc_datetime().strftime('%Y-%m-%d %H:%M')} UTC")
-                                print(f"   📏 Distancia: {distance_km:.2f} km")
-                                
-                                # Si encontramos varios casos, no necesitamos más
-                                if len(collision_cases) >= 5:
-                                    print(f"✅ Suficientes casos encontrados. Deteniendo búsqueda.")
-                                    return collision_cases
-                                    
-                    except Exception as e:
-                        continue  # Continuar con el siguiente satélite
-                        
-            except Exception as e:
-                continue  # Continuar con el siguiente satélite principal
-        
-        print(f"✅ Búsqueda completada. Casos encontrados: {len(collision_cases)}")
-        return collision_cases
-    
-    def _estimate_relative_velocity(self, pos1: np.ndarray, pos2: np.ndarray, 
-                                  distance_km: float) -> float:
-        """Estimar velocidad relativa basada en posiciones y distancia"""
-        # Velocidad orbital típica en LEO
-        orbital_speed = 7800  # m/s
-        
-        # Estimar basado en la distancia del encuentro
-        if distance_km < 5:
-            return orbital_speed * 1.8  # Encuentro frontal probable
-        elif distance_km < 20:
-            return orbital_speed * 1.2  # Encuentro angular
-        else:
-            return orbital_speed * 0.5  # Encuentro lateral
-    
-    def demonstrate_collision_case(self) -> None:
-        """
-        Demostrar un caso de colisión encontrado con análisis completo
-        """
-        print("🔍 DEMOSTRACIÓN DE CASO DE COLISIÓN REAL")
-        print("=" * 60)
-        
-        # Buscar casos de colisión
-        cases = self.find_collision_cases(threshold_km=100, days_ahead=3, max_satellites=200)
-        
-        if not cases:
-            print("❌ No se encontraron casos de colisión en la muestra analizada")
-            print("💡 Esto puede ocurrir porque:")
-            print("   • Los satélites están bien separados")
-            print("   • La muestra analizada es pequeña")
-            print("   • Los umbrales son muy estrictos")
-            print("\n🎭 Generando caso simulado para demostración...")
-            
-            # Crear un caso simulado basado en datos reales
-            self._create_simulated_case()
-            return
-        
-        # Analizar el primer caso encontrado
-        case = cases[0]
-        print(f"\n🚨 CASO DE COLISIÓN DETECTADO:")
-        print(f"🛰️  Satélite 1: {case['satellite1']}")
-        print(f"🛰️  Satélite 2: {case['satellite2']}")
-        print(f"📅 Fecha/Hora: {case['datetime'].strftime('%Y-%m-%d %H:%M')} UTC")
-        print(f"📏 Distancia: {case['distance_km']:.2f} km")
-        print(f"⏰ En: {case['hours_from_now']} horas")
-        
-        # Calcular tiempo de maniobra para este caso
-        v_rel = case['relative_velocity_estimated']
-        print(f"\n⚡ ANÁLISIS DE TIEMPO DE MANIOBRA:")
-        print(f"🚀 Velocidad relativa estimada: {v_rel:.0f} m/s")
-        
-        # Varios escenarios de maniobra
-        scenarios = [
-            {'name': 'Conservador', 'R_req': 2000, 'sigma_0': 200, 'k': 0.002, 'n': 3},
-            {'name': 'Estándar', 'R_req': 1000, 'sigma_0': 100, 'k': 0.001, 'n': 2.5},
-            {'name': 'Agresivo', 'R_req': 500, 'sigma_0': 50, 'k': 0.0008, 'n': 2}
-        ]
-        
-        print(f"\n📊 ESCENARIOS DE MANIOBRA:")
-        for scenario in scenarios:
-            result = self.calculate_maneuver_time(
-                v_rel=v_rel,
-                R_req=scenario['R_req'],
-                sigma_0=scenario['sigma_0'],
-                k=scenario['k'],
-                n=scenario['n']
-            )
-            
-            if 'error' not in result:
-                tiempo = result['tiempo_maniobra']
-                print(f"   • {scenario['name']}: {tiempo['horas']:.2f} horas")
-                print(f"     {result['evaluacion']['criticidad']}")
-            else:
-                print(f"   • {scenario['name']}: {result['error']}")
-        
-        # Mostrar todos los casos encontrados
-        if len(cases) > 1:
-            print(f"\n📋 OTROS CASOS DETECTADOS:")
-            for i, other_case in enumerate(cases[1:], 2):
-                print(f"   {i}. {other_case['satellite1']} vs {other_case['satellite2']}")
-                print(f"      📅 {other_case['datetime'].strftime('%Y-%m-%d %H:%M')} UTC")
-                print(f"      📏 {other_case['distance_km']:.2f} km")
-    
-    def _create_simulated_case(self) -> None:
-        """Crear un caso simulado basado en satélites reales"""
-        print("🎭 CASO SIMULADO DE DEMOSTRACIÓN:")
-        print("=" * 50)
-        
-        # Usar satélites reales para crear escenario creíble
-        satellite_names = list(self.satellites.keys())
-        sat1 = satellite_names[10] if len(satellite_names) > 10 else satellite_names[0]
-        sat2 = satellite_names[50] if len(satellite_names) > 50 else satellite_names[1]
-        
-        import datetime
-        future_time = datetime.datetime.now() + datetime.timedelta(hours=28, minutes=45)
-        
-        print(f"🛰️  Satélite 1: {sat1}")
-        print(f"🛰️  Satélite 2: {sat2}")
-        print(f"📅 Encuentro proyectado: {future_time.strftime('%Y-%m-%d %H:%M')} UTC")
-        print(f"📏 Distancia mínima estimada: 15.3 km")
-        print(f"🚀 Velocidad relativa: 8,200 m/s")
-        print(f"⏰ Tiempo hasta encuentro: 28.75 horas")
-        
-        print(f"\n⚡ ANÁLISIS DE TIEMPO DE MANIOBRA:")
-        result = self.calculate_maneuver_time(
-            v_rel=8200,
-            R_req=1000,
-            sigma_0=120,
-            k=0.001,
-            n=3
-        )
-        
-        if 'error' not in result:
-            tiempo = result['tiempo_maniobra']
-            print(f"⏰ Tiempo de maniobra requerido: {tiempo['horas']:.2f} horas")
-            print(f"{result['evaluacion']['criticidad']}")
-            print(f"💡 {result['evaluacion']['recomendacion']}")
-            
-            print(f"\n📊 EVALUACIÓN:")
-            tiempo_disponible = 28.75
-            tiempo_requerido = tiempo['horas']
-            
-            if tiempo_disponible > tiempo_requerido:
-                margen = tiempo_disponible - tiempo_requerido
-                print(f"✅ MARGEN SEGURO: {margen:.1f} horas disponibles")
-                print(f"🎯 Ejecutar maniobra antes de: {(future_time - datetime.timedelta(hours=tiempo_requerido)).strftime('%Y-%m-%d %H:%M')} UTC")
-            else:
-                deficit = tiempo_requerido - tiempo_disponible
-                print(f"🚨 SITUACIÓN CRÍTICA: Déficit de {deficit:.1f} horas")
-                print(f"⚡ Maniobra inmediata requerida")
-        
-        print(f"\n💡 Este es un ejemplo de cómo el sistema detectaría y analizaría")
-        print(f"   un caso real de conjunción satelital.")
-
-
-# NUEVO MÓDULO PARA EL HACKATÓN - SISTEMA ISL CONTROL
-class ISLControlSystem:
-    """
-    Sistema de Control de Enlaces Inter-Satelitales (ISL) con conciencia de propulsión
-    
-    Este módulo simula la lógica que se ejecutaría en el chip IENAI para:
-    - Gestionar el tráfico de red satelital basado en riesgo de colisión
-    - Optimizar el enrutamiento considerando el estado del propulsor
-    - Tomar decisiones autónomas de maniobra y comunicación
-    """
-    
-    def __init__(self, analyzer: SatelliteAnalyzer):
-        self.analyzer = analyzer
-        self.network_nodes = []  # Lista de satélites en la red
-        self.current_routes = {}  # Rutas actuales de comunicación
-        
-    def determine_thrust_aware_routing(self, sat_local_name: str, sat_neighbor_name: str, 
-                                       collision_risk_data: Dict, propellant_level: float) -> Dict:
-        """
-        Simula la lógica de enrutamiento basada en el riesgo de colisión y el estado del propulsor IENAI.
-        ESTA FUNCIÓN SE EJECUTARÍA EN EL CHIP DEL IENAI.
-        
-        Args:
-            sat_local_name: Nombre del satélite local (este satélite)
-            sat_neighbor_name: Satélite vecino en la red
-            collision_risk_data: Datos de riesgo de colisión
-            propellant_level: Nivel de propelente (0.0 a 1.0)
-            
-        Returns:
-            Dict: Comandos y decisiones del sistema ISL
-        """
-        
-        # 1. Evaluar si se necesita una maniobra (usando la lógica existente)
-        risk_level = collision_risk_data.get('risk_level', 'BAJO')
-        close_encounters = collision_risk_data.get('close_encounters', [])
-        
-        # 2. Calcular parámetros de maniobra basados en el riesgo
-        maneuver_analysis = None
-        time_to_maneuver_hours = float('inf')
-        
-        if risk_level in ['ALTO', 'CRÍTICO'] and close_encounters:
-            # Obtener el encuentro más cercano
-            nearest_encounter = min(close_encounters, key=lambda x: x['distance_km'])
-            
-            # Estimar velocidad relativa basada en la distancia del encuentro
-            if nearest_encounter['distance_km'] < 5:
-                v_rel_estimate = 12000  # Encuentro frontal crítico
-            elif nearest_encounter['distance_km'] < 20:
-                v_rel_estimate = 8000   # Encuentro perpendicular
-            else:
-                v_rel_estimate = 3000   # Encuentro lateral
-            
-            # Calcular tiempo de maniobra requerido
-            maneuver_analysis = self.analyzer.calculate_maneuver_time(
-                v_rel=v_rel_estimate,
-                R_req=500.0,     # 500m de seguridad para satélites comerciales
-                sigma_0=100.0,   # 100m de incertidumbre estándar
-                k=0.001,         # Crecimiento normal de incertidumbre
-                n=3.0            # 3 sigma de confianza
-            )
-            
-            if 'error' not in maneuver_analysis:
-                time_to_maneuver_hours = maneuver_analysis['tiempo_maniobra']['horas']
-        
-        # 3. LÓGICA DE DECISIÓN ISL (El corazón del proyecto)
-        decision_result = self._make_isl_decision(
-            sat_local_name, sat_neighbor_name, risk_level, 
-            time_to_maneuver_hours, propellant_level, maneuver_analysis
-        )
-        
-        return decision_result
-    
-    def _make_isl_decision(self, sat_local: str, sat_neighbor: str, risk_level: str,
-                          time_hours: float, propellant: float, maneuver_data: Dict) -> Dict:
-        """
-        Núcleo de la lógica de decisión ISL
-        """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Clasificar urgencia temporal
-        if time_hours < 1:
-            urgency = "CRÍTICO_INMEDIATO"
-        elif time_hours < 6:
-            urgency = "CRÍTICO_CORTO_PLAZO"
-        elif time_hours < 24:
-            urgency = "MODERADO"
-        else:
-            urgency = "BAJO"
-        
-        # DECISION TREE PRINCIPAL
-        if urgency in ["CRÍTICO_INMEDIATO", "CRÍTICO_CORTO_PLAZO"]:
-            if propellant > 0.15:  # Suficiente combustible (>15%)
-                command = "THRUST_IMMINENT"
-                action = f"Preparando maniobra de evasión. Desviando tráfico crítico al satélite {sat_neighbor}"
-                network_priority = "HIGH_REROUTE"
-                bandwidth_allocation = 0.2  # 20% del ancho de banda para coordinar maniobra
-                
-            elif propellant > 0.05:  # Combustible limitado (5-15%)
-                command = "THRUST_CONDITIONAL"
-                action = f"Maniobra condicional. Evaluando alternativas. Alertando a {sat_neighbor}"
-                network_priority = "MEDIUM_REROUTE"
-                bandwidth_allocation = 0.1  # 10% para coordinación
-                
-            else:  # Combustible insuficiente (<5%)
-                command = "THRUST_IMPOSSIBLE"
-                action = f"Combustible insuficiente. Emitiendo alerta de posición. Transferencia total a {sat_neighbor}"
-                network_priority = "EMERGENCY_REROUTE"
-                bandwidth_allocation = 0.05  # 5% mínimo para alertas
-                
-        elif urgency == "MODERADO":
-            if propellant > 0.25:  # Buen nivel de combustible
-                command = "THRUST_PLANNED"
-                action = f"Maniobra planificada. Coordinando con {sat_neighbor} para redistribución de tráfico"
-                network_priority = "PLANNED_REROUTE"
-                bandwidth_allocation = 0.8  # 80% operación normal
-                
-            else:
-                command = "THRUST_PRESERVE"
-                action = f"Conservando combustible. Solicitando soporte de red a {sat_neighbor}"
-                network_priority = "FUEL_CONSERVATION"
-                bandwidth_allocation = 0.6  # 60% operación reducida
-                
-        else:  # BAJO riesgo
-            command = "ROUTE_NORMAL"
-            action = "Operación normal. Sin amenaza inmediata de colisión"
-            network_priority = "NORMAL"
-            bandwidth_allocation = 1.0  # 100% operación normal
-        
-        # Generar protocolo de comunicación ISL
-        isl_protocol = self._generate_isl_protocol(
-            command, sat_local, sat_neighbor, urgency, propellant
-        )
-        
-        return {
-            'timestamp': timestamp,
-            'command': command,
-            'action': action,
-            'urgency_level': urgency,
-            'risk_assessment': risk_level,
-            'propellant_status': f"{propellant*100:.1f}%",
-            'time_to_maneuver_hours': time_hours,
-            'network_priority': network_priority,
-            'bandwidth_allocation': bandwidth_allocation,
-            'target_satellite': sat_neighbor,
-            'isl_protocol': isl_protocol,
-            'maneuver_data': maneuver_data,
-            'autonomous_decision': True,
-            'chip_location': 'IENAI_PROCESSOR'
-        }
-    
-    def _generate_isl_protocol(self, command: str, sat_local: str, sat_neighbor: str,
-                              urgency: str, propellant: float) -> Dict:
-        """
-        Generar protocolo de comunicación entre satélites
-        """
-        protocol = {
-            'message_type': 'ISL_COORDINATION',
-            'source': sat_local,
-            'destination': sat_neighbor,
-            'priority': 'HIGH' if urgency.startswith('CRÍTICO') else 'MEDIUM',
-            'encryption': 'AES256_QUANTUM_SAFE',
-            'compression': 'SATELLITE_OPTIMIZED'
-        }
-        
-        if command == "THRUST_IMMINENT":
-            protocol['payload'] = {
-                'alert_type': 'IMMINENT_MANEUVER',
-                'maneuver_window': '< 1 hour',
-                'requested_action': 'TAKE_TRAFFIC_LOAD',
-                'backup_required': True,
-                'telemetry_sharing': True
-            }
-        elif command == "THRUST_IMPOSSIBLE":
-            protocol['payload'] = {
-                'alert_type': 'PROPULSION_FAILURE',
-                'maneuver_capability': False,
-                'requested_action': 'EMERGENCY_BACKUP',
-                'position_alert': True,
-                'ground_notification': True
-            }
-        elif command == "ROUTE_NORMAL":
-            protocol['payload'] = {
-                'alert_type': 'STATUS_NORMAL',
-                'maneuver_capability': True,
-                'requested_action': 'MAINTAIN_NORMAL_OPS',
-                'health_check': True
-            }
-        else:
-            protocol['payload'] = {
-                'alert_type': 'CONDITIONAL_MANEUVER',
-                'maneuver_probability': f"{min(1.0, (1.0 - propellant) + 0.5):.2f}",
-                'requested_action': 'STANDBY_SUPPORT',
-                'monitoring_required': True
-            }
-        
-        return protocol
-    
-    def simulate_constellation_response(self, decision_result: Dict, 
-                                      constellation_size: int = 5) -> Dict:
-        """
-        Simular la respuesta de una constelación de satélites al comando ISL
-        """
-        constellation_response = {
-            'constellation_id': 'IENAI_NETWORK_ALPHA',
-            'total_satellites': constellation_size,
-            'responding_satellites': [],
-            'network_adaptation': {},
-            'collective_decision': None
-        }
-        
-        # Simular respuesta de otros satélites
-        for i in range(constellation_size):
-            sat_id = f"IENAI_SAT_{i+1:02d}"
-            if sat_id != decision_result.get('target_satellite', ''):
-                
-                # Simular capacidad de cada satélite
-                sat_capacity = np.random.uniform(0.6, 1.0)  # 60-100% capacidad
-                sat_fuel = np.random.uniform(0.1, 0.9)      # 10-90% combustible
-                
-                response = {
-                    'satellite_id': sat_id,
-                    'available_capacity': f"{sat_capacity*100:.1f}%",
-                    'fuel_level': f"{sat_fuel*100:.1f}%",
-                    'can_assist': sat_capacity > 0.3,
-                    'priority_level': 'HIGH' if sat_capacity > 0.7 else 'MEDIUM'
-                }
-                
-                constellation_response['responding_satellites'].append(response)
-        
-        # Calcular adaptación de red
-        total_capacity = sum([float(sat['available_capacity'].rstrip('%'))/100 
-                            for sat in constellation_response['responding_satellites']])
-        
-        constellation_response['network_adaptation'] = {
-            'total_available_capacity': f"{total_capacity*100:.1f}%",
-            'load_distribution': 'AUTOMATIC',
-            'failover_ready': total_capacity > 1.5,
-            'latency_impact': 'MINIMAL' if total_capacity > 2.0 else 'MODERATE'
-        }
-        
-        # Decisión colectiva de la constelación
-        if decision_result['urgency_level'].startswith('CRÍTICO'):
-            constellation_response['collective_decision'] = 'EMERGENCY_PROTOCOL_ACTIVATED'
-        elif total_capacity > 1.8:
-            constellation_response['collective_decision'] = 'FULL_SUPPORT_GRANTED'
-        else:
-            constellation_response['collective_decision'] = 'LIMITED_SUPPORT_AVAILABLE'
-        
-        return constellation_response
-
-
-class HackathonDemo:
-    """
-    Clase para demostrar el sistema ISL en el hackathon
-    """
-    
-    def __init__(self, analyzer: SatelliteAnalyzer):
-        self.analyzer = analyzer
-        self.isl_system = ISLControlSystem(analyzer)
-        
-    def run_complete_demo(self):
-        """
-        Ejecutar demostración completa del sistema ISL para el hackathon
-        """
-        print("🚀 DEMOSTRACIÓN COMPLETA DEL SISTEMA ISL-IENAI")
-        print("=" * 70)
-        print("🎯 Sistema de Control de Enlaces Inter-Satelitales con Conciencia de Propulsión")
-        print("💡 Simulando operación autónoma en chip IENAI")
-        print("-" * 70)
-        
-        # Escenarios de prueba
-        scenarios = [
-            {
-                'name': '🔴 ESCENARIO CRÍTICO: Encuentro Frontal Inminente',
-                'risk_data': {
-                    'risk_level': 'CRÍTICO',
-                    'close_encounters': [{'distance_km': 2.5, 'datetime': datetime.now()}]
-                },
-                'propellant': 0.85,  # 85% combustible
-                'description': 'Satélite con buen combustible detecta colisión inminente'
-            },
-            {
-                'name': '🟠 ESCENARIO CRÍTICO: Combustible Bajo',
-                'risk_data': {
-                    'risk_level': 'ALTO',
-                    'close_encounters': [{'distance_km': 8.3, 'datetime': datetime.now()}]
-                },
-                'propellant': 0.03,  # 3% combustible
-                'description': 'Satélite con combustible crítico detecta amenaza'
-            },
-            {
-                'name': '🟡 ESCENARIO MODERADO: Encuentro Planificado',
-                'risk_data': {
-                    'risk_level': 'MEDIO',
-                    'close_encounters': [{'distance_km': 25.7, 'datetime': datetime.now()}]
-                },
-                'propellant': 0.60,  # 60% combustible
-                'description': 'Encuentro detectado con tiempo para planificar'
-            },
-            {
-                'name': '🟢 ESCENARIO NORMAL: Operación Rutinaria',
-                'risk_data': {
-                    'risk_level': 'BAJO',
-                    'close_encounters': []
-                },
-                'propellant': 0.75,  # 75% combustible
-                'description': 'Operación normal sin amenazas detectadas'
-            }
-        ]
-        
-        for i, scenario in enumerate(scenarios, 1):
-            print(f"\n{i}. {scenario['name']}")
-            print(f"   📝 {scenario['description']}")
-            print(f"   ⛽ Combustible: {scenario['propellant']*100:.1f}%")
-            
-            # Ejecutar análisis ISL
-            decision = self.isl_system.determine_thrust_aware_routing(
-                sat_local_name="IENAI_SAT_01",
-                sat_neighbor_name="IENAI_SAT_02", 
-                collision_risk_data=scenario['risk_data'],
-                propellant_level=scenario['propellant']
-            )
-            
-            # Mostrar resultados
-            print(f"   🤖 DECISIÓN AUTÓNOMA: {decision['command']}")
-            print(f"   ⚡ Acción: {decision['action']}")
-            print(f"   📡 Prioridad de red: {decision['network_priority']}")
-            print(f"   📊 Ancho de banda: {decision['bandwidth_allocation']*100:.0f}%")
-            
-            if decision['time_to_maneuver_hours'] < float('inf'):
-                print(f"   ⏰ Tiempo para maniobra: {decision['time_to_maneuver_hours']:.2f} horas")
-            
-            # Simular respuesta de constelación
-            constellation_response = self.isl_system.simulate_constellation_response(decision)
-            print(f"   🛰️  Respuesta de constelación: {constellation_response['collective_decision']}")
-            print(f"   🌐 Capacidad disponible: {constellation_response['network_adaptation']['total_available_capacity']}")
-            
-            print("   " + "-" * 50)
-        
-        print(f"\n✅ DEMOSTRACIÓN COMPLETADA")
-        print(f"🎯 El sistema ISL-IENAI está listo para:")
-        print(f"   • Detección autónoma de riesgos de colisión")
-        print(f"   • Toma de decisiones basada en estado de propulsión")
-        print(f"   • Gestión inteligente de red satelital")
-        print(f"   • Coordinación de constelación en tiempo real")
-        print(f"   • Operación completamente autónoma en el espacio")
-    
-    
-    def plot_orbital_animation(self, satellite_name: str, hours: int = 24, frames: int = 100) -> bool:
-        """
-        Crear una animación de la órbita del satélite alrededor de la Tierra
-        
-        Args:
-            satellite_name: Nombre del satélite
-            hours: Horas de órbita a animar
-            frames: Número de frames en la animación
-            
-        Returns:
-            bool: True si la animación fue exitosa
-        """
-        try:
-            if satellite_name not in self.satellites:
-                print(f"❌ Satélite {satellite_name} no encontrado")
-                return False
-            
-            satellite = self.satellites[satellite_name]['satellite']
-            print(f"🎬 Generando animación orbital para {satellite_name}...")
-            print(f"⏱️  Calculando {frames} posiciones para {hours} horas...")
-            
-            # Calcular todas las posiciones
-            all_positions = []
-            start_time = self.ts.now()
-            
-            for frame in range(frames + 1):
-                minutes = (hours * 60 * frame) / frames
-                t = self.ts.tt_jd(start_time.tt + minutes / (24 * 60))
-                geocentric = satellite.at(t)
-                position = geocentric.position.km
-                all_positions.append(position)
-            
-            all_positions = np.array(all_positions)
-            print(f"✅ Posiciones calculadas")
-            
-            # Crear la animación
-            fig = go.Figure()
-            
-            # Agregar la Tierra con un colorscale más simple
-            u = np.linspace(0, 2 * np.pi, 30)
-            v = np.linspace(0, np.pi, 30)
-            x_earth = 6371 * np.outer(np.cos(u), np.sin(v))
-            y_earth = 6371 * np.outer(np.sin(u), np.sin(v))
-            z_earth = 6371 * np.outer(np.ones(np.size(u)), np.cos(v))
-            
-            fig.add_trace(go.Surface(
-                x=x_earth, y=y_earth, z=z_earth,
-                colorscale='Blues',  # Cambié de 'Earth' a 'Blues' para mayor compatibilidad
-                opacity=0.8,
-                name='Tierra',
-                showscale=False,
-                hovertemplate='Tierra<extra></extra>'
-            ))
-            
-            print(f"🌍 Tierra agregada a la visualización")
-            
-            # Crear frames para la animación (reducir cantidad para mejor rendimiento)
-            frames_list = []
-            step = max(1, frames // 20)  # Máximo 20 frames para mejor rendimiento
-            
-            for i in range(0, frames + 1, step):
-                if i >= len(all_positions):
-                    break
-                    
-                frame_data = [
-                    go.Surface(
-                        x=x_earth, y=y_earth, z=z_earth,
-                        colorscale='Blues',
-                        opacity=0.8,
-                        showscale=False,
-                        hovertemplate='Tierra<extra></extra>'
-                    ),
-                    go.Scatter3d(
-                        x=all_positions[:i+1, 0],
-                        y=all_positions[:i+1, 1],
-                        z=all_positions[:i+1, 2],
-                        mode='lines',
-                        line=dict(color='red', width=6),
-                        name='Trayectoria',
-                        hovertemplate='Trayectoria<extra></extra>'
-                    ),
-                    go.Scatter3d(
-                        x=[all_positions[i, 0]],
-                        y=[all_positions[i, 1]],
-                        z=[all_positions[i, 2]],
-                        mode='markers',
-                        marker=dict(size=12, color='yellow', symbol='circle'),
-                        name='Satélite',
-                        hovertemplate=f'{satellite_name}<br>X: %{{x:.1f}} km<br>Y: %{{y:.1f}} km<br>Z: %{{z:.1f}} km<extra></extra>'
-                    )
-                ]
-                frames_list.append(go.Frame(data=frame_data, name=str(i)))
-            
-            fig.frames = frames_list
-            print(f"🎞️  {len(frames_list)} frames de animación creados")
-            
-            # Configurar la animación con controles mejorados
-            fig.update_layout(
-                title=f'🎬 Animación Orbital: {satellite_name}<br><sub>Período: {hours} horas | Frames: {len(frames_list)}</sub>',
-                scene=dict(
-                    xaxis_title='X (km)',
-                    yaxis_title='Y (km)', 
-                    zaxis_title='Z (km)',
-                    aspectmode='cube',
-                    camera=dict(eye=dict(x=2.5, y=2.5, z=2.5)),
-                    bgcolor='black'
-                ),
-                font=dict(size=12),
-                width=1000,
-                height=700,
-                updatemenus=[{
-                    'type': 'buttons',
-                    'showactive': False,
-                    'x': 0.1,
-                    'y': 0.02,
-                    'buttons': [
-                        {
-                            'label': '▶️ Reproducir',
-                            'method': 'animate',
-                            'args': [None, {
-                                'frame': {'duration': 200, 'redraw': True},
-                                'fromcurrent': True,
-                                'transition': {'duration': 100}
-                            }]
-                        },
-                        {
-                            'label': '⏸️ Pausar',
-                            'method': 'animate',
-                            'args': [[None], {
-                                'frame': {'duration': 0, 'redraw': False},
-                                'mode': 'immediate',
-                                'transition': {'duration': 0}
-                            }]
-                        },
-                        {
-                            'label': '🔄 Reiniciar',
-                            'method': 'animate',
-                            'args': [None, {
-                                'frame': {'duration': 200, 'redraw': True},
-                                'mode': 'immediate',
-                                'transition': {'duration': 0}
-                            }]
-                        }
-                    ]
-                }],
-                sliders=[{
-                    'active': 0,
-                    'yanchor': 'top',
-                    'xanchor': 'left',
-                    'currentvalue': {
-                        'font': {'size': 20},
-                        'prefix': 'Frame:',
-                        'visible': True,
-                        'xanchor': 'right'
-                    },
-                    'transition': {'duration': 100, 'easing': 'cubic-in-out'},
-                    'pad': {'b': 10, 't': 50},
-                    'len': 0.9,
-                    'x': 0.1,
-                    'y': 0,
-                    'steps': [
-                        {
-                            'args': [[f.name], {
-                                'frame': {'duration': 100, 'redraw': True},
-                                'mode': 'immediate',
-                                'transition': {'duration': 100}
-                            }],
-                            'label': f.name,
-                            'method': 'animate'
-                        } for f in frames_list
-                    ]
-                }]
-            )
-            
-            print(f"🎨 Configuración de animación completada")
-            
-            # Mostrar la visualización
-            print(f"🌐 Abriendo animación en el navegador...")
-            fig.show()
-            
-            # Guardar como HTML
-            safe_name = satellite_name.replace(' ', '_').replace('(', '').replace(')', '')
-            filename = f"animacion_orbital_{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-            fig.write_html(filename)
-            print(f"💾 Animación guardada como: {filename}")
-            print(f"📁 Ubicación: {os.path.abspath(filename)}")
-            
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error creando animación: {str(e)}")
-            print(f"💡 Sugerencias:")
-            print(f"   1. Verifica que el nombre del satélite sea correcto")
-            print(f"   2. Intenta con menos frames (ej: 20-30)")
-            print(f"   3. Reduce las horas (ej: 2-6 horas)")
-            return False
-
-
-def mostrar_menu():
-    """Mostrar el menú de opciones"""
-    print("\n" + "=" * 60)
-    print("🎯 OPCIONES DISPONIBLES:")
-    print("   1. Buscar satélite (búsqueda inteligente)")
-    print("   2. Ver satélites populares por categoría")
-    print("   3. Información detallada de un satélite")
-    print("   4. Calcular órbitas futuras")
-    print("   5. Análizar riesgo de colisión")
-    print("   6. Visualizar órbita (2D)")
-    print("   7. Visualización 3D (Tierra + Satélites)")
-    print("   8. Animación orbital 3D")
-    print("   9. Exportar lista completa de satélites")
-    print("  10. Cálculo de tiempo de maniobra de evasión")
-    print("  11. Análisis completo de colisión + maniobra")
-    print("  12. 🔍 BUSCAR CASOS REALES DE COLISIÓN")
-    print("  13. 🚀 DEMO SISTEMA ISL-IENAI (HACKATHON)")
-    print("  14. 🤖 Simulador ISL Individual")
-    print("  15. 🧪 ANÁLISIS AVANZADO DE COLISIÓN (J2 + Probabilidad)")
-    print("  16. Salir")
-    print("=" * 60)
-
-
-def main():
-    """Función principal del programa"""
-    print("=" * 60)
-    print("🛰️  SISTEMA DE ANÁLISIS DE SATÉLITES")
-    print("    NASA Space App Challenge 2025 - Malkie Space")
-    print("=" * 60)
-    
-    # Inicializar el analizador
-    analyzer = SatelliteAnalyzer()
-    
-    # Descargar datos de satélites
-    if not analyzer.download_tle_data():
-        print("❌ Error al descargar datos. Terminando programa.")
-        return
-    
-    print("\n� ¡Sistema cargado exitosamente!")
-    
-    # El menú se mostrará automáticamente en cada iteración del bucle
-    
-    while True:
-        try:
-            # Mostrar menú en cada iteración
-            mostrar_menu()
-            print("\n" + "-" * 40)
-            option = input("Selecciona una opción (1-15): ").strip()
-            
-            if option == '1':
-                # Búsqueda inteligente de satélite
-                search_term = input("🔍 Ingresa el nombre del satélite a buscar: ").strip()
-                if search_term:
-                    results = analyzer.smart_search(search_term)
-                    
-                    if results['total_found'] > 0:
-                        print(f"\n✅ Encontrados {results['total_found']} satélites:")
-                        
-                        # Mostrar coincidencias exactas primero
-                        if results['exact_matches']:
-                            print("\n🎯 COINCIDENCIAS EXACTAS:")
-                            for i, name in enumerate(results['exact_matches'], 1):
-                                print(f"   {i}. {name}")
-                        
-                        # Mostrar coincidencias parciales por categoría
-                        if results['category_matches']:
-                            print("\n📊 RESULTADOS POR CATEGORÍA:")
-                            for category, satellites in results['category_matches'].items():
-                                print(f"\n   📂 {category.capitalize()}:")
-                                for i, name in enumerate(satellites[:5], 1):  # Máximo 5 por categoría
-                                    print(f"      {i}. {name}")
-                                if len(satellites) > 5:
-                                    print(f"      ... y {len(satellites) - 5} más en esta categoría")
-                        
-                        # Mostrar sugerencias si hay pocas coincidencias
-                        if results['suggestions'] and results['total_found'] < 5:
-                            print(f"\n💡 SUGERENCIAS RELACIONADAS:")
-                            for i, suggestion in enumerate(results['suggestions'][:8], 1):
-                                print(f"   {i}. {suggestion}")
-                    else:
-                        print("❌ No se encontraron satélites con ese nombre")
-                        
-                        # Mostrar ejemplos populares
-                        print("\n🌟 ¿Quizás buscabas alguno de estos satélites populares?")
-                        analyzer.show_satellite_examples()
-                        
-            elif option == '2':
-                # Ver satélites populares por categoría
-                print("🌟 Satélites populares por categoría:")
-                popular = analyzer.get_popular_satellites()
-                for category, satellites in popular.items():
-                    print(f"\n📂 {category.upper()}:")
-                    for i, name in enumerate(satellites, 1):
-                        print(f"   {i}. {name}")
-                        
-            elif option == '3':
-                # Información detallada de un satélite
-                sat_name = input("📋 Nombre del satélite: ").strip()
-                if sat_name:
-                    info = analyzer.get_satellite_info(sat_name)
-                    if 'error' not in info:
-                        print(f"\n🛰️  INFORMACIÓN DETALLADA: {sat_name}")
-                        print("=" * 50)
-                        print(f"📅 Fecha de los datos: {info['current_time']}")
-                        print(f"📍 Posición actual:")
-                        print(f"   • Latitud: {info['position']['latitude']:.3f}°")
-                        print(f"   • Longitud: {info['position']['longitude']:.3f}°")
-                        print(f"   • Altitud: {info['position']['altitude']:.1f} km")
-                        print(f"📊 Parámetros orbitales:")
-                        print(f"   • Inclinación: {info['orbital_elements'].get('inclination', 'N/A')}")
-                        print(f"   • Excentricidad: {info['orbital_elements'].get('eccentricity', 'N/A')}")
-                        print(f"   • Período: {info['orbital_elements'].get('period_minutes', 'N/A')} min")
-                    else:
-                        print(f"❌ {info['error']}")
-                        
-            elif option == '4':
-                # Calcular órbitas futuras
-                sat_name = input("🚀 Nombre del satélite: ").strip()
-                if sat_name:
-                    try:
-                        days = int(input("📅 Días a calcular (default 7): ") or "7")
-                        days = min(days, 180)  # Limitar a máximo 180 días
-                        print(f"⏳ Calculando posiciones futuras para {days} días...")
-                        positions = analyzer.calculate_future_positions(sat_name, days)
-                        
-                        if positions:
-                            print(f"\n🛰️  PREDICCIONES ORBITALES: {sat_name}")
-                            print("=" * 60)
-                            for pos in positions[:20]:  # Mostrar primeros 20
-                                print(f"📅 {pos['datetime'].strftime('%Y-%m-%d %H:%M')} UTC")
-                                print(f"   Lat: {pos['latitude']:7.3f}°  Lon: {pos['longitude']:8.3f}°  Alt: {pos['altitude_km']:7.1f} km")
-                            
-                            if len(positions) > 20:
-                                print(f"   ... y {len(positions) - 20} predicciones más")
-                                
-                            # Mostrar estadísticas
-                            altitudes = [pos['altitude_km'] for pos in positions]
-                            print(f"\n📈 ESTADÍSTICAS:")
-                            print(f"   • Altitud mínima: {min(altitudes):.1f} km")
-                            print(f"   • Altitud máxima: {max(altitudes):.1f} km")
-                            print(f"   • Altitud promedio: {sum(altitudes)/len(altitudes):.1f} km")
-                        else:
-                            print("❌ No se pudieron calcular las posiciones")
-                            print("💡 Sugerencias:")
-                            print("   • Verifica que el nombre del satélite sea exacto")
-                            print("   • Usa la opción 1 para buscar satélites disponibles")
-                            print("   • Intenta con nombres populares como: ISS (ZARYA), STARLINK-1007")
-                    except ValueError:
-                        print("❌ Número de días inválido. Debe ser un número entero.")
-                        
-            elif option == '5':
-                # Analizar riesgo de colisión
-                sat_name = input("⚠️  Satélite principal: ").strip()
-                if sat_name:
-                    sat2_name = input("🎯 Segundo satélite (Enter para analizar contra todos): ").strip() or None
-                    try:
-                        threshold = float(input("📏 Distancia mínima en km (default 10): ") or "10")
-                        days = int(input("📅 Días a analizar (4): ") or "4")
-                        
-                        print("⏳ Analizando riesgo de colisión...")
-                        risk_analysis = analyzer.analyze_collision_risk(sat_name, sat2_name, threshold, days)
-                        
-                        if 'error' not in risk_analysis:
-                            print(f"\n⚠️  ANÁLISIS DE RIESGO DE COLISIÓN")
-                            print("=" * 50)
-                            print(f"🛰️  Satélite: {risk_analysis['satellite']}")
-                            print(f"📊 Nivel de riesgo: {risk_analysis['risk_level']}")
-                            print(f"📈 Encuentros cercanos: {risk_analysis['total_encounters']}")
-                            print(f"📅 Período analizado: {risk_analysis['analysis_period_days']} días")
-                            print(f"📏 Umbral: {risk_analysis['threshold_km']} km")
-                            
-                            if risk_analysis['close_encounters']:
-                                print(f"\n🚨 ENCUENTROS CERCANOS DETECTADOS:")
-                                for enc in risk_analysis['close_encounters'][:10]:  # Primeros 10
-                                    print(f"  • {enc['datetime'].strftime('%Y-%m-%d %H:%M')} UTC")
-                                    print(f"    Con: {enc['satellite2']}")
-                                    print(f"    Distancia: {enc['distance_km']:.2f} km")
-                            else:
-                                print("✅ No se detectaron encuentros cercanos")
-                        else:
-                            print(f"❌ {risk_analysis['error']}")
-                    except ValueError:
-                        print("❌ Valores inválidos")
-                        
-            elif option == '6':
-                # Visualizar órbita 2D
-                sat_name = input("📈 Nombre del satélite: ").strip()
-                if sat_name:
-                    try:
-                        hours = int(input("⏰ Horas de órbita a mostrar (default 24): ") or "24")
-                        print("⏳ Generando visualización 2D...")
-                        analyzer.plot_orbit(sat_name, hours)
-                    except ValueError:
-                        print("❌ Número de horas inválido")
-                        
-            elif option == '7':
-                # Visualización 3D de la Tierra con satélites
-                print("🌍 Visualización 3D de satélites alrededor de la Tierra")
-                satellites_input = input("🛰️  Nombres de satélites (separados por coma): ").strip()
-                if satellites_input:
-                    satellite_names = [name.strip() for name in satellites_input.split(',')]
-                    try:
-                        hours = int(input("⏰ Horas de trayectoria (default 12): ") or "12")
-                        print("⏳ Generando visualización 3D...")
-                        analyzer.plot_3d_earth_with_satellites(satellite_names, hours)
-                    except ValueError:
-                        print("❌ Número de horas inválido")
-                        
-            elif option == '8':
-                # Animación orbital 3D
-                sat_name = input("🎬 Nombre del satélite para animar: ").strip()
-                if sat_name:
-                    try:
-                        hours = int(input("⏰ Horas de órbita a animar (default 6): ") or "6")
-                        frames = int(input("🎞️  Número de frames (default 50): ") or "50")
-                        print("⏳ Generando animación 3D...")
-                        analyzer.plot_orbital_animation(sat_name, hours, frames)
-                    except ValueError:
-                        print("❌ Valores inválidos")
-                        
-            elif option == '9':
-                # Exportar lista completa de satélites
-                filename = input("📁 Nombre del archivo (default: satelites_disponibles.txt): ").strip() or "satelites_disponibles.txt"
-                print("⏳ Exportando lista de satélites...")
-                if analyzer.export_satellites_list(filename):
-                    print(f"✅ Lista exportada exitosamente a: {filename}")
-                else:
-                    print("❌ Error al exportar la lista")
-                    
-            elif option == '10':
-                # Cálculo de tiempo de maniobra de evasión
-                print("⏰ CÁLCULO DE TIEMPO DE MANIOBRA DE EVASIÓN")
-                print("=" * 50)
-                try:
-                    v_rel = float(input("🚀 Velocidad relativa (m/s) [100-14000]: "))
-                    R_req = float(input("📏 Distancia de seguridad (m) [default 1000]: ") or "1000")
-                    sigma_0 = float(input("📊 Incertidumbre posicional (m) [default 100]: ") or "100")
-                    k = float(input("📈 Tasa crecimiento incertidumbre (m/s) [default 0.001]: ") or "0.001")
-                    n = float(input("🎯 Factor de confianza (sigma) [default 3]: ") or "3")
-                    
-                    result = analyzer.calculate_maneuver_time(v_rel, R_req, sigma_0, k, n)
-                    
-                    if 'error' not in result:
-                        print(f"\n⏰ RESULTADO DEL ANÁLISIS DE MANIOBRA")
-                        print("=" * 50)
-                        print(f"⚡ Tiempo de maniobra requerido:")
-                        print(f"   • {result['tiempo_maniobra']['segundos']:.1f} segundos")
-                        print(f"   • {result['tiempo_maniobra']['minutos']:.1f} minutos")
-                        print(f"   • {result['tiempo_maniobra']['horas']:.2f} horas")
-                        print(f"   • {result['tiempo_maniobra']['dias']:.3f} días")
-                        
-                        print(f"\n{result['evaluacion']['criticidad']}")
-                        print(f"💡 {result['evaluacion']['recomendacion']}")
-                        
-                        print(f"\n🎯 Contexto del encuentro:")
-                        print(f"   • {result['interpretacion']['contexto_leo']['tipo_encuentro']}")
-                        print(f"   • {result['interpretacion']['contexto_leo']['descripcion']}")
-                        
-                        print(f"\n📋 Recomendaciones operacionales:")
-                        for rec in result['interpretacion']['recomendaciones_operacionales']:
-                            print(f"   {rec}")
-                            
-                        if result['escenarios_alternativos']:
-                            print(f"\n📊 Escenarios alternativos:")
-                            for escenario in result['escenarios_alternativos']:
-                                print(f"   • {escenario['nombre']}: {escenario['tiempo_horas']:.2f} horas")
-                    else:
-                        print(f"❌ {result['error']}")
-                        if 'recommendation' in result:
-                            print(f"💡 {result['recommendation']}")
-                            
-                except ValueError:
-                    print("❌ Valores inválidos. Asegúrate de ingresar números válidos.")
-                    
-            elif option == '11':
-                # Análisis completo de colisión + maniobra
-                print("🔍 ANÁLISIS COMPLETO: COLISIÓN + MANIOBRA")
-                print("=" * 50)
-                sat_name = input("🛰️  Nombre del satélite principal: ").strip()
-                if sat_name:
-                    sat2_name = input("🎯 Segundo satélite (Enter para analizar muestra): ").strip() or None
-                    try:
-                        threshold = float(input("📏 Distancia mínima en km (default 10): ") or "10")
-                        days = int(input("📅 Días a analizar (default 7): ") or "7")
-                        
-                        print("⏳ Realizando análisis completo...")
-                        comprehensive = analyzer.comprehensive_collision_analysis(
-                            sat_name, sat2_name, threshold, days
-                        )
-                        
-                        if 'error' not in comprehensive:
-                            # Mostrar resumen ejecutivo
-                            summary = comprehensive['resumen_ejecutivo']
-                            print(f"\n📊 RESUMEN EJECUTIVO")
-                            print("=" * 40)
-                            print(f"🛰️  Satélite: {summary['satelite']}")
-                            print(f"⚠️  Nivel de riesgo: {summary['nivel_riesgo']}")
-                            print(f"📈 Total encuentros: {summary['total_encuentros']}")
-                            print(f"🎯 Acción recomendada: {summary['accion_recomendada']}")
-                            
-                            if summary.get('primer_encuentro'):
-                                pe = summary['primer_encuentro']
-                                print(f"\n⏰ PRIMER ENCUENTRO:")
-                                print(f"   • Fecha: {pe['fecha']}")
-                                print(f"   • En: {pe['tiempo_horas']:.1f} horas")
-                                print(f"   • Distancia: {pe['distancia_km']:.2f} km")
-                            
-                            if summary.get('tiempo_maniobra'):
-                                tm = summary['tiempo_maniobra']
-                                print(f"\n⚡ TIEMPO DE MANIOBRA:")
-                                print(f"   • Mínimo: {tm['minimo_horas']:.2f} horas")
-                                print(f"   • Máximo: {tm['maximo_horas']:.2f} horas")
-                                print(f"   • Promedio: {tm['promedio_horas']:.2f} horas")
-                            
-                            # Mostrar recomendaciones generales
-                            if comprehensive['recomendaciones_generales']:
-                                print(f"\n💡 RECOMENDACIONES GENERALES:")
-                                for rec in comprehensive['recomendaciones_generales']:
-                                    print(f"   {rec}")
-                            
-                            # Mostrar análisis detallado de maniobras si hay encuentros
-                            if comprehensive['analisis_maniobras']:
-                                print(f"\n📊 ANÁLISIS DETALLADO DE MANIOBRAS:")
-                                for i, analysis in enumerate(comprehensive['analisis_maniobras'][:3], 1):
-                                    encounter = analysis['encuentro']
-                                    print(f"\n   {i}. Encuentro: {encounter['fecha']}")
-                                    print(f"      Con: {encounter['satelite_2']}")
-                                    print(f"      Distancia: {encounter['distancia_km']:.2f} km")
-                                    print(f"      V_rel estimada: {encounter['velocidad_relativa_estimada']:.0f} m/s")
-                                    
-                                    for maneuver in analysis['analisis_maniobra']:
-                                        print(f"      • {maneuver['escenario']}: {maneuver['tiempo_maniobra']['horas']:.2f} horas")
-                                        print(f"        {maneuver['criticidad']}")
-                        else:
-                            print(f"❌ {comprehensive['error']}")
-                            
-                    except ValueError:
-                        print("❌ Valores inválidos")
-                        
-            elif option == '12':
-                # Buscar casos reales de colisión
-                print("🔍 BÚSQUEDA EXHAUSTIVA DE CASOS DE COLISIÓN")
-                print("=" * 50)
-                print("💡 Esta función buscará casos reales de encuentros cercanos")
-                print("   entre satélites en la base de datos actual.")
-                print()
-                
-                try:
-                    threshold = float(input("📏 Umbral de distancia en km (default 75): ") or "75")
-                    days = int(input("📅 Días a analizar (default 3): ") or "3")
-                    max_sats = int(input("🛰️  Máximo satélites a analizar (default 300): ") or "300")
-                    
-                    print("\n⏳ Iniciando búsqueda exhaustiva...")
-                    print("⚠️  Esta operación puede tomar varios minutos...")
-                    
-                    # Ejecutar búsqueda de casos de colisión
-                    analyzer.demonstrate_collision_case()
-                    
-                except ValueError:
-                    print("❌ Valores inválidos")
-                except KeyboardInterrupt:
-                    print("\n⏹️  Búsqueda cancelada por el usuario")
-                    
-            elif option == '13':
-                # Demo completo del sistema ISL-IENAI para hackathon
-                print("🚀 INICIANDO DEMOSTRACIÓN DEL SISTEMA ISL-IENAI")
-                print("=" * 60)
-                print("💡 Sistema de Control de Enlaces Inter-Satelitales")
-                print("🎯 Demostrando toma de decisiones autónomas en el espacio")
-                print()
-                
-                try:
-                    demo = HackathonDemo(analyzer)
-                    demo.run_complete_demo()
-                except Exception as e:
-                    print(f"❌ Error en demostración: {str(e)}")
-                    
-            elif option == '14':
-                # Simulador ISL individual
-                print("🤖 SIMULADOR ISL INDIVIDUAL")
-                print("=" * 50)
-                print("💡 Configura tu propio escenario de análisis ISL")
-                print()
-                
-                try:
-                    sat_local = input("🛰️  Satélite local (default: IENAI_SAT_01): ").strip() or "IENAI_SAT_01"
-                    sat_neighbor = input("📡 Satélite vecino (default: IENAI_SAT_02): ").strip() or "IENAI_SAT_02"
-                    
-                    print("\n🎯 Configurar escenario de riesgo:")
-                    print("   1. Riesgo CRÍTICO (encuentro < 5 km)")
-                    print("   2. Riesgo ALTO (encuentro 5-20 km)")
-                    print("   3. Riesgo MEDIO (encuentro 20-50 km)")
-                    print("   4. Riesgo BAJO (sin amenazas)")
-                    
-                    risk_choice = input("Selecciona nivel de riesgo (1-4): ").strip()
-                    propellant = float(input("⛽ Nivel de combustible (0.0-1.0): ") or "0.5")
-                    
-                    # Configurar datos de riesgo según la selección
-                    risk_configs = {
-                        '1': {'risk_level': 'CRÍTICO', 'close_encounters': [{'distance_km': 2.1, 'datetime': datetime.now()}]},
-                        '2': {'risk_level': 'ALTO', 'close_encounters': [{'distance_km': 12.5, 'datetime': datetime.now()}]},
-                        '3': {'risk_level': 'MEDIO', 'close_encounters': [{'distance_km': 35.0, 'datetime': datetime.now()}]},
-                        '4': {'risk_level': 'BAJO', 'close_encounters': []}
-                    }
-                    
-                    risk_data = risk_configs.get(risk_choice, risk_configs['4'])
-                    
-                    # Ejecutar análisis ISL
-                    isl_system = ISLControlSystem(analyzer)
-                    result = isl_system.determine_thrust_aware_routing(
-                        sat_local, sat_neighbor, risk_data, propellant
-                    )
-                    
-                    # Mostrar resultados detallados
-                    print(f"\n🤖 RESULTADO DEL ANÁLISIS ISL:")
-                    print("=" * 50)
-                    print(f"⏰ Timestamp: {result['timestamp']}")
-                    print(f"🚀 Comando: {result['command']}")
-                    print(f"⚡ Acción: {result['action']}")
-                    print(f"🎯 Urgencia: {result['urgency_level']}")
-                    print(f"📊 Riesgo: {result['risk_assessment']}")
-                    print(f"⛽ Combustible: {result['propellant_status']}")
-                    
-                    if result['time_to_maneuver_hours'] < float('inf'):
-                        print(f"⏰ Tiempo para maniobra: {result['time_to_maneuver_hours']:.3f} horas")
-                    
-                    print(f"📡 Prioridad de red: {result['network_priority']}")
-                    print(f"📶 Ancho de banda: {result['bandwidth_allocation']*100:.0f}%")
-                    print(f"🎯 Satélite objetivo: {result['target_satellite']}")
-                    print(f"🧠 Decisión autónoma: {result['autonomous_decision']}")
-                    print(f"💻 Ubicación: {result['chip_location']}")
-                    
-                    # Mostrar protocolo ISL
-                    protocol = result['isl_protocol']
-                    print(f"\n📡 PROTOCOLO ISL:")
-                    print(f"   • Tipo: {protocol['message_type']}")
-                    print(f"   • Prioridad: {protocol['priority']}")
-                    print(f"   • Encriptación: {protocol['encryption']}")
-                    print(f"   • Acción solicitada: {protocol['payload']['requested_action']}")
-                    
-                    # Simular respuesta de constelación
-                    constellation = isl_system.simulate_constellation_response(result)
-                    print(f"\n🌐 RESPUESTA DE CONSTELACIÓN:")
-                    print(f"   • Decisión colectiva: {constellation['collective_decision']}")
-                    print(f"   • Capacidad total: {constellation['network_adaptation']['total_available_capacity']}")
-                    print(f"   • Satélites respondiendo: {len(constellation['responding_satellites'])}")
-                    print(f"   • Failover listo: {constellation['network_adaptation']['failover_ready']}")
-                    
-                except ValueError:
-                    print("❌ Valores inválidos")
-                except Exception as e:
-                    print(f"❌ Error en simulación: {str(e)}")
-                        
-            elif option == '15':
-                # ANÁLISIS AVANZADO DE COLISIÓN
-                print("🧪 ANÁLISIS AVANZADO DE COLISIÓN")
-                print("=" * 50)
-                print("Incluye:")
-                print("  • Perturbaciones J2 (achatamiento terrestre)")
-                print("  • Arrastre atmosférico")
-                print("  • Elipsoides de incertidumbre")
-                print("  • Probabilidad estadística real")
-                print("  • Propagación de incertidumbre no-lineal")
-                
-                sat_name = input("\n🛰️ Nombre del satélite principal: ").strip()
-                if not sat_name:
-                    print("❌ Nombre de satélite requerido")
-                    continue
-                
-                sat2_name = input("🛰️ Nombre del segundo satélite (Enter para análisis múltiple): ").strip()
-                if not sat2_name:
-                    sat2_name = None
-                
-                try:
-                    threshold = float(input("📏 Distancia umbral en km (por defecto 10): ") or "10")
-                    days = int(input("📅 Días a analizar (por defecto 3): ") or "3")
-                    
-                    print(f"\n🔬 Iniciando análisis avanzado...")
-                    print("⚠️ Esto puede tomar varios minutos debido a los cálculos complejos...")
-                    
-                    result = analyzer.advanced_collision_analysis(
-                        sat_name, sat2_name, threshold, days
-                    )
-                    
-                    if 'error' in result:
-                        print(f"❌ {result['error']}")
-                    else:
-                        print(f"\n🎯 ANÁLISIS AVANZADO COMPLETADO")
-                        print("=" * 50)
-                        print(f"🛰️ Satélite: {result['satellite']}")
-                        print(f"🔬 Tipo de análisis: {result['analysis_type']}")
-                        print(f"🎯 Nivel de riesgo global: {result['global_risk_level']}")
-                        print(f"📊 Probabilidad máxima de colisión: {result['max_collision_probability']:.2e}")
-                        print(f"📏 Distancia mínima: {result['min_distance_km']:.3f} km")
-                        print(f"🔍 Encuentros detectados: {result['total_encounters']}")
-                        print(f"🛰️ Satélites analizados: {result['satellites_analyzed']}")
-                        
-                        print(f"\n✅ Características avanzadas aplicadas:")
-                        for perturbation in result['perturbations_included']:
-                            print(f"   • {perturbation}")
-                        print(f"   • Modelado de incertidumbre: {'✅' if result['uncertainty_modeling'] else '❌'}")
-                        print(f"   • Análisis estadístico: {'✅' if result['statistical_analysis'] else '❌'}")
-                        
-                        if result['most_critical_encounter']:
-                            critical = result['most_critical_encounter']
-                            print(f"\n🚨 ENCUENTRO MÁS CRÍTICO:")
-                            print(f"   📅 Fecha: {critical['datetime']}")
-                            print(f"   🛰️ Satélite: {critical['satellite2']}")
-                            print(f"   📊 Probabilidad: {critical['collision_probability']:.2e}")
-                            print(f"   📏 Distancia: {critical['distance_km']:.3f} km")
-                            print(f"   ⚠️ Nivel de riesgo: {critical['risk_level']}")
-                            print(f"   📊 Incertidumbre posicional: {critical['position_uncertainty_km']:.3f} km")
-                        
-                        if result['detailed_encounters']:
-                            print(f"\n📋 RESUMEN DE ENCUENTROS:")
-                            for i, enc in enumerate(result['detailed_encounters'][:5], 1):
-                                print(f"   {i}. {enc['satellite2']} - "
-                                      f"Prob: {enc['collision_probability']:.2e}, "
-                                      f"Dist: {enc['distance_km']:.3f} km, "
-                                      f"Riesgo: {enc['risk_level']}")
-                            
-                            if len(result['detailed_encounters']) > 5:
-                                print(f"   ... y {len(result['detailed_encounters']) - 5} encuentros más")
-                        
-                except ValueError:
-                    print("❌ Valores numéricos inválidos")
-                except Exception as e:
-                    print(f"❌ Error durante análisis: {str(e)}")
-                        
-            elif option == '16':
-                print("👋 ¡Gracias por usar el Sistema de Análisis de Satélites!")
-                break
-                        
-            elif option == '2':
-                # Ver satélites populares por categoría
-                print("🌟 SATÉLITES POPULARES POR CATEGORÍA")
-                print("=" * 50)
-                
-                popular = analyzer.get_popular_satellites()
-                
-                for category, satellites in popular.items():
-                    if satellites:
-                        print(f"\n📂 {category}:")
-                        for i, sat in enumerate(satellites, 1):
-                            print(f"   {i}. {sat}")
-                    else:
-                        print(f"\n📂 {category}: (No se encontraron en los datos actuales)")
-                
-                print(f"\n💡 TIP: Copia cualquier nombre exacto para usarlo en otras opciones")
-                
-            elif option == '3':
-                # Información detallada
-                sat_name = input("📡 Ingresa el nombre exacto del satélite: ").strip()
-                if not sat_name:
-                    print("❌ Nombre vacío")
-                elif sat_name not in analyzer.satellites:
-                    print(f"❌ Satélite '{sat_name}' no encontrado")
-                    # Ofrecer sugerencias
-                    suggestions = analyzer.suggest_satellites(sat_name)
-                    if suggestions:
-                        print(f"\n🔍 ¿Quisiste decir alguno de estos?")
-                        for i, suggestion in enumerate(suggestions[:5], 1):
-                            print(f"   {i}. {suggestion}")
-                else:
-                    info = analyzer.get_satellite_info(sat_name)
-                    if info:
-                        print(f"\n📊 INFORMACIÓN DE {info['name']}")
-                        print("-" * 50)
-                        print(f"Categoría: {info['category']}")
-                        print(f"Posición actual:")
-                        print(f"  • Latitud: {info['current_position']['latitude']:.4f}°")
-                        print(f"  • Longitud: {info['current_position']['longitude']:.4f}°")
-                        print(f"  • Altitud: {info['current_position']['altitude_km']:.2f} km")
-                        
-                        print(f"\nElementos orbitales:")
-                        oe = info['orbital_elements']
-                        print(f"  • Inclinación: {oe['inclination_deg']:.2f}°")
-                        print(f"  • Excentricidad: {oe['eccentricity']:.6f}")
-                        print(f"  • Período orbital: {oe['period_hours']:.2f} horas")
-                        print(f"  • Altitud aprox: {oe['approx_altitude_km']:.0f} km")
-                        print(f"  • Revoluciones/día: {oe['mean_motion_rev_per_day']:.6f}")
-                    else:
-                        print("❌ Satélite no encontrado")
-                        
-            elif option == '4':
-                # Calcular órbitas futuras
-                sat_name = input("🚀 Nombre del satélite: ").strip()
-                if sat_name:
-                    try:
-                        days = int(input("📅 Días hacia el futuro (máx 4): ") or "4")
-                        days = min(days, 180)
-                        
-                        print(f"⏳ Calculando posiciones futuras para {days} días...")
-                        positions = analyzer.calculate_future_positions(sat_name, days)
-                        
-                        if positions:
-                            print(f"\n✅ Calculadas {len(positions)} posiciones")
-                            print("Primeras 5 posiciones:")
-                            for i, pos in enumerate(positions[:5]):
-                                print(f"  {i+1}. {pos['datetime'].strftime('%Y-%m-%d %H:%M')} UTC")
-                                print(f"     Lat: {pos['latitude']:.3f}°, Lon: {pos['longitude']:.3f}°")
-                                print(f"     Alt: {pos['altitude_km']:.1f} km")
-                        else:
-                            print("❌ No se pudieron calcular las posiciones")
-                    except ValueError:
-                        print("❌ Número de días inválido")
-                        
-            elif option == '5':
-                # Análisis de riesgo de colisión
-                sat_name = input("⚠️  Nombre del satélite: ").strip()
-                if sat_name:
-                    try:
-                        days = int(input("📅 Días a analizar (máx 180): ") or "180")
-                        days = min(days, 180)
-                        threshold = float(input("🎯 Distancia umbral en km (default 10): ") or "10")
-                        
-                        print(f"⏳ Analizando riesgo de colisión...")
-                        risk_analysis = analyzer.analyze_collision_risk(sat_name, None, threshold, days)
-                        
-                        if 'error' not in risk_analysis:
-                            print(f"\n🎯 ANÁLISIS DE RIESGO DE COLISIÓN")
-                            print("-" * 50)
-                            print(f"Satélite: {risk_analysis['satellite']}")
-                            print(f"Período analizado: {risk_analysis['analysis_period_days']} días")
-                            print(f"Satélites analizados: {risk_analysis['satellites_analyzed']}")
-                            print(f"Umbral de distancia: {risk_analysis['threshold_km']} km")
-                            print(f"NIVEL DE RIESGO: {risk_analysis['risk_level']}")
-                            print(f"Encuentros cercanos: {risk_analysis['total_encounters']}")
-                            
-                            if risk_analysis['close_encounters']:
-                                print("\n⚠️  ENCUENTROS CERCANOS DETECTADOS:")
-                                for enc in risk_analysis['close_encounters'][:10]:  # Primeros 10
-                                    print(f"  • {enc['datetime'].strftime('%Y-%m-%d %H:%M')} UTC")
-                                    print(f"    Con: {enc['satellite2']}")
-                                    print(f"    Distancia: {enc['distance_km']:.2f} km")
-                            else:
-                                print("✅ No se detectaron encuentros cercanos")
-                        else:
-                            print(f"❌ {risk_analysis['error']}")
-                    except ValueError:
-                        print("❌ Valores inválidos")
-                        
-            elif option == '6':
-                # Visualizar órbita 2D
-                sat_name = input("📈 Nombre del satélite: ").strip()
-                if sat_name:
-                    try:
-                        hours = int(input("⏰ Horas de órbita a mostrar (default 24): ") or "24")
-                        print("⏳ Generando visualización 2D...")
-                        analyzer.plot_orbit(sat_name, hours)
-                    except ValueError:
-                        print("❌ Número de horas inválido")
-                        
-            elif option == '7':
-                # Visualización 3D de la Tierra con satélites
-                print("🌍 Visualización 3D de satélites alrededor de la Tierra")
-                satellites_input = input("�️  Nombres de satélites (separados por coma): ").strip()
-                if satellites_input:
-                    satellite_names = [name.strip() for name in satellites_input.split(',')]
-                    try:
-                        hours = int(input("⏰ Horas de trayectoria (default 12): ") or "12")
-                        print("⏳ Generando visualización 3D...")
-                        analyzer.plot_3d_earth_with_satellites(satellite_names, hours)
-                    except ValueError:
-                        print("❌ Número de horas inválido")
-                        
-            elif option == '8':
-                # Animación orbital 3D
-                sat_name = input("🎬 Nombre del satélite para animar: ").strip()
-                if sat_name:
-                    try:
-                        hours = int(input("⏰ Horas de órbita a animar (default 6): ") or "6")
-                        frames = int(input("🎞️  Número de frames (default 50): ") or "50")
-                        print("⏳ Generando animación 3D...")
-                        analyzer.plot_orbital_animation(sat_name, hours, frames)
-                    except ValueError:
-                        print("❌ Valores inválidos")
-                        
-            elif option == '8':
-                print("�👋 ¡Gracias por usar el Sistema de Análisis de Satélites!")
-                break
-                
-            else:
-                print("❌ Opción inválida. Selecciona 1-16.")
-                
-        except KeyboardInterrupt:
-            print("\n\n👋 Programa interrumpido por el usuario. ¡Hasta luego!")
-            break
-        except Exception as e:
-            print(f"❌ Error inesperado: {str(e)}")
-
-
-class RealisticOrbitPropagator:
-    """
-    Propagador orbital avanzado con perturbaciones físicas reales
-    Implementa: J2, arrastre atmosférico, presión de radiación solar
-    """
-    
-    def __init__(self):
-        self.earth_radius = 6378.137  # km
-        self.J2 = 1.08262668e-3      # Coeficiente J2 (achatamiento terrestre)
-        self.GM = 398600.4418        # km³/s² (constante gravitacional terrestre)
-        self.earth_rotation_rate = 7.2921159e-5  # rad/s
-        
-    def calculate_perturbations(self, satellite, t):
-        """
-        Calcular perturbaciones J2 (achatamiento terrestre)
-        La perturbación J2 es la más significativa para órbitas LEO
-        """
-        try:
-            # Obtener posición actual
-            position = satellite.position.km
-            r = np.linalg.norm(position)
-            
-            if r == 0:
-                return np.array([0, 0, 0])
-                
-            # Coordenadas normalizadas
-            x, y, z = position / r
-            
-            # Latitud geocéntrica
-            lat = np.arcsin(z)
-            
-            # Factor J2
-            factor = -1.5 * self.J2 * (self.earth_radius**2 / r**4) * self.GM
-            
-            # Componentes de aceleración J2
-            accel_x = factor * x * (1 - 5 * z**2)
-            accel_y = factor * y * (1 - 5 * z**2)
-            accel_z = factor * z * (3 - 5 * z**2)
-            
-            return np.array([accel_x, accel_y, accel_z])
-            
-        except Exception as e:
-            print(f"⚠️ Error calculando perturbaciones J2: {e}")
-            return np.array([0, 0, 0])
-    
-    def atmospheric_drag(self, satellite, t, solar_activity='moderate'):
-        """
-        Arrastre atmosférico (modelo MSIS-E00 simplificado)
-        Factores: densidad atmosférica, área/masa, coeficiente de arrastre
-        """
-        try:
-            position = satellite.position.km
-            r = np.linalg.norm(position)
-            altitude = r - self.earth_radius
-            
-            # Solo aplicar arrastre por debajo de 2000 km
-            if altitude > 2000:
-                return np.array([0, 0, 0])
-            
-            # Modelo de densidad atmosférica exponencial mejorado
-            if altitude > 1000:
-                # Exosfera
-                scale_height = 268
-                rho_0 = 3.019e-15  # kg/m³ a 1000 km
-            elif altitude > 500:
-                # Termosfera alta
-                scale_height = 60
-                rho_0 = 2.418e-11  # kg/m³ a 500 km
-            elif altitude > 200:
-                # Termosfera baja
-                scale_height = 37
-                rho_0 = 2.789e-11  # kg/m³ a 200 km
-            else:
-                # Mesosfera/Estratosfera
-                scale_height = 22
-                rho_0 = 3.899e-9   # kg/m³ a 200 km
-            
-            # Densidad con variación de actividad solar
-            solar_factors = {
-                'low': 0.7,
-                'moderate': 1.0,
-                'high': 1.5,
-                'extreme': 2.2
-            }
-            
-            solar_factor = solar_factors.get(solar_activity, 1.0)
-            
-            # Densidad atmosférica
-            rho = rho_0 * solar_factor * np.exp(-(altitude - 200) / scale_height)
-            
-            # Velocidad relativa (considerando rotación terrestre)
-            velocity = satellite.velocity.km_per_s
-            v_rel_mag = np.linalg.norm(velocity)
-            
-            if v_rel_mag == 0:
-                return np.array([0, 0, 0])
-            
-            # Parámetros típicos de satélites
-            drag_coefficient = 2.2  # Coeficiente de arrastre típico
-            area_to_mass = 0.01     # m²/kg (típico para satélites pequeños)
-            
-            # Aceleración por arrastre
-            drag_magnitude = -0.5 * rho * drag_coefficient * area_to_mass * v_rel_mag**2
-            drag_direction = velocity / v_rel_mag
-            
-            # Convertir a km/s²
-            drag_accel = drag_magnitude * drag_direction * 1e-3
-            
-            return drag_accel
-            
-        except Exception as e:
-            print(f"⚠️ Error calculando arrastre atmosférico: {e}")
-            return np.array([0, 0, 0])
-    
-    def solar_radiation_pressure(self, satellite, t):
-        """
-        Presión de radiación solar (significativa para satélites con grandes paneles)
-        """
-        try:
-            # Constante solar a 1 AU
-            solar_constant = 1361  # W/m²
-            c = 299792458  # m/s velocidad de la luz
-            
-            # Presión de radiación
-            radiation_pressure = solar_constant / c  # N/m²
-            
-            # Área efectiva (simplificado - depende de orientación)
-            effective_area = 10  # m² (estimación para satélite típico)
-            
-            # Factor de reflexión (0 = absorción total, 1 = reflexión total)
-            reflectance_factor = 0.6
-            
-            # Solo aplicar cuando el satélite está iluminado por el sol
-            # (simplificación: asumimos siempre iluminado)
-            
-            position = satellite.position.km
-            r = np.linalg.norm(position)
-            
-            if r == 0:
-                return np.array([0, 0, 0])
-            
-            # Dirección desde el centro de la Tierra hacia el satélite
-            direction = position / r
-            
-            # Masa típica del satélite (kg)
-            satellite_mass = 1000  # kg
-            
-            # Aceleración debida a presión de radiación (muy pequeña)
-            srp_magnitude = radiation_pressure * effective_area * (1 + reflectance_factor) / satellite_mass
-            
-            # Convertir a km/s²
-            srp_accel = srp_magnitude * direction * 1e-3
-            
-            return srp_accel
-            
-        except Exception as e:
-            print(f"⚠️ Error calculando presión de radiación solar: {e}")
-            return np.array([0, 0, 0])
-
-
-class AdvancedCollisionAnalyzer:
-    """
-    Analizador de colisiones avanzado con probabilidad estadística real
-    Implementa elipsoides de incertidumbre y análisis de covarianza
-    """
-    
-    def __init__(self):
-        self.min_distance_threshold = 5.0  # km
-        self.high_risk_threshold = 1.0     # km
-        
-    def calculate_collision_probability(self, sat1_data, sat2_data, time_window_hours=24):
-        """
-        Calcular probabilidad REAL de colisión usando:
-        - Elipsoides de incertidumbre
-        - Covarianza posicional
-        - Tamaños físicos de los satélites
-        """
-        try:
-            # Datos básicos de los satélites
-            pos1 = np.array(sat1_data['position'])
-            pos2 = np.array(sat2_data['position'])
-            vel1 = np.array(sat1_data['velocity'])
-            vel2 = np.array(sat2_data['velocity'])
-            
-            # Matrices de covarianza (6x6: posición + velocidad)
-            # En la realidad, estas vienen de análisis de tracking
-            covar1 = self._generate_covariance_matrix(sat1_data)
-            covar2 = self._generate_covariance_matrix(sat2_data)
-            
-            # Combinar matrices de covarianza
-            P = covar1 + covar2
-            
-            # Vector de estado relativo [Δx, Δy, Δz, Δvx, Δvy, Δvz]
-            relative_state = np.concatenate([pos1 - pos2, vel1 - vel2])
-            
-            # Extraer covarianza posicional (3x3)
-            P_pos = P[:3, :3]
-            
-            # Distancia de miss normalizada (distancia de Mahalanobis)
-            try:
-                P_pos_inv = np.linalg.inv(P_pos)
-                miss_distance_normalized = np.sqrt(
-                    relative_state[:3].T @ P_pos_inv @ relative_state[:3]
-                )
-            except np.linalg.LinAlgError:
-                # Si la matriz no es invertible, usar método simplificado
-                miss_distance_normalized = np.linalg.norm(relative_state[:3]) / np.sqrt(np.trace(P_pos))
-            
-            # Tamaños físicos combinados
-            radius1 = sat1_data.get('radius', 5.0)  # metros
-            radius2 = sat2_data.get('radius', 5.0)  # metros
-            combined_radius = (radius1 + radius2) / 1000  # convertir a km
-            
-            # Cálculo de probabilidad usando función de error complementaria
-            # Esta es una aproximación de la integral de probabilidad
-            sigma_miss = np.sqrt(np.trace(P_pos)) / 1000  # convertir a km
-            
-            if sigma_miss > 0:
-                # Probabilidad basada en distribución normal multivariada
-                if SCIPY_AVAILABLE:
-                    from scipy.special import erfc
-                    prob_collision = 0.5 * erfc(
-                        (miss_distance_normalized - combined_radius) / (sigma_miss * np.sqrt(2))
-                    )
-                else:
-                    # Fallback: aproximación usando función exponencial
-                    # No es tan precisa como erfc pero funciona sin SciPy
-                    normalized_distance = (miss_distance_normalized - combined_radius) / (sigma_miss * np.sqrt(2))
-                    # Aproximación: erfc(x) ≈ exp(-x²) para x > 0
-                    if normalized_distance > 0:
-                        prob_collision = 0.5 * np.exp(-normalized_distance**2)
-                    else:
-                        prob_collision = 0.5  # Caso crítico
-                
-                # Limitar probabilidad entre 0 y 1
-                prob_collision = max(0, min(1, prob_collision))
-            else:
-                # Fallback: análisis determinístico
-                actual_distance = np.linalg.norm(relative_state[:3])
-                prob_collision = 1.0 if actual_distance < combined_radius else 0.0
-            
-            return {
-                'probability': prob_collision,
-                'miss_distance_km': np.linalg.norm(relative_state[:3]),
-                'combined_radius_km': combined_radius,
-                'uncertainty_ellipsoid': self._calculate_uncertainty_ellipsoid(P_pos),
-                'risk_level': self._assess_risk_level(prob_collision, np.linalg.norm(relative_state[:3]))
-            }
-            
-        except Exception as e:
-            print(f"⚠️ Error calculando probabilidad de colisión: {e}")
-            return {
-                'probability': 0.0,
-                'miss_distance_km': float('inf'),
-                'error': str(e)
-            }
-    
-    def _generate_covariance_matrix(self, sat_data):
-        """
-        Generar matriz de covarianza 6x6 realista basada en el tipo de satélite
-        """
-        # Valores típicos de incertidumbre basados en capacidades de tracking
-        position_std = {
-            'LEO': [100, 50, 30],      # m [along-track, cross-track, radial]
-            'MEO': [200, 100, 60],     # m
-            'GEO': [500, 250, 150],    # m
-            'HEO': [1000, 500, 300]   # m
-        }
-        
-        velocity_std = {
-            'LEO': [0.1, 0.05, 0.03],   # m/s
-            'MEO': [0.2, 0.1, 0.06],    # m/s
-            'GEO': [0.5, 0.25, 0.15],   # m/s
-            'HEO': [1.0, 0.5, 0.3]      # m/s
-        }
-        
-        # Determinar tipo de órbita basado en altitud
-        altitude = sat_data.get('altitude', 500)
-        if altitude < 2000:
-            orbit_type = 'LEO'
-        elif altitude < 20000:
-            orbit_type = 'MEO'
-        elif altitude < 50000:
-            orbit_type = 'GEO'
-        else:
-            orbit_type = 'HEO'
-        
-        # Crear matriz de covarianza diagonal (simplificada)
-        pos_std = position_std[orbit_type]
-        vel_std = velocity_std[orbit_type]
-        
-        covariance = np.zeros((6, 6))
-        
-        # Covarianza posicional (convertir a km)
-        for i in range(3):
-            covariance[i, i] = (pos_std[i] / 1000) ** 2
-        
-        # Covarianza de velocidad (convertir a km/s)
-        for i in range(3):
-            covariance[i+3, i+3] = (vel_std[i] / 1000) ** 2
-        
-        # Agregar correlaciones cruzadas (simplificado)
-        # En realidad, estas correlaciones son complejas y dependen de la geometría orbital
-        correlation_factor = 0.1
-        for i in range(3):
-            covariance[i, i+3] = correlation_factor * np.sqrt(covariance[i, i] * covariance[i+3, i+3])
-            covariance[i+3, i] = covariance[i, i+3]
-        
-        return covariance
-    
-    def _calculate_uncertainty_ellipsoid(self, P_pos):
-        """
-        Calcular parámetros del elipsoide de incertidumbre 3D
-        """
-        try:
-            # Eigenvalores y eigenvectores de la matriz de covarianza
-            eigenvalues, eigenvectors = np.linalg.eigh(P_pos)
-            
-            # Semi-ejes del elipsoide (3-sigma)
-            semi_axes = 3 * np.sqrt(eigenvalues) * 1000  # convertir a metros
-            
-            return {
-                'semi_axes_m': semi_axes,
-                'orientation': eigenvectors,
-                'volume_km3': (4/3) * np.pi * np.prod(semi_axes) / 1e9
-            }
-        except:
-            return {'error': 'No se pudo calcular elipsoide de incertidumbre'}
-    
-    def _assess_risk_level(self, probability, distance_km):
-        """Evaluar nivel de riesgo basado en probabilidad y distancia"""
-        if probability > 1e-4 or distance_km < 1.0:
-            return 'CRÍTICO'
-        elif probability > 1e-6 or distance_km < 5.0:
-            return 'ALTO'
-        elif probability > 1e-8 or distance_km < 10.0:
-            return 'MODERADO'
-        else:
-            return 'BAJO'
-
-
-class UncertaintyModel:
-    """
-    Modelo avanzado de propagación de incertidumbre orbital
-    """
-    
-    def __init__(self):
-        self.base_uncertainty = {
-            'along_track': 100,    # m (dirección del movimiento)
-            'cross_track': 50,     # m (perpendicular al plano orbital)
-            'radial': 30,          # m (hacia el centro de la Tierra)
-        }
-        
-        # Tasas de crecimiento de incertidumbre (no lineales)
-        self.growth_rates = {
-            'along_track': 0.002,  # m/s (crece más rápido)
-            'cross_track': 0.001,  # m/s
-            'radial': 0.0005,      # m/s (crece más lento)
-        }
-        
-        # Factores de acoplamiento (perturbaciones aumentan incertidumbre)
-        self.coupling_factors = {
-            'J2_coupling': 1.2,
-            'drag_coupling': 1.5,
-            'solar_pressure_coupling': 1.1
-        }
-    
-    def propagate_uncertainty(self, time_hours, orbital_period_hours, perturbation_level='moderate'):
-        """
-        Propagar incertidumbre en el tiempo con modelo no-lineal
-        
-        En realidad esto requiere integrar las ecuaciones de Ricatti
-        junto con las ecuaciones de movimiento
-        """
-        try:
-            # Número de órbitas
-            n_orbits = time_hours / orbital_period_hours
-            
-            # Factor de crecimiento no-lineal
-            # La incertidumbre crece más rápido en órbitas excéntricas
-            nonlinear_factor = 1 + 0.1 * n_orbits  # crecimiento cuadrático simplificado
-            
-            # Factor de perturbación
-            perturbation_factors = {
-                'low': 1.0,
-                'moderate': 1.3,
-                'high': 1.8,
-                'extreme': 2.5
-            }
-            
-            pert_factor = perturbation_factors.get(perturbation_level, 1.3)
-            
-            # Matriz de covarianza propagada (6x6)
-            propagated_covariance = np.zeros((6, 6))
-            
-            # Incertidumbre posicional propagada
-            for i, direction in enumerate(['along_track', 'cross_track', 'radial']):
-                base_std = self.base_uncertainty[direction]
-                growth_rate = self.growth_rates[direction]
-                
-                # Crecimiento cuadrático con el tiempo
-                propagated_std = base_std + growth_rate * time_hours * 3600  # convertir a segundos
-                propagated_std *= nonlinear_factor * pert_factor
-                
-                # Convertir a km y elevar al cuadrado para varianza
-                propagated_covariance[i, i] = (propagated_std / 1000) ** 2
-            
-            # Incertidumbre de velocidad (derivada de la posicional)
-            for i in range(3):
-                # La incertidumbre de velocidad está relacionada con la posicional
-                # dividida por el período orbital
-                pos_std_km = np.sqrt(propagated_covariance[i, i])
-                vel_std_km_s = pos_std_km / (orbital_period_hours * 3600)
-                propagated_covariance[i+3, i+3] = vel_std_km_s ** 2
-            
-            # Correlaciones cruzadas (simplificadas)
-            correlation_strength = min(0.3, 0.1 * n_orbits)  # aumenta con el tiempo
-            
-            for i in range(3):
-                cross_correlation = correlation_strength * np.sqrt(
-                    propagated_covariance[i, i] * propagated_covariance[i+3, i+3]
-                )
-                propagated_covariance[i, i+3] = cross_correlation
-                propagated_covariance[i+3, i] = cross_correlation
-            
-            return {
-                'covariance_matrix': propagated_covariance,
-                'position_uncertainty_km': np.sqrt(np.diag(propagated_covariance[:3])),
-                'velocity_uncertainty_km_s': np.sqrt(np.diag(propagated_covariance[3:])),
-                'total_position_uncertainty_km': np.sqrt(np.trace(propagated_covariance[:3, :3])),
-                'propagation_time_hours': time_hours,
-                'orbits_completed': n_orbits
-            }
-            
-        except Exception as e:
-            print(f"⚠️ Error propagando incertidumbre: {e}")
-            return {'error': str(e)}
-    
-    def calculate_maneuver_uncertainty(self, delta_v_m_s, execution_accuracy=0.1):
-        """
-        Calcular incertidumbre introducida por maniobras de evasión
-        """
-        try:
-            # La ejecución de maniobras introduce incertidumbre adicional
-            # debido a errores en el control de propulsión
-            
-            maneuver_uncertainty = {
-                'delta_v_error': delta_v_m_s * execution_accuracy,  # error típico 10%
-                'pointing_error_deg': 0.5,  # error de apuntamiento
-                'timing_error_s': 1.0       # error de tiempo de ejecución
-            }
-            
-            # Convertir a incertidumbre posicional después de la maniobra
-            # (simplificación - en realidad requiere propagación completa)
-            
-            position_uncertainty_km = maneuver_uncertainty['delta_v_error'] * 0.1 / 1000  # regla empírica
-            
-            return {
-                'maneuver_uncertainty': maneuver_uncertainty,
-                'additional_position_uncertainty_km': position_uncertainty_km,
-                'confidence_degradation': execution_accuracy
-            }
-            
-        except Exception as e:
-            print(f"⚠️ Error calculando incertidumbre de maniobra: {e}")
-            return {'error': str(e)}
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Sistema de Análisis de Satélites
+NASA Space App Challenge 2025
+
+Este sistema permite:
+1. Obtener datos de satélites desde Celestrak usando Skyfield
+2. Buscar satélites por nombre
+3. Calcular órbitas y posiciones futuras
+4. Predecir posibles colisiones en los próximos 4 días
+5. Visualizar trayectorias orbitales
+
+Autor: NASA Space App Team
+Fecha: Octubre 2025
+"""
+
+import requests
+import numpy as np
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import cycle, islice
+import argparse
+import asyncio
+import gzip
+import io
+import json
+import multiprocessing
+import os
+import pickle
+import re
+import struct
+import sys
+import time
+import webbrowser
+from collections import deque
+from skyfield.api import load, EarthSatellite
+from skyfield.timelib import Time
+from sgp4.api import Satrec, SatrecArray
+
+# Nutación reducida IAU2000B para tiempos de graficado (no en todas las
+# versiones de Skyfield)
+try:
+    from skyfield.nutationlib import iau2000b_radians
+    IAU2000B_AVAILABLE = True
+except ImportError:
+    IAU2000B_AVAILABLE = False
+import pandas as pd
+from typing import List, Dict, Tuple, Optional
+import warnings
+warnings.filterwarnings('ignore')
+
+# Estructura SoA para posiciones propagadas (evita listas de diccionarios)
+_POSITION_DTYPE = np.dtype([
+    ('datetime', 'O'),
+    ('latitude', 'f8'),
+    ('longitude', 'f8'),
+    ('altitude_km', 'f8'),
+    ('x_km', 'f8'),
+    ('y_km', 'f8'),
+    ('z_km', 'f8')
+])
+
+# Tripleta TLE completa (nombre + líneas 1 y 2) compilada una sola vez
+_TLE_RE = re.compile(r'([^\n]{1,24})\r?\n(1 [^\n]{66,68})\r?\n(2 [^\n]{66,68})')
+
+# Separador de listas de nombres introducidas por el usuario: una sola
+# pasada en C que absorbe los espacios alrededor de cada coma
+_SPLIT_CSV = re.compile(r'\s*,\s*')
+
+# Saneado de nombres de satélite para nombres de archivo: una pasada con
+# tabla de traducción en vez de encadenar varios str.replace
+_SAFE_NAME_TABLE = str.maketrans({' ': '_', '(': '', ')': ''})
+
+# Generador de aleatorios compartido para las simulaciones
+_RNG = np.random.default_rng()
+
+# Escalera de criticidad para tiempos de maniobra (umbrales en segundos)
+_MANEUVER_LEVELS_S = np.array([1.0, 6.0, 24.0, 168.0]) * 3600.0
+_CRITICALITY_LABELS = ("🔴 CRÍTICO", "🟠 ALTO", "🟡 MEDIO", "🟢 BAJO", "🔵 MÍNIMO")
+_CRITICALITY_RECOMMENDATIONS = (
+    "Maniobra inmediata requerida",
+    "Preparar maniobra en las próximas horas",
+    "Planificar maniobra para hoy",
+    "Maniobra puede planificarse con anticipación",
+    "Tiempo suficiente para análisis detallado"
+)
+
+
+def _build_earth_mesh(resolution: int):
+    """
+    Malla (x, y, z) de la esfera terrestre — geometría constante
+
+    Se calcula una sola vez por resolución y en float32: a escala de
+    píxel no hay pérdida visible y la serialización pesa la mitad.
+    """
+    u = np.linspace(0, 2 * np.pi, resolution)
+    v = np.linspace(0, np.pi, resolution)
+    return (
+        (6371 * np.outer(np.cos(u), np.sin(v))).astype(np.float32),  # Radio: 6371 km
+        (6371 * np.outer(np.sin(u), np.sin(v))).astype(np.float32),
+        (6371 * np.outer(np.ones_like(u), np.cos(v))).astype(np.float32)
+    )
+
+
+# Malla reducida para las animaciones (30×30 basta en movimiento)
+_EARTH_MESH_30 = _build_earth_mesh(30)
+
+
+def _build_earth_mesh3d(resolution: int):
+    """
+    Esfera terrestre triangulada para go.Mesh3d: vértices aplanados más
+    índices (i, j, k) de los dos triángulos de cada celda de la rejilla
+
+    A diferencia de go.Surface, el navegador recibe la triangulación ya
+    hecha y no re-procesa la rejilla en cada render.
+    """
+    u = np.linspace(0, 2 * np.pi, resolution)
+    v = np.linspace(0, np.pi, resolution)
+    uu, vv = np.meshgrid(u, v, indexing='ij')
+    x = (6371 * np.cos(uu) * np.sin(vv)).ravel().astype(np.float32)
+    y = (6371 * np.sin(uu) * np.sin(vv)).ravel().astype(np.float32)
+    z = (6371 * np.cos(vv)).ravel().astype(np.float32)
+
+    rows, cols = np.meshgrid(np.arange(resolution - 1),
+                             np.arange(resolution - 1), indexing='ij')
+    v00 = (rows * resolution + cols).ravel()
+    v01 = v00 + 1
+    v10 = v00 + resolution
+    v11 = v10 + 1
+    tri_i = np.concatenate([v00, v00])
+    tri_j = np.concatenate([v10, v01])
+    tri_k = np.concatenate([v11, v11])
+    return x, y, z, tri_i, tri_j, tri_k
+
+
+_EARTH_MESH3D_30 = _build_earth_mesh3d(30)
+
+
+def _teme_to_itrf(jd_ut1: np.ndarray, r_teme: np.ndarray):
+    """
+    Rotación TEME→ITRF vectorizada basada en GMST (Vallado)
+
+    El GMST es un polinomio barato en jd_ut1 y la rotación es un único
+    giro alrededor del eje z aplicado a todo el array de posiciones, sin
+    construir marcos de referencia de Skyfield por paso. Se omite el
+    movimiento polar (efecto sub-métrico, irrelevante a esta escala).
+
+    Args:
+        jd_ut1: Fechas julianas UT1, forma (T,)
+        r_teme: Posiciones TEME en km, forma (..., T, 3)
+
+    Returns:
+        Tuple: Arrays (x, y, z) ITRF en km, cada uno de forma (..., T)
+    """
+    t_cent = (jd_ut1 - 2451545.0) / 36525.0
+    gmst_sec = (67310.54841
+                + (876600.0 * 3600.0 + 8640184.812866) * t_cent
+                + 0.093104 * t_cent ** 2
+                - 6.2e-6 * t_cent ** 3) % 86400.0
+    theta = gmst_sec * (2.0 * np.pi / 86400.0)
+
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    x = cos_t * r_teme[..., 0] + sin_t * r_teme[..., 1]
+    y = -sin_t * r_teme[..., 0] + cos_t * r_teme[..., 1]
+    return x, y, r_teme[..., 2]
+
+
+# Compilación JIT opcional de los núcleos numéricos calientes
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Decorador neutro cuando numba no está instalado"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _distance_scan(r_target: np.ndarray, r_others: np.ndarray) -> np.ndarray:
+    """
+    Distancias ||r_others[i, t] − r_target[t]|| repartidas entre núcleos
+
+    Equivalente al einsum NumPy del barrido de colisiones pero con prange
+    sobre los satélites y sin arrays temporales intermedios; numba libera
+    el GIL y vectoriza el cuerpo interno vía LLVM.
+    """
+    n, t_steps = r_others.shape[0], r_others.shape[1]
+    dist = np.empty((n, t_steps))
+    for i in prange(n):
+        for t in range(t_steps):
+            dx = r_others[i, t, 0] - r_target[t, 0]
+            dy = r_others[i, t, 1] - r_target[t, 1]
+            dz = r_others[i, t, 2] - r_target[t, 2]
+            dist[i, t] = np.sqrt(dx * dx + dy * dy + dz * dz)
+    return dist
+
+
+@njit(cache=True, fastmath=True)
+def _d2(ax: float, ay: float, az: float,
+        bx: float, by: float, bz: float) -> float:
+    """
+    Distancia cuadrada entre dos puntos 3D con aritmética escalar pura
+
+    Evita los dos ndarray temporales y el sqrt de np.linalg.norm; LLVM
+    vectoriza el cuerpo y la raíz se toma sólo al registrar un acierto.
+    """
+    dx = ax - bx
+    dy = ay - by
+    dz = az - bz
+    return dx * dx + dy * dy + dz * dz
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _pair_scan(P: np.ndarray, pairs: np.ndarray, threshold_km: float):
+    """
+    Barrido de pares candidatos repartido entre núcleos con prange
+
+    P es el tensor (N, T, 3) de trayectorias y pairs la lista (M, 2) de
+    pares candidatos. Devuelve arrays preasignados (i, j, t_idx, dist)
+    con un registro por instante bajo el umbral; dos pasadas (conteo +
+    relleno con offsets) evitan condiciones de carrera entre hilos.
+    """
+    n_pairs = pairs.shape[0]
+    n_times = P.shape[1]
+    th2 = threshold_km * threshold_km
+
+    counts = np.zeros(n_pairs, dtype=np.int64)
+    for k in prange(n_pairs):
+        i, j = pairs[k, 0], pairs[k, 1]
+        c = 0
+        for t in range(n_times):
+            if _d2(P[i, t, 0], P[i, t, 1], P[i, t, 2],
+                   P[j, t, 0], P[j, t, 1], P[j, t, 2]) < th2:
+                c += 1
+        counts[k] = c
+
+    offsets = np.zeros(n_pairs + 1, dtype=np.int64)
+    for k in range(n_pairs):
+        offsets[k + 1] = offsets[k] + counts[k]
+
+    total = offsets[n_pairs]
+    out_i = np.empty(total, dtype=np.int64)
+    out_j = np.empty(total, dtype=np.int64)
+    out_t = np.empty(total, dtype=np.int64)
+    out_d = np.empty(total, dtype=np.float64)
+    for k in prange(n_pairs):
+        if counts[k] > 0:
+            pos = offsets[k]
+            i, j = pairs[k, 0], pairs[k, 1]
+            for t in range(n_times):
+                d2 = _d2(P[i, t, 0], P[i, t, 1], P[i, t, 2],
+                         P[j, t, 0], P[j, t, 1], P[j, t, 2])
+                if d2 < th2:
+                    out_i[pos] = i
+                    out_j[pos] = j
+                    out_t[pos] = t
+                    out_d[pos] = np.sqrt(d2)
+                    pos += 1
+    return out_i, out_j, out_t, out_d
+
+
+@njit(cache=True, fastmath=True)
+def _rel_velocity_estimate(distance_km: float) -> float:
+    """
+    Estimación escalar de velocidad relativa según la distancia de encuentro
+
+    Núcleo compilado del clasificador frontal/angular/lateral; se invoca
+    desde el bucle caliente de búsqueda de colisiones.
+    """
+    orbital_speed = 7800.0  # velocidad orbital típica en LEO (m/s)
+    if distance_km < 5.0:
+        return orbital_speed * 1.8  # Encuentro frontal probable
+    elif distance_km < 20.0:
+        return orbital_speed * 1.2  # Encuentro angular
+    return orbital_speed * 0.5  # Encuentro lateral
+
+
+def _propagate_tle_chunk(tle_pairs: List[Tuple[str, str]], jd: np.ndarray,
+                         fr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Propagar un bloque de TLEs con SatrecArray (proceso trabajador)
+
+    Función de nivel de módulo para multiprocessing: recibe las líneas
+    TLE crudas (los Satrec no son picklables) y devuelve sólo errores y
+    posiciones TEME del bloque.
+    """
+    models = [Satrec.twoline2rv(line1, line2) for line1, line2 in tle_pairs]
+    errors, r, _ = SatrecArray(models).sgp4(jd, fr)
+    return errors, r
+
+
+@njit(cache=True, fastmath=True)
+def _maneuver_core(v_rel: float, R_req: float, sigma_0: float, k: float, n: float):
+    """
+    Núcleo numérico de la ecuación t ≥ (R_req + n·σ₀) / (v_rel − n·k)
+
+    Devuelve (t_segundos, numerador, denominador); t_segundos es -1.0
+    cuando el denominador no es positivo (configuración inválida).
+    """
+    numerador = R_req + n * sigma_0
+    denominador = v_rel - n * k
+    if denominador <= 0.0:
+        return -1.0, numerador, denominador
+    return numerador / denominador, numerador, denominador
+
+
+@njit(cache=True, fastmath=True)
+def _maneuver_sensitivity(v_rel: float, R_req: float, sigma_0: float,
+                          k: float, n: float, numerador: float,
+                          denominador: float):
+    """
+    Variantes de sensibilidad (±10% en v_rel, ±50% en σ₀) en una sola
+    llamada compilada en vez de cuatro re-entradas Python; los casos con
+    denominador no positivo devuelven -1.0.
+    """
+    d_high = v_rel * 1.1 - n * k
+    t_high = numerador / d_high if d_high > 0.0 else -1.0
+    d_low = v_rel * 0.9 - n * k
+    t_low = numerador / d_low if d_low > 0.0 else -1.0
+    t_sigma_high = (R_req + n * sigma_0 * 1.5) / denominador
+    t_sigma_low = (R_req + n * sigma_0 * 0.5) / denominador
+    return t_high, t_low, t_sigma_high, t_sigma_low
+
+# Importaciones científicas avanzadas
+try:
+    from scipy.special import erfc
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    print("⚠️ SciPy no disponible - usando métodos alternativos para probabilidad")
+
+# Índice espacial KD-tree para búsquedas de pares cercanos
+try:
+    from scipy.spatial import cKDTree
+    CKDTREE_AVAILABLE = True
+except ImportError:
+    CKDTREE_AVAILABLE = False
+
+# Propagación SGP4 en GPU (opcional, para catálogos densos)
+try:
+    from cuda_sgp4 import cuda_sgp4
+    import cupy as cp
+    CUDA_SGP4_AVAILABLE = True
+except ImportError:
+    CUDA_SGP4_AVAILABLE = False
+
+# Descargas HTTP/2 en paralelo para las categorías de Celestrak
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Serialización JSON acelerada para exportaciones del catálogo
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dump_json(obj) -> bytes:
+    """
+    Serializar a JSON en bytes: orjson maneja datetime, dataclasses y
+    arrays NumPy de forma nativa en C; el fallback stdlib usa default=str
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            option=(orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_SERIALIZE_DATACLASS
+                    | orjson.OPT_NAIVE_UTC))
+    return json.dumps(obj, default=str).encode('utf-8')
+
+# Caché HTTP persistente para las descargas de Celestrak
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Importaciones para visualización, cargadas de forma diferida: Plotly y
+# matplotlib cuestan cientos de ms de import y sólo las opciones de
+# graficado (6/7/8) las necesitan; el resto del programa arranca sin ellas
+plt = None
+go = None
+pio = None
+
+
+def _load_plotting_libs() -> None:
+    """Importar matplotlib y Plotly la primera vez que se grafica"""
+    global plt, go, pio
+    if go is not None:
+        return
+    import matplotlib.pyplot as _plt
+    from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 - registra la proyección 3d
+    import plotly.graph_objects as _go
+    import plotly.io as _pio
+    plt, go, pio = _plt, _go, _pio
+    # Serializar figuras con orjson cuando esté disponible: las animaciones
+    # con decenas de frames tardan varias veces menos en escribirse
+    if ORJSON_AVAILABLE:
+        pio.json.config.default_engine = 'orjson'
+
+
+class _LazySatelliteEntry(dict):
+    """
+    Entrada de self.satellites que construye su EarthSatellite bajo demanda
+
+    Mantiene la interfaz de diccionario existente ('satellite', 'line1',
+    'line2', 'category') pero difiere la construcción del objeto Skyfield
+    —la parte cara de la carga del catálogo— hasta el primer acceso.
+    """
+
+    def __init__(self, name: str, line1: str, line2: str, category: str, ts):
+        super().__init__(line1=line1, line2=line2, category=category)
+        self.name = name
+        self._ts = ts
+
+    def __missing__(self, key):
+        if key != 'satellite':
+            raise KeyError(key)
+        satellite = EarthSatellite(self['line1'], self['line2'], self.name, self._ts)
+        self['satellite'] = satellite
+        return satellite
+
+
+class SatelliteAnalyzer:
+    """
+    Clase principal para análisis de satélites usando Skyfield y datos de Celestrak
+    """
+    
+    def __init__(self):
+        """Inicializar el analizador de satélites"""
+        # Tablas de segundos intercalares incorporadas: evita descargar y
+        # parsear los ficheros de la IERS en cada arranque
+        self.ts = load.timescale(builtin=True)
+        self.satellites = {}
+        self.tle_data = {}
+        # Índice de nombres precalculado para búsquedas vectorizadas
+        self._names = np.array([], dtype=object)
+        self._names_lower = pd.Series(dtype=object)
+        self._names_lower_u = np.array([], dtype='U1')
+        # Elementos orbitales de todo el catálogo en formato SoA
+        self._orb = {}
+        self._orb_index = {}
+        # Catálogo columnar completo (nombres, categorías, TLEs y elementos)
+        self.df = pd.DataFrame()
+        # Modelos SGP4 crudos memorizados y lote de catálogo completo
+        self._satrec_cache = {}
+        self._satrec_array = None
+        self._sat_names = []
+        # Malla de la esfera terrestre (geometría constante, calculada una vez)
+        self._earth_mesh = _build_earth_mesh(50)
+        self.earth = load('de421.bsp')['earth']
+        
+        # Inicializar nuevos componentes avanzados
+        self.realistic_propagator = RealisticOrbitPropagator()
+        self.advanced_collision_analyzer = AdvancedCollisionAnalyzer()
+        self.uncertainty_model = UncertaintyModel()
+        
+        print("🛰️  Inicializando Sistema de Análisis de Satélites...")
+        print("🔬 Componentes avanzados cargados:")
+        print("   ✅ Propagador orbital realista (J2 + arrastre)")
+        print("   ✅ Analizador de colisiones probabilístico")
+        print("   ✅ Modelo de incertidumbre no-lineal")
+        
+    def download_tle_data(self, tle_url: str = None) -> bool:
+        """
+        Descargar datos TLE (Two-Line Elements) desde Celestrak
+        
+        Args:
+            tle_url: URL personalizada para datos TLE
+            
+        Returns:
+            bool: True si la descarga fue exitosa
+        """
+        try:
+            # URLs de diferentes categorías de satélites de Celestrak
+            urls = {
+                'active': 'https://celestrak.org/NORAD/elements/gp.php?GROUP=active&FORMAT=tle',
+                'stations': 'https://celestrak.org/NORAD/elements/gp.php?GROUP=stations&FORMAT=tle',
+                'weather': 'https://celestrak.org/NORAD/elements/gp.php?GROUP=weather&FORMAT=tle',
+                'communications': 'https://celestrak.org/NORAD/elements/gp.php?GROUP=geo&FORMAT=tle',
+                'navigation': 'https://celestrak.org/NORAD/elements/gp.php?GROUP=gps-ops&FORMAT=tle'
+            }
+            
+            if tle_url:
+                urls['custom'] = tle_url
+                
+            print("📡 Descargando datos TLE desde Celestrak...")
+
+            if REQUESTS_CACHE_AVAILABLE:
+                # Sesión con caché en disco y revalidación condicional (ETag):
+                # los catálogos sin cambios se sirven localmente en vez de
+                # volver a descargarse, y se evita el rate-limit de Celestrak
+                session = requests_cache.CachedSession('celestrak_cache', expire_after=3600)
+            else:
+                session = requests
+
+            all_satellites = {}
+            # Números NORAD ya vistos: los feeds se solapan y cada duplicado
+            # evitado ahorra parseo y una entrada redundante en el catálogo
+            seen_norad = set()
+            parallel_done = False
+
+            if HTTPX_AVAILABLE:
+                # Todas las categorías a la vez sobre una conexión HTTP/2
+                # multiplexada: la latencia total pasa de la suma de las
+                # descargas al máximo de ellas
+                try:
+                    texts = self._fetch_tle_parallel(urls)
+                    for category, text in texts.items():
+                        if not text:
+                            continue
+                        self._parse_tle_text(text, category, all_satellites, seen_norad)
+                        print(f"   ✅ {category}: {len([s for s in all_satellites.values() if s['category'] == category])} satélites")
+                    parallel_done = True
+                except Exception as e:
+                    print(f"   ⚠️ Descarga paralela no disponible ({e}), usando modo secuencial")
+
+            if not parallel_done:
+                for category, url in urls.items():
+                    try:
+                        # Descarga en streaming: se parsea línea a línea sin
+                        # materializar el texto completo en memoria
+                        with session.get(url, stream=True, timeout=30) as response:
+                            response.raise_for_status()
+                            self._parse_tle_lines(
+                                response.iter_lines(chunk_size=8192, decode_unicode=True),
+                                category, all_satellites, seen_norad)
+
+                        print(f"   ✅ {category}: {len([s for s in all_satellites.values() if s['category'] == category])} satélites")
+
+                    except Exception as e:
+                        print(f"   ❌ Error descargando {category}: {str(e)}")
+                        continue
+            
+            if not all_satellites:
+                # Sin red: intentar arrancar desde la caché local en disco
+                all_satellites = self._load_satellite_cache()
+                if all_satellites:
+                    print(f"💾 Catálogo recuperado de la caché local: {len(all_satellites)} satélites")
+
+            self.satellites = all_satellites
+            self._rebuild_name_index()
+            self._rebuild_orbital_elements()
+            self._rebuild_catalog_frame()
+            # Invalidar los lotes SGP4 del catálogo anterior
+            self._satrec_cache = {}
+            self._satrec_array = None
+            self._sat_names = []
+            if all_satellites:
+                self._save_satellite_cache()
+            print(f"🎯 Total de satélites cargados: {len(self.satellites)}")
+            return True
+
+        except Exception as e:
+            print(f"❌ Error descargando datos TLE: {str(e)}")
+            return False
+
+    def _parse_tle_lines(self, lines, category: str, all_satellites: Dict,
+                         seen_norad: set) -> None:
+        """
+        Parsear un flujo de líneas TLE con una ventana rodante de 3
+
+        Acepta cualquier iterable de líneas (streaming o texto ya dividido)
+        y registra entradas perezosas en all_satellites, descartando los
+        números NORAD repetidos entre feeds solapados.
+        """
+        window = []
+        for line in lines:
+            if not line:
+                continue
+            window.append(line.strip())
+            if len(window) < 3:
+                continue
+
+            name, line1, line2 = window
+            if name and not name.startswith('#') and \
+                    line1.startswith('1 ') and line2.startswith('2 '):
+                norad = line1[2:7]
+                if norad not in seen_norad:
+                    seen_norad.add(norad)
+                    # El EarthSatellite se construye bajo demanda
+                    all_satellites[name] = _LazySatelliteEntry(
+                        name, line1, line2, category, self.ts)
+                window = []
+            else:
+                window.pop(0)
+
+    def _parse_tle_text(self, text: str, category: str, all_satellites: Dict,
+                        seen_norad: set) -> None:
+        """
+        Parsear un bloque de texto TLE completo con la regex precompilada
+
+        Una sola pasada de re.finditer en C reemplaza al caminante de líneas
+        Python cuando la respuesta ya está entera en memoria; los números
+        NORAD repetidos entre feeds solapados se descartan.
+        """
+        for match in _TLE_RE.finditer(text):
+            name = match.group(1).strip()
+            if not name or name.startswith('#'):
+                continue
+            line1 = match.group(2).strip()
+            norad = line1[2:7]
+            if norad in seen_norad:
+                continue
+            seen_norad.add(norad)
+            all_satellites[name] = _LazySatelliteEntry(
+                name, line1, match.group(3).strip(), category, self.ts)
+
+    def _fetch_tle_parallel(self, urls: Dict[str, str]) -> Dict[str, Optional[str]]:
+        """
+        Descargar todas las categorías de Celestrak en paralelo con httpx
+
+        Una sola conexión HTTP/2 reutilizada y asyncio.gather sobre todas
+        las URLs; los fallos individuales se reportan sin abortar el resto.
+
+        Returns:
+            Dict: categoría -> texto TLE descargado (None si falló)
+        """
+        async def fetch_all():
+            async with httpx.AsyncClient(http2=True, timeout=30) as client:
+                async def fetch(category, url):
+                    try:
+                        response = await client.get(url)
+                        response.raise_for_status()
+                        return response.text
+                    except Exception as e:
+                        print(f"   ❌ Error descargando {category}: {e}")
+                        return None
+
+                results = await asyncio.gather(
+                    *[fetch(category, url) for category, url in urls.items()])
+            return dict(zip(urls.keys(), results))
+
+        return asyncio.run(fetch_all())
+
+    def _rebuild_name_index(self) -> None:
+        """Reconstruir el índice de nombres en minúsculas usado por las búsquedas"""
+        names_lower = [name.lower() for name in self.satellites]
+        self._names = np.array(list(self.satellites), dtype=object)
+        self._names_lower = pd.Series(names_lower, dtype=object)
+        self._names_lower_u = np.array(names_lower, dtype='U') if names_lower \
+            else np.array([], dtype='U1')
+
+    def _get_satrec(self, name: str) -> Satrec:
+        """Obtener (y memorizar) el modelo Satrec crudo de un satélite"""
+        satrec = self._satrec_cache.get(name)
+        if satrec is None:
+            entry = self.satellites[name]
+            satrec = Satrec.twoline2rv(entry['line1'], entry['line2'])
+            self._satrec_cache[name] = satrec
+        return satrec
+
+    def _get_satrec_array(self) -> Tuple[Optional[SatrecArray], List[str]]:
+        """
+        SatrecArray de todo el catálogo, construido una sola vez por carga
+
+        Returns:
+            Tuple: (SatrecArray o None si el catálogo está vacío, lista de
+                    nombres alineada con las filas del lote)
+        """
+        if self._satrec_array is None or len(self._sat_names) != len(self.satellites):
+            self._sat_names = list(self.satellites)
+            self._satrec_array = SatrecArray(
+                [self._get_satrec(name) for name in self._sat_names]
+            ) if self._sat_names else None
+        return self._satrec_array, self._sat_names
+
+    def _rebuild_orbital_elements(self) -> None:
+        """
+        Parsear en bloque los elementos orbitales de todo el catálogo (SoA)
+
+        Extrae las columnas fijas de la línea 2 de cada TLE en arrays
+        np.float64 compartidos, de modo que get_satellite_info y los
+        prefiltros de colisión indexen en vez de re-parsear con float().
+        """
+        names = list(self.satellites)
+        self._orb_index = {name: i for i, name in enumerate(names)}
+        if not names:
+            self._orb = {}
+            return
+
+        # Rejilla de caracteres (N, 69): cada campo es un corte de columnas
+        grid = np.array([self.satellites[name]['line2'].ljust(69) for name in names],
+                        dtype='U69').view('U1').reshape(len(names), 69)
+
+        def column(start: int, stop: int) -> np.ndarray:
+            width = stop - start
+            return np.ascontiguousarray(grid[:, start:stop]).view(f'U{width}').ravel().astype('f8')
+
+        GM = 398600.4418  # km³/s²
+        mean_motion = column(52, 63)
+        n_rad = mean_motion * 2.0 * np.pi / 86400.0
+        self._orb = {
+            'incl': column(8, 16),
+            'raan': column(17, 25),
+            'ecc': column(26, 33) / 1e7,
+            'argp': column(34, 42),
+            'mean_anomaly': column(43, 51),
+            'mm': mean_motion,
+            'a': (GM / n_rad ** 2) ** (1.0 / 3.0)
+        }
+
+    def _rebuild_catalog_frame(self) -> None:
+        """
+        Construir el catálogo columnar (AoS → SoA) como DataFrame de pandas
+
+        Una sola tabla indexada por nombre con categorías, líneas TLE y
+        elementos orbitales: las búsquedas y los prefiltros consumen sus
+        columnas como arrays sin re-empaquetar, mientras self.satellites
+        se conserva como acceso de compatibilidad por nombre.
+        """
+        names = list(self.satellites)
+        self.df = pd.DataFrame({
+            'name': names,
+            'name_lower': [name.lower() for name in names],
+            'category': [self.satellites[name]['category'] for name in names],
+            'line1': [self.satellites[name]['line1'] for name in names],
+            'line2': [self.satellites[name]['line2'] for name in names],
+            **self._orb
+        })
+        if names:
+            self.df = self.df.set_index('name', drop=False)
+
+    def _save_satellite_cache(self, filename: str = 'satellites_cache.pkl') -> None:
+        """Persistir los TLE parseados para arranques posteriores sin red"""
+        try:
+            data = {name: (entry['line1'], entry['line2'], entry['category'])
+                    for name, entry in self.satellites.items()}
+            with open(filename, 'wb') as f:
+                pickle.dump(data, f, protocol=5)
+        except Exception as e:
+            print(f"⚠️  No se pudo guardar la caché de satélites: {e}")
+
+    def _load_satellite_cache(self, filename: str = 'satellites_cache.pkl') -> Dict:
+        """Recuperar los TLE parseados desde la caché local en disco"""
+        try:
+            if not os.path.exists(filename):
+                return {}
+            with open(filename, 'rb') as f:
+                data = pickle.load(f)
+            return {name: _LazySatelliteEntry(name, line1, line2, category, self.ts)
+                    for name, (line1, line2, category) in data.items()}
+        except Exception as e:
+            print(f"⚠️  No se pudo leer la caché de satélites: {e}")
+            return {}
+    
+    def export_satellites_list(self, filename: str = "satelites_disponibles.txt") -> bool:
+        """
+        Exportar lista de todos los satélites disponibles a un archivo de texto
+        
+        Args:
+            filename: Nombre del archivo a crear
+            
+        Returns:
+            bool: True si la exportación fue exitosa
+        """
+        try:
+            if not self.satellites:
+                print("❌ No hay satélites cargados. Ejecuta download_tle_data() primero.")
+                return False
+            
+            # Organizar satélites por categoría
+            satellites_by_category = {}
+            for name, data in self.satellites.items():
+                category = data['category']
+                if category not in satellites_by_category:
+                    satellites_by_category[category] = []
+                satellites_by_category[category].append(name)
+            
+            # Ordenar satélites alfabéticamente dentro de cada categoría
+            for category in satellites_by_category:
+                satellites_by_category[category].sort()
+            
+            # Componer el informe en memoria y escribirlo de una sola vez
+            parts = []
+            parts.append("=" * 80 + "\n")
+            parts.append("LISTA DE SATÉLITES DISPONIBLES\n")
+            parts.append("Sistema de Análisis de Satélites - NASA Space App Challenge 2025\n")
+            parts.append("=" * 80 + "\n")
+            parts.append(f"Fecha de generación: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            parts.append(f"Total de satélites: {len(self.satellites)}\n")
+            parts.append("=" * 80 + "\n\n")
+            
+            # Escribir resumen por categoría
+            parts.append("RESUMEN POR CATEGORÍA:\n")
+            parts.append("-" * 40 + "\n")
+            total_count = 0
+            for category, sat_list in satellites_by_category.items():
+                count = len(sat_list)
+                total_count += count
+                parts.append(f"{category.capitalize():20s}: {count:5d} satélites\n")
+            parts.append("-" * 40 + "\n")
+            parts.append(f"{'TOTAL':20s}: {total_count:5d} satélites\n\n")
+            
+            # Escribir lista detallada por categoría
+            for category, sat_list in satellites_by_category.items():
+                parts.append("=" * 80 + "\n")
+                parts.append(f"CATEGORÍA: {category.upper()}\n")
+                parts.append(f"Total en esta categoría: {len(sat_list)} satélites\n")
+                parts.append("=" * 80 + "\n")
+                
+                for i, sat_name in enumerate(sat_list, 1):
+                    parts.append(f"{i:4d}. {sat_name}\n")
+                
+                parts.append("\n")
+            
+            # Agregar lista alfabética completa
+            parts.append("=" * 80 + "\n")
+            parts.append("LISTA ALFABÉTICA COMPLETA\n")
+            parts.append("=" * 80 + "\n")
+            
+            all_satellites = sorted(self.satellites.keys())
+            for i, sat_name in enumerate(all_satellites, 1):
+                category = self.satellites[sat_name]['category']
+                parts.append(f"{i:5d}. {sat_name:<50s} [{category}]\n")
+            
+            # Agregar información útil al final
+            parts.append("\n" + "=" * 80 + "\n")
+            parts.append("INSTRUCCIONES DE USO:\n")
+            parts.append("=" * 80 + "\n")
+            parts.append("1. Copia el nombre exacto del satélite que deseas analizar\n")
+            parts.append("2. Pégalo en el programa cuando se solicite el nombre\n")
+            parts.append("3. Los nombres son sensibles a mayúsculas y minúsculas\n")
+            parts.append("4. Usa Ctrl+F para buscar satélites específicos en este archivo\n\n")
+            
+            parts.append("EJEMPLOS DE SATÉLITES INTERESANTES:\n")
+            parts.append("-" * 40 + "\n")
+            
+            # Buscar algunos satélites interesantes como ejemplos
+            interesting_examples = []
+            search_terms = ["ISS", "HUBBLE", "NOAA", "GPS", "STARLINK", "GOES"]
+            
+            for term in search_terms:
+                matches = [name for name in all_satellites if term in name.upper()]
+                if matches:
+                    interesting_examples.append(f"• {matches[0]} (búsqueda: '{term}')")
+            
+            for example in interesting_examples:
+                parts.append(f"{example}\n")
+            
+            parts.append("\n" + "=" * 80 + "\n")
+            parts.append("¡Explora el cosmos, un satélite a la vez! 🛰️🌌\n")
+            parts.append("=" * 80 + "\n")
+            
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(''.join(parts))
+
+            print(f"✅ Lista de satélites exportada exitosamente:")
+            print(f"   📁 Archivo: {filename}")
+            print(f"   🛰️  Total de satélites: {len(self.satellites)}")
+            print(f"   📂 Categorías: {len(satellites_by_category)}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error exportando lista de satélites: {str(e)}")
+            return False
+    
+    def export_satellites_json(self, filename: str = "satelites_disponibles.json.gz") -> bool:
+        """
+        Exportar el catálogo completo a JSON comprimido (orjson + gzip)
+
+        Alternativa rápida y compacta al informe de texto: serializa los
+        arrays SoA de elementos orbitales directamente (sin reconstruir
+        diccionarios por satélite) y escribe un único bloque comprimido.
+
+        Args:
+            filename: Nombre del archivo .json.gz a crear
+
+        Returns:
+            bool: True si la exportación fue exitosa
+        """
+        try:
+            if not self.satellites:
+                print("❌ No hay satélites cargados. Ejecuta download_tle_data() primero.")
+                return False
+
+            if len(self._orb_index) != len(self.satellites):
+                self._rebuild_orbital_elements()
+
+            names = list(self.satellites)
+            payload = {
+                'generated': datetime.now().isoformat(),
+                'total': len(names),
+                'names': names,
+                'categories': [self.satellites[name]['category'] for name in names],
+                'orbital_elements': self._orb
+            }
+
+            if not ORJSON_AVAILABLE:
+                payload['orbital_elements'] = {key: arr.tolist()
+                                               for key, arr in self._orb.items()}
+            raw = _dump_json(payload)
+
+            # compresslevel=1: compresión ligera, dominada por la E/S
+            with gzip.open(filename, 'wb', compresslevel=1) as f:
+                f.write(raw)
+
+            print(f"✅ Catálogo exportado a JSON comprimido:")
+            print(f"   📁 Archivo: {filename}")
+            print(f"   🛰️  Total de satélites: {len(names)}")
+            return True
+
+        except Exception as e:
+            print(f"❌ Error exportando catálogo JSON: {str(e)}")
+            return False
+
+    def search_satellite(self, search_term: str) -> List[str]:
+        """
+        Buscar satélites por nombre
+        
+        Args:
+            search_term: Término de búsqueda
+            
+        Returns:
+            List[str]: Lista de nombres de satélites que coinciden
+        """
+        if self.df.empty:
+            return []
+
+        # Búsqueda de subcadena vectorizada sobre el catálogo columnar
+        search_term = search_term.lower()
+        mask = self.df['name_lower'].str.contains(search_term, regex=False).to_numpy()
+        return sorted(self.df['name'].to_numpy()[mask].tolist())
+    
+    def get_popular_satellites(self) -> Dict[str, List[str]]:
+        """
+        Obtener una lista de satélites populares organizados por categoría
+        
+        Returns:
+            Dict: Diccionario con categorías y satélites populares
+        """
+        popular_categories = {
+            'Estaciones Espaciales': ['ISS', 'ZARYA', 'TIANGONG'],
+            'Telescopios Espaciales': ['HUBBLE', 'SPITZER', 'CHANDRA'],
+            'Satélites Meteorológicos': ['NOAA', 'GOES', 'METEOSAT'],
+            'Navegación GPS': ['GPS', 'NAVSTAR', 'GLONASS'],
+            'Comunicaciones': ['STARLINK', 'INTELSAT', 'IRIDIUM'],
+            'Observación Terrestre': ['LANDSAT', 'AQUA', 'TERRA', 'SENTINEL']
+        }
+        
+        found_satellites = {}
+        
+        for category, search_terms in popular_categories.items():
+            found_satellites[category] = []
+            for term in search_terms:
+                matches = self.search_satellite(term)
+                if matches:
+                    # Agregar los primeros 3 matches de cada término
+                    found_satellites[category].extend(matches[:3])
+            
+            # Remover duplicados y limitar a 5 por categoría
+            found_satellites[category] = list(dict.fromkeys(found_satellites[category]))[:5]
+        
+        return found_satellites
+    
+    def suggest_satellites(self, partial_name: str) -> List[str]:
+        """
+        Sugerir satélites basándose en un nombre parcial
+        
+        Args:
+            partial_name: Nombre parcial del satélite
+            
+        Returns:
+            List[str]: Lista de sugerencias
+        """
+        if len(partial_name) < 2 or not len(self._names):
+            return []
+
+        partial_name = partial_name.lower()
+
+        # Buscar coincidencias exactas al inicio del nombre (vectorizado)
+        starts = np.char.startswith(self._names_lower_u, partial_name)
+        suggestions = self._names[starts].tolist()
+
+        # Si no hay suficientes, buscar coincidencias en cualquier parte
+        if len(suggestions) < 10:
+            contains = self._names_lower.str.contains(partial_name, regex=False).to_numpy()
+            suggestions.extend(self._names[contains & ~starts].tolist())
+
+        return sorted(suggestions)[:15]  # Limitar a 15 sugerencias
+    
+    def browse_satellites_by_category(self) -> Dict[str, List[str]]:
+        """
+        Navegar satélites organizados por categoría
+        
+        Returns:
+            Dict: Satélites organizados por categoría con muestras
+        """
+        satellites_by_category = {}
+        
+        for name, data in self.satellites.items():
+            category = data['category']
+            if category not in satellites_by_category:
+                satellites_by_category[category] = []
+            satellites_by_category[category].append(name)
+        
+        # Ordenar y limitar para navegación fácil
+        for category in satellites_by_category:
+            satellites_by_category[category] = sorted(satellites_by_category[category])
+        
+        return satellites_by_category
+    
+    def show_satellite_examples(self) -> None:
+        """
+        Mostrar ejemplos de satélites interesantes con descripción
+        """
+        examples = {
+            "🏠 Estaciones Espaciales": {
+                "search_terms": ["ISS", "ZARYA", "TIANGONG"],
+                "description": "Laboratorios orbitales tripulados"
+            },
+            "🔭 Telescopios Espaciales": {
+                "search_terms": ["HUBBLE", "SPITZER", "KEPLER"],
+                "description": "Observatorios astronómicos en el espacio"
+            },
+            "🌤️ Satélites Meteorológicos": {
+                "search_terms": ["NOAA", "GOES", "METEOSAT"],
+                "description": "Monitoreo del clima y tiempo"
+            },
+            "🗺️ Navegación GPS": {
+                "search_terms": ["GPS", "NAVSTAR", "GALILEO"],
+                "description": "Sistemas de posicionamiento global"
+            },
+            "📡 Comunicaciones": {
+                "search_terms": ["STARLINK", "IRIDIUM", "INTELSAT"],
+                "description": "Internet y telecomunicaciones"
+            },
+            "🌍 Observación Terrestre": {
+                "search_terms": ["LANDSAT", "AQUA", "TERRA"],
+                "description": "Monitoreo ambiental y recursos"
+            }
+        }
+        
+        print("\n🌟 EJEMPLOS DE SATÉLITES INTERESANTES:")
+        print("=" * 60)
+        
+        for category, info in examples.items():
+            print(f"\n{category}")
+            print(f"📝 {info['description']}")
+            found_examples = []
+            
+            for term in info['search_terms']:
+                matches = self.search_satellite(term)
+                if matches:
+                    found_examples.extend(matches[:2])  # Máximo 2 por término
+            
+            # Mostrar ejemplos únicos
+            unique_examples = list(dict.fromkeys(found_examples))[:3]
+            for i, example in enumerate(unique_examples, 1):
+                print(f"   {i}. {example}")
+            
+            if not unique_examples:
+                print("   (No se encontraron ejemplos en los datos actuales)")
+        
+        print(f"\n💡 TIP: Usa la opción 1 para buscar cualquiera de estos nombres")
+        print(f"🔍 Ejemplo: busca 'ISS' para encontrar la Estación Espacial Internacional")
+    
+    def smart_search(self, search_term: str) -> Dict:
+        """
+        Búsqueda inteligente que proporciona resultados y sugerencias
+        
+        Args:
+            search_term: Término de búsqueda
+            
+        Returns:
+            Dict: Resultados detallados con sugerencias
+        """
+        results = {
+            'exact_matches': [],
+            'partial_matches': [],
+            'suggestions': [],
+            'category_matches': {},
+            'total_found': 0
+        }
+        
+        if not search_term or len(search_term) < 2:
+            return results
+        
+        search_lower = search_term.lower()
+
+        # Buscar coincidencias exactas y parciales sobre el catálogo columnar
+        if not self.df.empty:
+            names = self.df['name'].to_numpy()
+            exact = (self.df['name_lower'] == search_lower).to_numpy()
+            contains = self.df['name_lower'].str.contains(search_lower, regex=False).to_numpy()
+            results['exact_matches'] = names[exact].tolist()
+            results['partial_matches'] = names[contains & ~exact].tolist()
+        
+        # Organizar por categoría
+        for name in results['partial_matches']:
+            category = self.satellites[name]['category']
+            if category not in results['category_matches']:
+                results['category_matches'][category] = []
+            results['category_matches'][category].append(name)
+        
+        # Generar sugerencias si hay pocos resultados
+        if len(results['partial_matches']) < 10:
+            results['suggestions'] = self.suggest_satellites(search_term)
+        
+        results['total_found'] = len(results['exact_matches']) + len(results['partial_matches'])
+        
+        return results
+    
+    def get_satellite_info(self, satellite_name: str) -> Optional[Dict]:
+        """
+        Obtener información detallada de un satélite
+        
+        Args:
+            satellite_name: Nombre del satélite
+            
+        Returns:
+            Dict: Información del satélite o None si no se encuentra
+        """
+        if satellite_name not in self.satellites:
+            return None
+            
+        sat_data = self.satellites[satellite_name]
+        satellite = sat_data['satellite']
+        
+        # Tiempo actual
+        now = self.ts.now()
+        
+        # Calcular posición actual
+        geocentric = satellite.at(now)
+        subpoint = geocentric.subpoint()
+        
+        # Extraer elementos orbitales del TLE
+        line1 = sat_data['line1']
+        line2 = sat_data['line2']
+        
+        # Elementos orbitales: indexar el SoA parseado en bloque al cargar
+        if satellite_name not in self._orb_index:
+            self._rebuild_orbital_elements()
+        idx = self._orb_index[satellite_name]
+        inclination = float(self._orb['incl'][idx])
+        raan = float(self._orb['raan'][idx])  # Right Ascension of Ascending Node
+        eccentricity = float(self._orb['ecc'][idx])
+        arg_perigee = float(self._orb['argp'][idx])
+        mean_anomaly = float(self._orb['mean_anomaly'][idx])
+        mean_motion = float(self._orb['mm'][idx])
+
+        # Calcular período orbital
+        period_minutes = 1440 / mean_motion  # minutos
+        period_hours = period_minutes / 60
+
+        # Altitud aproximada vía la tercera ley de Kepler (a ya precalculado)
+        semi_major_axis = float(self._orb['a'][idx])
+        altitude_km = semi_major_axis - 6371  # Radio terrestre aprox
+        
+        info = {
+            'name': satellite_name,
+            'category': sat_data['category'],
+            'current_position': {
+                'latitude': subpoint.latitude.degrees,
+                'longitude': subpoint.longitude.degrees,
+                'altitude_km': subpoint.elevation.km
+            },
+            'orbital_elements': {
+                'inclination_deg': inclination,
+                'raan_deg': raan,
+                'eccentricity': eccentricity,
+                'argument_of_perigee_deg': arg_perigee,
+                'mean_anomaly_deg': mean_anomaly,
+                'mean_motion_rev_per_day': mean_motion,
+                'period_hours': period_hours,
+                'semi_major_axis_km': semi_major_axis,
+                'approx_altitude_km': altitude_km
+            },
+            'tle_data': {
+                'line1': line1,
+                'line2': line2
+            }
+        }
+        
+        return info
+    
+    def calculate_future_positions(self, satellite_name: str, days_ahead: int = 180) -> np.ndarray:
+        """
+        Calcular posiciones futuras del satélite
+
+        La propagación se hace en un solo lote vectorizado con SatrecArray
+        (en lugar de llamar a satellite.at() una vez por paso de tiempo),
+        seguido de una conversión TEME→ITRF y geodésica sobre arrays completos.
+
+        Args:
+            satellite_name: Nombre del satélite
+            days_ahead: Días hacia el futuro para calcular
+
+        Returns:
+            np.ndarray: Array estructurado (SoA) con las posiciones futuras,
+                        campos: datetime, latitude, longitude, altitude_km,
+                        x_km, y_km, z_km
+        """
+        try:
+            if satellite_name not in self.satellites:
+                print(f"❌ Satélite '{satellite_name}' no encontrado en la base de datos")
+                # Buscar coincidencias parciales
+                matches = [name for name in self.satellites.keys() if satellite_name.lower() in name.lower()]
+                if matches:
+                    print(f"💡 ¿Te refieres a alguno de estos?")
+                    for i, match in enumerate(matches[:5], 1):
+                        print(f"   {i}. {match}")
+                return np.empty(0, dtype=_POSITION_DTYPE)
+
+            print(f"✅ Calculando posiciones para: {satellite_name}")
+
+            # Crear timestamps para los próximos días (cada 12 horas)
+            start_time = self.ts.now()
+            hours = np.arange(0, days_ahead * 24, 12)
+            print(f"📊 Calculando {len(hours)} posiciones para {days_ahead} días...")
+
+            # Propagación con el SGP4 crudo en C: una sola llamada para todos
+            # los pasos, sin pasar por EarthSatellite.at()
+            t = self.ts.tt_jd(start_time.tt + hours / 24.0)
+            fr, jd = np.modf(t.ut1)
+            errors, r_teme, _ = self._get_satrec(satellite_name).sgp4_array(jd, fr)
+
+            # Rotación TEME→ITRF propia (GMST) sobre todo el array de tiempos
+            x, y, z = _teme_to_itrf(t.ut1, r_teme)
+
+            # Conversión ECEF→geodésica (WGS84) en forma cerrada vectorizada
+            lat_deg, lon_deg, alt = self._ecef_to_geodetic(x, y, z)
+
+            # Filtrar pasos donde SGP4 reportó error y empaquetar en SoA
+            valid = errors == 0
+            if not valid.all():
+                for hour in hours[~valid]:
+                    print(f"⚠️  Error calculando posición para hora {hour}")
+
+            positions = np.empty(int(valid.sum()), dtype=_POSITION_DTYPE)
+            positions['datetime'] = np.asarray(t.utc_datetime())[valid]
+            positions['latitude'] = lat_deg[valid]
+            positions['longitude'] = lon_deg[valid]
+            positions['altitude_km'] = alt[valid]
+            positions['x_km'] = x[valid]
+            positions['y_km'] = y[valid]
+            positions['z_km'] = z[valid]
+
+            print(f"✅ Calculadas {len(positions)} posiciones exitosamente")
+            return positions
+
+        except Exception as e:
+            print(f"❌ Error en calculate_future_positions: {str(e)}")
+            return np.empty(0, dtype=_POSITION_DTYPE)
+    
+    def _ecef_to_geodetic(self, x, y, z) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Conversión ECEF→geodésica WGS84 vectorizada (fórmula de Bowring)
+
+        Forma cerrada sin iteración: error sub-milimétrico para altitudes
+        de satélite, calculada con ufuncs de NumPy sobre arrays completos.
+
+        Args:
+            x, y, z: Coordenadas ECEF en km (escalares o arrays)
+
+        Returns:
+            Tuple: (latitud en grados, longitud en grados, altitud en km)
+        """
+        a = 6378.137          # semieje mayor WGS84 (km)
+        b = 6356.7523142      # semieje menor WGS84 (km)
+        e2 = 1.0 - (b * b) / (a * a)
+        ep2 = (a * a) / (b * b) - 1.0
+
+        p = np.hypot(x, y)
+        theta = np.arctan2(z * a, p * b)
+        lat = np.arctan2(z + ep2 * b * np.sin(theta) ** 3,
+                         p - e2 * a * np.cos(theta) ** 3)
+        N = a / np.sqrt(1.0 - e2 * np.sin(lat) ** 2)
+        alt = p / np.cos(lat) - N
+
+        return np.degrees(lat), np.degrees(np.arctan2(y, x)), alt
+
+    def analyze_collision_risk(self, satellite1_name: str, satellite2_name: str = None,
+                             threshold_km: float = 10.0, days_ahead: int = 180,
+                             backend: str = 'cpu') -> Dict:
+        """
+        Analizar riesgo de colisión entre satélites
+
+        Args:
+            satellite1_name: Primer satélite
+            satellite2_name: Segundo satélite (si None, analiza contra todos)
+            threshold_km: Distancia mínima para considerar riesgo
+            days_ahead: Días a analizar hacia el futuro
+            backend: 'cpu' (SatrecArray) o 'cuda' (cuda_sgp4 + cupy, si están
+                     instalados; si no, se recae automáticamente en CPU)
+
+        Returns:
+            Dict: Análisis de riesgo de colisión
+        """
+        if satellite1_name not in self.satellites:
+            return {'error': f'Satélite {satellite1_name} no encontrado'}
+
+        close_encounters = []
+        
+        # Determinar satélites a analizar
+        satellites_to_check = {}
+        if satellite2_name:
+            if satellite2_name in self.satellites:
+                satellites_to_check[satellite2_name] = self.satellites[satellite2_name]
+        else:
+            # Analizar contra TODO el catálogo: la propagación en lote hace
+            # innecesario el antiguo recorte a los primeros 100 satélites
+            for name in self.satellites:
+                if name != satellite1_name:
+                    satellites_to_check[name] = self.satellites[name]
+        
+        print(f"🔍 Analizando {len(satellites_to_check)} satélites para posibles colisiones...")
+
+        check_names = list(satellites_to_check.keys())
+
+        # Prefiltro estilo MOID: descartar candidatos cuya capa radial nunca
+        # puede acercarse a la de sat1 antes de lanzar el barrido SGP4 pesado
+        if satellite2_name is None and check_names:
+            safety_margin_km = 50.0  # deriva por J2/arrastre durante el período
+
+            # Indexar el SoA de elementos orbitales precalculado
+            if any(name not in self._orb_index for name in check_names + [satellite1_name]):
+                self._rebuild_orbital_elements()
+            idx = np.array([self._orb_index[name] for name in check_names])
+            idx1 = self._orb_index[satellite1_name]
+
+            gap = self._min_orbit_distance(
+                float(self._orb['a'][idx1]), float(self._orb['ecc'][idx1]),
+                self._orb['a'][idx], self._orb['ecc'][idx])
+            check_names = [name for name, keep
+                           in zip(check_names, gap < threshold_km + safety_margin_km)
+                           if keep]
+            print(f"   🔎 Prefiltro orbital: {len(check_names)} candidatos superan el filtro")
+
+            if not check_names:
+                return {
+                    'satellite': satellite1_name,
+                    'analysis_period_days': days_ahead,
+                    'threshold_km': threshold_km,
+                    'close_encounters': [],
+                    'risk_level': 'BAJO',
+                    'total_encounters': 0,
+                    'satellites_analyzed': len(satellites_to_check)
+                }
+
+        # Modelos Satrec memorizados: no se re-parsea ningún TLE por llamada
+        models = [self._get_satrec(name) for name in check_names]
+
+        hours = np.arange(0, days_ahead * 24, 6)
+        t = self.ts.tt_jd(self.ts.now().tt + hours / 24.0)
+        fr, jd = np.modf(t.ut1)
+        datetimes = np.asarray(t.utc_datetime())
+
+        if backend == 'cuda' and not CUDA_SGP4_AVAILABLE:
+            print("⚠️ Backend CUDA no disponible - usando SatrecArray en CPU")
+            backend = 'cpu'
+
+        hits = None
+        if backend == 'cuda':
+            try:
+                hits = self._collision_sweep_cuda(
+                    satellite1_name, check_names, days_ahead, threshold_km)
+            except Exception as e:
+                print(f"⚠️ Fallo en el barrido CUDA ({e}) - reintentando en CPU")
+                hits = None
+
+        if hits is None:
+            hits = self._collision_sweep_cpu(models, satellite1_name, jd, fr,
+                                             len(hours), threshold_km)
+
+        # Con el catálogo completo pueden aparecer miles de pasos bajo el
+        # umbral: quedarse con los K más cercanos sin ordenar toda la lista
+        max_encounters = 500
+        if len(hits) > max_encounters:
+            order = np.argpartition(np.array([hit[2] for hit in hits]),
+                                    max_encounters)[:max_encounters]
+            hits = [hits[i] for i in order]
+
+        for sat_idx, t_idx, distance_km, pos1, pos2 in hits:
+            close_encounters.append({
+                'datetime': datetimes[t_idx],
+                'satellite2': check_names[sat_idx],
+                'distance_km': distance_km,
+                'satellite1_pos': pos1,
+                'satellite2_pos': pos2
+            })
+        
+        # Calcular estadísticas de riesgo
+        risk_level = 'BAJO'
+        if close_encounters:
+            min_distance = min(enc['distance_km'] for enc in close_encounters)
+            if min_distance < 1.0:
+                risk_level = 'CRÍTICO'
+            elif min_distance < 5.0:
+                risk_level = 'ALTO'
+            else:
+                risk_level = 'MEDIO'
+        
+        return {
+            'satellite': satellite1_name,
+            'analysis_period_days': days_ahead,
+            'threshold_km': threshold_km,
+            'close_encounters': close_encounters,
+            'risk_level': risk_level,
+            'total_encounters': len(close_encounters),
+            'satellites_analyzed': len(satellites_to_check)
+        }
+    
+    def _collision_sweep_cpu(self, models: List[Satrec], satellite1_name: str,
+                             jd: np.ndarray, fr: np.ndarray, n_times: int,
+                             threshold_km: float) -> List[Tuple]:
+        """
+        Barrido de distancias en CPU por teselas de tiempo con poda temprana
+
+        Cada bloque de posiciones cabe en caché y los candidatos que se
+        mantienen lejos en todas las teselas ya procesadas dejan de
+        propagarse.
+
+        Returns:
+            List[Tuple]: (índice de candidato, índice de tiempo, dist, pos1, pos2)
+        """
+        # Trayectoria completa del satélite objetivo (barata: 1 × T)
+        err1, r1, _ = SatrecArray([self._get_satrec(satellite1_name)]).sgp4(jd, fr)
+        r1 = r1[0]
+        bad1 = err1[0] != 0
+        # Copia fp32 para el kernel de distancias, limitado por ancho de
+        # banda: mitad de tráfico de memoria y el doble de carriles SIMD
+        r1_32 = r1.astype(np.float32)
+
+        TILE = 64
+        prune_margin_km = 500.0  # poda heurística para candidatos siempre lejanos
+        active = np.ones(len(models), dtype=bool)
+        min_dist = np.full(len(models), np.inf)
+        hits = []
+
+        for t0 in range(0, n_times, TILE):
+            if not active.any():
+                break
+            sel = np.flatnonzero(active)
+            tile = slice(t0, t0 + TILE)
+            errors, r, _ = SatrecArray([models[i] for i in sel]).sgp4(jd[tile], fr[tile])
+
+            # SGP4 queda en fp64; el cribado de distancias trabaja en fp32
+            r32 = r.astype(np.float32)
+            if NUMBA_AVAILABLE:
+                dist = _distance_scan(np.ascontiguousarray(r1_32[tile]),
+                                      np.ascontiguousarray(r32))
+            else:
+                diff = r32 - r1_32[tile][None]
+                dist = np.sqrt(np.einsum('ntk,ntk->nt', diff, diff))
+            dist[(errors != 0) | bad1[tile][None]] = np.inf
+
+            for row, t_idx in np.argwhere(dist < threshold_km):
+                # Distancia definitiva re-calculada en fp64 solo para el
+                # conjunto estrecho de supervivientes
+                distance_km = float(np.linalg.norm(r[row, t_idx] - r1[t0 + t_idx]))
+                hits.append((sel[row], t0 + t_idx, distance_km,
+                             r1[t0 + t_idx], r[row, t_idx]))
+
+            min_dist[sel] = np.minimum(min_dist[sel], dist.min(axis=1))
+            active[sel] = min_dist[sel] < threshold_km + prune_margin_km
+
+        return hits
+
+    def _collision_sweep_cuda(self, satellite1_name: str, check_names: List[str],
+                              days_ahead: int, threshold_km: float,
+                              step_hours: int = 6) -> List[Tuple]:
+        """
+        Barrido de distancias en GPU con cuda_sgp4 + cupy
+
+        Propaga objetivo y candidatos en la GPU (N Satrecs × T tiempos son
+        paralelismo de datos puro) y reduce las distancias con cupy; solo
+        los hits bajo el umbral vuelven a memoria de host.
+
+        Returns:
+            List[Tuple]: Mismo formato que _collision_sweep_cpu
+        """
+        tles = [(self.satellites[name]['line1'], self.satellites[name]['line2'])
+                for name in [satellite1_name] + check_names]
+
+        positions, _ = cuda_sgp4(
+            tle_lines=tles,
+            timestep_length_in_seconds=step_hours * 3600,
+            total_sim_seconds=days_ahead * 86400,
+            start_time=datetime.utcnow(),
+            return_device_arrays=True)
+
+        pos = cp.asarray(positions)            # (N+1, T, 3) en la GPU
+        dist = cp.linalg.norm(pos[1:] - pos[0][None], axis=-1)
+
+        hits = []
+        for sat_idx, t_idx in cp.asnumpy(cp.argwhere(dist < threshold_km)):
+            hits.append((int(sat_idx), int(t_idx),
+                         float(dist[sat_idx, t_idx]),
+                         cp.asnumpy(pos[0, t_idx]),
+                         cp.asnumpy(pos[sat_idx + 1, t_idx])))
+        return hits
+
+    def _min_orbit_distance(self, a1: float, e1: float, a2, e2):
+        """
+        Cota inferior vectorizada de la distancia mínima entre dos órbitas (km)
+
+        Prefiltro estilo MOID: dos planos orbitales no coplanares siempre se
+        cortan en una línea de nodos mutua donde ambas órbitas comparten
+        dirección radial, así que la separación mínima posible queda acotada
+        por la distancia entre sus capas radiales [a(1-e), a(1+e)]. Acepta
+        escalares o arrays NumPy en cualquiera de los argumentos.
+
+        Args:
+            a1, e1: Semieje mayor (km) y excentricidad de la primera órbita
+            a2, e2: Ídem para la(s) segunda(s) órbita(s)
+
+        Returns:
+            Distancia mínima posible entre las órbitas (km, 0 si se solapan)
+        """
+        r1_min, r1_max = a1 * (1.0 - e1), a1 * (1.0 + e1)
+        r2_min, r2_max = a2 * (1.0 - e2), a2 * (1.0 + e2)
+        return np.maximum(np.maximum(r2_min - r1_max, r1_min - r2_max), 0.0)
+
+    def advanced_collision_analysis(self, satellite1_name: str, satellite2_name: str = None,
+                                  threshold_km: float = 10.0, days_ahead: int = 7) -> Dict:
+        """
+        Análisis AVANZADO de colisión con probabilidad estadística real
+        
+        Incluye:
+        - Perturbaciones orbitales (J2, arrastre atmosférico)
+        - Elipsoides de incertidumbre
+        - Probabilidad de colisión estadística
+        - Propagación de incertidumbre
+        
+        Args:
+            satellite1_name: Primer satélite
+            satellite2_name: Segundo satélite (si None, analiza contra muestra)
+            threshold_km: Distancia para análisis detallado
+            days_ahead: Días a analizar
+            
+        Returns:
+            Dict: Análisis probabilístico de colisión
+        """
+        try:
+            if satellite1_name not in self.satellites:
+                return {'error': f'Satélite {satellite1_name} no encontrado'}
+                
+            sat1 = self.satellites[satellite1_name]['satellite']
+            detailed_analysis = []
+            
+            # Determinar satélites para análisis
+            satellites_to_check = {}
+            if satellite2_name:
+                if satellite2_name in self.satellites:
+                    satellites_to_check[satellite2_name] = self.satellites[satellite2_name]
+            else:
+                # Usar muestra más pequeña para análisis detallado
+                sat_names = self._names[:20]
+                for name in sat_names:
+                    if name != satellite1_name:
+                        satellites_to_check[name] = self.satellites[name]
+            
+            print(f"🔬 Análisis avanzado de colisión para {len(satellites_to_check)} satélites...")
+            print("   📊 Calculando perturbaciones orbitales...")
+            print("   🎯 Evaluando probabilidades estadísticas...")
+            
+            # Analizar cada 12 horas (más detallado); el instante de
+            # referencia se calcula una sola vez fuera del bucle
+            now_tt = self.ts.now().tt
+            for hours in range(0, days_ahead * 24, 12):
+                t = self.ts.tt_jd(now_tt + hours / 24)
+                
+                # Posición y velocidad del satélite 1 con perturbaciones
+                pos1_raw = sat1.at(t)
+                
+                # Agregar perturbaciones realistas
+                perturbations1 = self.realistic_propagator.calculate_perturbations(pos1_raw, t)
+                drag1 = self.realistic_propagator.atmospheric_drag(pos1_raw, t)
+                
+                # Calcular altitud para el modelo de incertidumbre
+                altitude1 = np.linalg.norm(pos1_raw.position.km) - 6371
+                
+                for sat2_name, sat2_data in satellites_to_check.items():
+                    sat2 = sat2_data['satellite']
+                    pos2_raw = sat2.at(t)
+                    
+                    # Perturbaciones para satélite 2
+                    perturbations2 = self.realistic_propagator.calculate_perturbations(pos2_raw, t)
+                    drag2 = self.realistic_propagator.atmospheric_drag(pos2_raw, t)
+                    
+                    altitude2 = np.linalg.norm(pos2_raw.position.km) - 6371
+
+                    # Distancia cuadrada sin temporales; la raíz sólo se
+                    # toma para los encuentros que superan el umbral
+                    p1 = pos1_raw.position.km
+                    p2 = pos2_raw.position.km
+                    dist_sq = _d2(p1[0], p1[1], p1[2], p2[0], p2[1], p2[2])
+
+                    if dist_sq < threshold_km ** 2:
+                        distance_km = float(np.sqrt(dist_sq))
+                        # Preparar datos para análisis probabilístico
+                        sat1_data_analysis = {
+                            'position': pos1_raw.position.km,
+                            'velocity': pos1_raw.velocity.km_per_s,
+                            'altitude': altitude1,
+                            'radius': 5.0,  # metros (estimación)
+                            'perturbations': perturbations1 + drag1
+                        }
+                        
+                        sat2_data_analysis = {
+                            'position': pos2_raw.position.km,
+                            'velocity': pos2_raw.velocity.km_per_s,
+                            'altitude': altitude2,
+                            'radius': 5.0,  # metros (estimación)
+                            'perturbations': perturbations2 + drag2
+                        }
+                        
+                        # Calcular probabilidad de colisión avanzada
+                        collision_prob = self.advanced_collision_analyzer.calculate_collision_probability(
+                            sat1_data_analysis, sat2_data_analysis, time_window_hours=24
+                        )
+                        
+                        # Propagar incertidumbre
+                        orbital_period1 = 2 * np.pi * np.sqrt(
+                            (np.linalg.norm(pos1_raw.position.km) * 1000)**3 / 
+                            (3.986004418e14)  # GM de la Tierra
+                        ) / 3600  # convertir a horas
+                        
+                        uncertainty1 = self.uncertainty_model.propagate_uncertainty(
+                            hours, orbital_period1, 'moderate'
+                        )
+                        
+                        detailed_analysis.append({
+                            'datetime': t.utc_datetime(),
+                            'satellite2': sat2_name,
+                            'distance_km': distance_km,
+                            'collision_probability': collision_prob.get('probability', 0),
+                            'miss_distance_km': collision_prob.get('miss_distance_km', distance_km),
+                            'combined_radius_km': collision_prob.get('combined_radius_km', 0.01),
+                            'risk_level': collision_prob.get('risk_level', 'BAJO'),
+                            'uncertainty_ellipsoid': collision_prob.get('uncertainty_ellipsoid'),
+                            'position_uncertainty_km': uncertainty1.get('total_position_uncertainty_km', 0),
+                            'perturbations_applied': True,
+                            'hours_from_now': hours,
+                            'sat1_altitude_km': altitude1,
+                            'sat2_altitude_km': altitude2
+                        })
+            
+            # Estadísticas avanzadas
+            if detailed_analysis:
+                # Encuentro más crítico
+                max_prob_encounter = max(detailed_analysis, key=lambda x: x['collision_probability'])
+                min_distance_encounter = min(detailed_analysis, key=lambda x: x['distance_km'])
+                
+                # Nivel de riesgo global
+                max_probability = max(enc['collision_probability'] for enc in detailed_analysis)
+                min_distance = min(enc['distance_km'] for enc in detailed_analysis)
+                
+                if max_probability > 1e-4 or min_distance < 1.0:
+                    global_risk = 'CRÍTICO'
+                elif max_probability > 1e-6 or min_distance < 5.0:
+                    global_risk = 'ALTO'
+                elif max_probability > 1e-8 or min_distance < 10.0:
+                    global_risk = 'MODERADO'
+                else:
+                    global_risk = 'BAJO'
+            else:
+                max_prob_encounter = None
+                min_distance_encounter = None
+                global_risk = 'BAJO'
+                max_probability = 0
+                min_distance = float('inf')
+            
+            return {
+                'satellite': satellite1_name,
+                'analysis_type': 'AVANZADO_PROBABILÍSTICO',
+                'analysis_period_days': days_ahead,
+                'threshold_km': threshold_km,
+                'detailed_encounters': detailed_analysis,
+                'total_encounters': len(detailed_analysis),
+                'global_risk_level': global_risk,
+                'max_collision_probability': max_probability,
+                'min_distance_km': min_distance,
+                'most_critical_encounter': max_prob_encounter,
+                'closest_encounter': min_distance_encounter,
+                'satellites_analyzed': len(satellites_to_check),
+                'perturbations_included': ['J2', 'atmospheric_drag'],
+                'uncertainty_modeling': True,
+                'statistical_analysis': True
+            }
+            
+        except Exception as e:
+            return {
+                'error': f'Error en análisis avanzado: {str(e)}',
+                'satellite': satellite1_name
+            }
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _maneuver_numeric(v_rel: float, R_req: float, sigma_0: float,
+                          k: float, n: float) -> Tuple:
+        """
+        Parte numérica de calculate_maneuver_time, memorizada por parámetros
+
+        Los escenarios de demostración y las decisiones ISL reutilizan un
+        puñado de combinaciones exactas de parámetros, así que el recálculo
+        completo se reduce a una consulta de caché.
+
+        Returns:
+            Tuple: (t_segundos, numerador, denominador, nivel_criticidad,
+                   sensibilidad, t_conservador, t_agresivo)
+        """
+        t_seconds, numerador, denominador = _maneuver_core(
+            v_rel, R_req, sigma_0, k, n)
+        if denominador <= 0.0:
+            return t_seconds, numerador, denominador, -1, None, None, None
+
+        level = int(np.searchsorted(_MANEUVER_LEVELS_S, t_seconds, side='right'))
+        sens = _maneuver_sensitivity(v_rel, R_req, sigma_0, k, n,
+                                     numerador, denominador)
+
+        d_cons = v_rel - 2 * k
+        t_conservador = (R_req + 2 * sigma_0) / d_cons if d_cons > 0 else None
+        d_agr = v_rel - 1 * k
+        t_agresivo = (R_req + 1 * sigma_0) / d_agr if d_agr > 0 else None
+
+        return t_seconds, numerador, denominador, level, sens, t_conservador, t_agresivo
+
+    def calculate_maneuver_time(self, v_rel: float, R_req: float = 1000.0,
+                              sigma_0: float = 100.0, k: float = 0.001, n: float = 3.0) -> Dict:
+        """
+        Calcular el tiempo necesario para iniciar maniobras de evasión de colisión
+        
+        Basado en la ecuación: t ≥ (R_req + n·σ₀) / (v_rel − n·k)
+        
+        Args:
+            v_rel: Velocidad relativa entre objetos (m/s)
+                  En LEO: ~100 m/s hasta ~14,000 m/s (encuentros frontales)
+            R_req: Distancia de seguridad deseada (m). Ej: 100-1000 m
+            sigma_0: Incertidumbre posicional actual (1-sigma, m)
+            k: Tasa de crecimiento de incertidumbre (m/s)
+            n: Factor de confianza (ej: 3 para 3σ)
+            
+        Returns:
+            Dict: Análisis del tiempo de maniobra
+        """
+        try:
+            # Validar parámetros de entrada
+            if v_rel <= 0:
+                return {'error': 'La velocidad relativa debe ser positiva'}
+            
+            if R_req <= 0:
+                return {'error': 'La distancia de seguridad debe ser positiva'}
+            
+            if sigma_0 < 0:
+                return {'error': 'La incertidumbre posicional no puede ser negativa'}
+            
+            # Núcleo numérico memorizado sobre los argumentos exactos: los
+            # escenarios repetidos (demo, decisiones ISL) llegan con los
+            # mismos floats y son un acierto de caché en vez de un recálculo
+            (t_maneuver_seconds, numerador, denominador, level,
+             sens, t_conservador, t_agresivo) = self._maneuver_numeric(
+                float(v_rel), float(R_req), float(sigma_0), float(k), float(n))
+
+            # Verificar que el denominador sea positivo
+            if denominador <= 0:
+                return {
+                    'error': 'Configuración inválida',
+                    'reason': 'La velocidad relativa es insuficiente comparada con el crecimiento de incertidumbre',
+                    'recommendation': 'Reducir el factor de confianza (n) o mejorar la precisión orbital (reducir k)',
+                    'v_rel': v_rel,
+                    'n_k': n * k,
+                    'deficit': abs(denominador)
+                }
+            
+            # Convertir a diferentes unidades
+            t_minutes = t_maneuver_seconds / 60
+            t_hours = t_minutes / 60
+            t_days = t_hours / 24
+
+            # Criticidad por búsqueda binaria en la escalera de umbrales
+            criticidad = _CRITICALITY_LABELS[level]
+            recomendacion = _CRITICALITY_RECOMMENDATIONS[level]
+
+            # Calcular escenarios alternativos (valores ya memorizados)
+            escenarios = []
+
+            # Escenario conservador (n=2)
+            if n != 2 and t_conservador:
+                escenarios.append({
+                    'nombre': 'Conservador (2σ)',
+                    'tiempo_segundos': t_conservador,
+                    'tiempo_horas': t_conservador / 3600
+                })
+
+            # Escenario agresivo (n=1)
+            if n != 1 and t_agresivo:
+                escenarios.append({
+                    'nombre': 'Agresivo (1σ)',
+                    'tiempo_segundos': t_agresivo,
+                    'tiempo_horas': t_agresivo / 3600
+                })
+
+            # Análisis de sensibilidad (las cuatro variantes vienen del
+            # núcleo compilado, vía la caché)
+            t_high, t_low, t_sigma_high, t_sigma_low = sens
+            sensibilidad = {
+                'impacto_v_rel': {
+                    'descripcion': 'Efecto de ±10% en velocidad relativa',
+                    'v_rel_high': v_rel * 1.1,
+                    't_high': t_high if t_high > 0 else None,
+                    'v_rel_low': v_rel * 0.9,
+                    't_low': t_low if t_low > 0 else None
+                },
+                'impacto_incertidumbre': {
+                    'descripcion': 'Efecto de ±50% en incertidumbre',
+                    'sigma_high': sigma_0 * 1.5,
+                    't_sigma_high': t_sigma_high,
+                    'sigma_low': sigma_0 * 0.5,
+                    't_sigma_low': t_sigma_low
+                }
+            }
+            
+            return {
+                'parametros': {
+                    'v_rel_ms': v_rel,
+                    'R_req_m': R_req,
+                    'sigma_0_m': sigma_0,
+                    'k_ms': k,
+                    'factor_confianza': n
+                },
+                'tiempo_maniobra': {
+                    'segundos': t_maneuver_seconds,
+                    'minutos': t_minutes,
+                    'horas': t_hours,
+                    'dias': t_days
+                },
+                'evaluacion': {
+                    'criticidad': criticidad,
+                    'recomendacion': recomendacion
+                },
+                'componentes_calculo': {
+                    'numerador': numerador,
+                    'denominador': denominador,
+                    'margen_seguridad': denominador - n * k
+                },
+                'escenarios_alternativos': escenarios,
+                'analisis_sensibilidad': sensibilidad,
+                'interpretacion': {
+                    'contexto_leo': self._get_leo_context(v_rel),
+                    'recomendaciones_operacionales': self._get_operational_recommendations(t_hours, v_rel)
+                }
+            }
+            
+        except Exception as e:
+            return {'error': f'Error en cálculo: {str(e)}'}
+    
+    def calculate_maneuver_time_batch(self, v_rel, R_req: float = 1000.0,
+                                      sigma_0: float = 100.0, k: float = 0.001,
+                                      n: float = 3.0) -> Dict:
+        """
+        Versión vectorizada de calculate_maneuver_time para arrays de encuentros
+
+        Evalúa la ecuación t ≥ (R_req + n·σ₀) / (v_rel − n·k) sobre un array
+        completo de velocidades relativas en una sola pasada NumPy, con la
+        criticidad clasificada vía np.searchsorted en lugar del if/elif.
+
+        Args:
+            v_rel: Array (o escalar) de velocidades relativas (m/s)
+            R_req, sigma_0, k, n: Igual que en calculate_maneuver_time
+
+        Returns:
+            Dict: Arrays alineados con v_rel: tiempo_segundos, tiempo_horas,
+                  criticidad, recomendacion y máscara de entradas válidas
+        """
+        v_rel = np.atleast_1d(np.asarray(v_rel, dtype=np.float64))
+        numerador = R_req + n * sigma_0
+        denominador = v_rel - n * k
+
+        validos = (v_rel > 0) & (denominador > 0)
+        t_seconds = np.where(validos, numerador / np.where(validos, denominador, 1.0), np.inf)
+
+        levels = np.searchsorted(_MANEUVER_LEVELS_S, t_seconds, side='right')
+        labels = np.array(_CRITICALITY_LABELS, dtype=object)[levels]
+        recomendaciones = np.array(_CRITICALITY_RECOMMENDATIONS, dtype=object)[levels]
+
+        return {
+            'tiempo_segundos': t_seconds,
+            'tiempo_horas': t_seconds / 3600.0,
+            'criticidad': labels,
+            'recomendacion': recomendaciones,
+            'validos': validos
+        }
+
+    # Clasificación sin ramas: umbrales ordenados + tablas de consulta
+    # indexadas con np.searchsorted (las tuplas se construyen una sola vez)
+    _VREL_BINS = np.array([500.0, 2000.0, 8000.0])
+    _VREL_TYPES = (
+        ("Co-orbital o encuentro suave",
+         "Satélites en órbitas similares con baja velocidad relativa"),
+        ("Encuentro lateral",
+         "Cruce de órbitas con ángulo moderado"),
+        ("Encuentro perpendicular",
+         "Órbitas con planos orbitales diferentes"),
+        ("Encuentro frontal",
+         "Órbitas con inclinaciones opuestas - máximo riesgo")
+    )
+    _THOURS_BINS = np.array([1.0, 6.0, 24.0])
+    _THOURS_RECOMMENDATIONS = (
+        ("🚨 Activar protocolo de emergencia",
+         "📡 Contactar inmediatamente con el centro de control",
+         "⚡ Ejecutar maniobra de emergencia pre-programada",
+         "📊 Monitoreo continuo de telemetría"),
+        ("📋 Preparar plan de maniobra detallado",
+         "🔍 Refinar datos orbitales con mediciones adicionales",
+         "👥 Notificar a otros operadores satelitales",
+         "⚙️ Verificar sistemas de propulsión"),
+        ("📈 Realizar análisis de conjunción detallado",
+         "🛰️ Considerar maniobras coordinadas si aplica",
+         "📡 Incrementar frecuencia de tracking",
+         "💾 Documentar procedimientos para caso similar"),
+        ("🔬 Análisis exhaustivo de múltiples escenarios",
+         "🤝 Coordinación con agencias espaciales",
+         "📊 Optimización de combustible para maniobra",
+         "🎯 Planificación de maniobra de precisión")
+    )
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _leo_context_by_bin(bin_idx: int) -> Tuple[str, str]:
+        """Parte estática del contexto LEO, memorizada por índice de bin"""
+        return SatelliteAnalyzer._VREL_TYPES[bin_idx]
+
+    def _get_leo_context(self, v_rel: float) -> Dict:
+        """Proporcionar contexto específico para órbitas LEO"""
+        idx = int(np.searchsorted(self._VREL_BINS, v_rel, side='right'))
+        tipo_encuentro, descripcion = self._leo_context_by_bin(idx)
+
+        return {
+            'tipo_encuentro': tipo_encuentro,
+            'descripcion': descripcion,
+            'velocidad_relativa_ms': v_rel,
+            'velocidad_relativa_kmh': v_rel * 3.6
+        }
+
+    def _get_operational_recommendations(self, t_hours: float, v_rel: float) -> List[str]:
+        """Generar recomendaciones operacionales específicas"""
+        idx = int(np.searchsorted(self._THOURS_BINS, t_hours, side='right'))
+        recomendaciones = list(self._THOURS_RECOMMENDATIONS[idx])
+
+        # Recomendaciones específicas por velocidad relativa
+        if v_rel > 10000:
+            recomendaciones.append("⚠️ Encuentro de alta velocidad - considerar maniobra temprana")
+        elif v_rel < 500:
+            recomendaciones.append("🔄 Encuentro lento - maniobra de larga duración posible")
+
+        return recomendaciones
+    
+    def _plot_time_vector(self, start_tt: float, offset_days: np.ndarray) -> Time:
+        """
+        Array de tiempos con nutación reducida para bucles de graficado
+
+        El coste dominante de satellite.at() no es SGP4 sino la matriz de
+        nutación IAU2000A que construye el objeto Time; para gráficos a
+        escala de kilómetros el modelo reducido IAU2000B es indistinguible
+        y mucho más barato de evaluar.
+
+        Args:
+            start_tt: Fecha juliana TT inicial
+            offset_days: Desplazamientos en días (escalar o array)
+
+        Returns:
+            Time: Tiempo (vectorial) listo para satellite.at()
+        """
+        t = self.ts.tt_jd(start_tt + offset_days)
+        if IAU2000B_AVAILABLE:
+            t._nutation_angles_radians = iau2000b_radians(t)
+        return t
+
+    def plot_orbit(self, satellite_name: str, hours: int = 24) -> bool:
+        """
+        Visualizar la órbita de un satélite
+        
+        Args:
+            satellite_name: Nombre del satélite
+            hours: Horas de órbita a mostrar
+            
+        Returns:
+            bool: True si el plot fue exitoso
+        """
+        _load_plotting_libs()
+        if satellite_name not in self.satellites:
+            print(f"❌ Satélite {satellite_name} no encontrado")
+            return False
+            
+        satellite = self.satellites[satellite_name]['satellite']
+
+        # Propagación vectorizada: un solo satellite.at() sobre el array de
+        # tiempos en vez de una llamada escalar cada 10 minutos
+        start_time = self.ts.now()
+        minutes = np.arange(0, hours * 60, 10)  # Cada 10 minutos
+        t = self._plot_time_vector(start_time.tt, minutes / (24 * 60))
+
+        # Un único subpoint() alimenta ambos paneles: la conversión de
+        # coordenadas es el coste dominante, no la propagación en sí
+        geocentric = satellite.at(t)
+        subpoint = geocentric.subpoint()
+        # float32 basta de sobra para precisión de píxel y reduce a la
+        # mitad los bytes que copia el renderizador
+        lons = subpoint.longitude.degrees.astype(np.float32, copy=False)
+        lats = subpoint.latitude.degrees.astype(np.float32, copy=False)
+        altitudes = subpoint.elevation.km.astype(np.float32, copy=False)
+
+        # Crear el plot
+        plt.figure(figsize=(15, 8))
+
+        # Subplot 1: Trayectoria en mapa mundial
+        plt.subplot(1, 2, 1)
+        plt.plot(lons, lats, 'b-', linewidth=2, alpha=0.7)
+        plt.scatter(lons[0], lats[0], color='green', s=100,
+                   label='Inicio', zorder=5)
+        plt.scatter(lons[-1], lats[-1], color='red', s=100,
+                   label='Fin', zorder=5)
+        
+        plt.xlim(-180, 180)
+        plt.ylim(-90, 90)
+        plt.xlabel('Longitud (°)')
+        plt.ylabel('Latitud (°)')
+        plt.title(f'Trayectoria Orbital: {satellite_name}\n({hours} horas)')
+        plt.grid(True, alpha=0.3)
+        plt.legend()
+        
+        # Agregar líneas de referencia
+        plt.axhline(y=0, color='k', linestyle='--', alpha=0.3)
+        plt.axvline(x=0, color='k', linestyle='--', alpha=0.3)
+        
+        # Subplot 2: Altitud vs tiempo (derivado de la misma propagación)
+        plt.subplot(1, 2, 2)
+        time_hours = minutes / 60
+        plt.plot(time_hours, altitudes, 'r-', linewidth=2)
+        plt.xlabel('Tiempo (horas)')
+        plt.ylabel('Altitud (km)')
+        plt.title('Variación de Altitud')
+        plt.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        
+        # Guardar el plot
+        filename = f"orbit_{satellite_name.translate(_SAFE_NAME_TABLE)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        plt.savefig(filename, dpi=300, bbox_inches='tight')
+        print(f"📊 Gráfico guardado como: {filename}")
+        
+        plt.show()
+        return True
+    
+    def plot_3d_earth_with_satellites(self, satellite_names: List[str], hours: int = 24,
+                                      interactive: bool = False) -> bool:
+        """
+        Visualización 3D de la Tierra con trayectorias de satélites
+
+        Args:
+            satellite_names: Lista de nombres de satélites a visualizar
+            hours: Horas de órbita a mostrar
+            interactive: Si True, abre la figura en el navegador además
+                        de guardar el HTML (False para uso en lotes)
+
+        Returns:
+            bool: True si la visualización fue exitosa
+        """
+        _load_plotting_libs()
+        if not satellite_names:
+            print("❌ No se proporcionaron nombres de satélites")
+            return False
+        
+        # Verificar que los satélites existen
+        valid_satellites = []
+        for name in satellite_names:
+            if name in self.satellites:
+                valid_satellites.append(name)
+            else:
+                print(f"⚠️  Satélite {name} no encontrado")
+        
+        if not valid_satellites:
+            print("❌ No se encontraron satélites válidos")
+            return False
+        
+        print(f"🌍 Generando visualización 3D para {len(valid_satellites)} satélite(s)...")
+        
+        # Crear figura de Plotly
+        fig = go.Figure()
+        
+        # Agregar la Tierra como una esfera (malla precalculada en __init__)
+        x_earth, y_earth, z_earth = self._earth_mesh
+
+        fig.add_trace(go.Surface(
+            x=x_earth, y=y_earth, z=z_earth,
+            colorscale='Blues',
+            opacity=0.7,
+            name='Tierra',
+            showscale=False,
+            hovertemplate='Tierra<extra></extra>'
+        ))
+        
+        # Colores para diferentes satélites
+        colors = ['red', 'blue', 'green', 'orange', 'purple', 'yellow', 'pink', 'cyan']
+
+        # Malla temporal compartida: cada 15 minutos para mejor rendimiento
+        start_time = self.ts.now()
+        t = self._plot_time_vector(start_time.tt,
+                                   np.arange(0, hours * 60, 15) / (24 * 60))
+
+        # Agregar trayectorias de satélites: una sola traza por satélite,
+        # con marcadores por punto que resaltan inicio (verde) y fin (rojo)
+        for satellite_name, color in zip(valid_satellites, cycle(colors)):
+            satellite = self.satellites[satellite_name]['satellite']
+
+            # Propagación vectorizada de toda la trayectoria → (n_times, 3);
+            # float32 para aligerar la serialización JSON de Plotly
+            positions_3d = satellite.at(t).position.km.T.astype(np.float32, copy=False)
+
+            n_points = len(positions_3d)
+            marker_sizes = [3] * n_points
+            marker_colors = [color] * n_points
+            if n_points:
+                marker_sizes[0], marker_sizes[-1] = 8, 8
+                marker_colors[0], marker_colors[-1] = 'lightgreen', 'darkred'
+
+            fig.add_trace(go.Scatter3d(
+                x=positions_3d[:, 0],
+                y=positions_3d[:, 1],
+                z=positions_3d[:, 2],
+                mode='lines+markers',
+                line=dict(color=color, width=4),
+                marker=dict(size=marker_sizes, color=marker_colors),
+                name=f'{satellite_name}',
+                hovertemplate=f'<b>{satellite_name}</b><br>' +
+                            'X: %{x:.1f} km<br>' +
+                            'Y: %{y:.1f} km<br>' +
+                            'Z: %{z:.1f} km<extra></extra>'
+            ))
+        
+        # Configurar el layout
+        fig.update_layout(
+            title=f'🛰️ Visualización 3D: Satélites alrededor de la Tierra<br>' +
+                  f'<sub>Trayectorias de {hours} horas - {len(valid_satellites)} satélite(s)</sub>',
+            scene=dict(
+                xaxis_title='X (km)',
+                yaxis_title='Y (km)',
+                zaxis_title='Z (km)',
+                aspectmode='cube',
+                camera=dict(
+                    eye=dict(x=2, y=2, z=2)
+                ),
+                bgcolor='black'
+            ),
+            font=dict(size=12),
+            width=1000,
+            height=800,
+            margin=dict(l=0, r=0, t=50, b=0)
+        )
+        
+        # Mostrar la visualización sólo en uso interactivo
+        if interactive:
+            fig.show()
+
+        # Guardar como HTML interactivo; el bundle de Plotly se carga
+        # desde CDN en vez de incrustarse (~3 MB menos por archivo)
+        filename = f"satellite_3d_visualization_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+        fig.write_html(filename, include_plotlyjs='cdn', full_html=True)
+        print(f"🌍 Visualización 3D guardada como: {filename}")
+        
+        return True
+    
+    def plot_orbital_animation(self, satellite_name: str, hours: int = 24, frames: int = 100,
+                               mode: str = 'both') -> bool:
+        """
+        Crear una animación de la órbita del satélite alrededor de la Tierra
+
+        Args:
+            satellite_name: Nombre del satélite
+            hours: Horas de órbita a animar
+            frames: Número de frames en la animación
+            mode: 'show' (sólo navegador), 'save' (sólo HTML) o 'both'
+                  (serializa una vez y abre el archivo guardado)
+
+        Returns:
+            bool: True si la animación fue exitosa
+        """
+        _load_plotting_libs()
+        try:
+            if satellite_name not in self.satellites:
+                print(f"❌ Satélite {satellite_name} no encontrado")
+                return False
+            
+            satellite = self.satellites[satellite_name]['satellite']
+            print(f"🎬 Generando animación orbital para {satellite_name}...")
+            print(f"⏱️  Calculando {frames} posiciones para {hours} horas...")
+            
+            # Calcular todas las posiciones con una sola propagación
+            # vectorizada sobre el array de tiempos → (frames+1, 3)
+            start_time = self.ts.now()
+            t = self._plot_time_vector(start_time.tt,
+                                       np.linspace(0, hours / 24, frames + 1))
+            all_positions = satellite.at(t).position.km.T
+            print(f"✅ Posiciones calculadas")
+            
+            # La Tierra como malla triangulada precalculada: el navegador
+            # recibe los triángulos listos en vez de una rejilla
+            x_earth, y_earth, z_earth, tri_i, tri_j, tri_k = _EARTH_MESH3D_30
+
+            # Estilos compartidos entre las trazas base y los frames
+            traj_style = {
+                'type': 'scatter3d',
+                'mode': 'lines',
+                'line': {'color': 'red', 'width': 6},
+                'name': 'Trayectoria',
+                'hovertemplate': 'Trayectoria<extra></extra>'
+            }
+            marker_style = {
+                'type': 'scatter3d',
+                'mode': 'markers',
+                'marker': {'size': 12, 'color': 'yellow', 'symbol': 'circle'},
+                'name': 'Satélite',
+                'hovertemplate': f'{satellite_name}<br>X: %{{x:.1f}} km<br>Y: %{{y:.1f}} km<br>Z: %{{z:.1f}} km<extra></extra>'
+            }
+
+            # Frames como dicts con vistas NumPy sobre all_positions: los
+            # índices 1 y 2 (trayectoria y satélite) se actualizan y la
+            # Tierra queda intacta. Máximo 20 frames para mejor rendimiento
+            step = max(1, frames // 20)
+            frame_idx = np.arange(0, frames + 1, step)
+            frames_list = [
+                {
+                    'name': str(i),
+                    'traces': [1, 2],
+                    'data': [
+                        dict(traj_style,
+                             x=all_positions[:i + 1, 0],
+                             y=all_positions[:i + 1, 1],
+                             z=all_positions[:i + 1, 2]),
+                        dict(marker_style,
+                             x=all_positions[i:i + 1, 0],
+                             y=all_positions[i:i + 1, 1],
+                             z=all_positions[i:i + 1, 2])
+                    ]
+                }
+                for i in frame_idx
+            ]
+            print(f"🎞️  {len(frames_list)} frames de animación creados")
+
+            # Figura completa como un único dict: una sola pasada de
+            # validación en el constructor en vez de una por add_trace
+            fig_dict = {
+                'data': [
+                    {
+                        'type': 'mesh3d',
+                        'x': x_earth, 'y': y_earth, 'z': z_earth,
+                        'i': tri_i, 'j': tri_j, 'k': tri_k,
+                        'color': 'royalblue',
+                        'opacity': 0.8,
+                        'name': 'Tierra',
+                        'hovertemplate': 'Tierra<extra></extra>'
+                    },
+                    dict(traj_style,
+                         x=all_positions[:1, 0],
+                         y=all_positions[:1, 1],
+                         z=all_positions[:1, 2]),
+                    dict(marker_style,
+                         x=all_positions[:1, 0],
+                         y=all_positions[:1, 1],
+                         z=all_positions[:1, 2])
+                ],
+                'layout': {
+                    'title': f'🎬 Animación Orbital: {satellite_name}<br><sub>Período: {hours} horas | Frames: {len(frames_list)}</sub>',
+                    'scene': {
+                        'xaxis': {'title': 'X (km)'},
+                        'yaxis': {'title': 'Y (km)'},
+                        'zaxis': {'title': 'Z (km)'},
+                        'aspectmode': 'cube',
+                        'camera': {'eye': {'x': 2.5, 'y': 2.5, 'z': 2.5}},
+                        'bgcolor': 'black'
+                    },
+                    'font': {'size': 12},
+                    'width': 1000,
+                    'height': 700,
+                    'updatemenus': [{
+                        'type': 'buttons',
+                        'showactive': False,
+                        'x': 0.1,
+                        'y': 0.02,
+                        'buttons': [
+                            {
+                                'label': '▶️ Reproducir',
+                                'method': 'animate',
+                                'args': [None, {
+                                    'frame': {'duration': 200, 'redraw': True},
+                                    'fromcurrent': True,
+                                    'transition': {'duration': 100}
+                                }]
+                            },
+                            {
+                                'label': '⏸️ Pausar',
+                                'method': 'animate',
+                                'args': [[None], {
+                                    'frame': {'duration': 0, 'redraw': False},
+                                    'mode': 'immediate',
+                                    'transition': {'duration': 0}
+                                }]
+                            },
+                            {
+                                'label': '🔄 Reiniciar',
+                                'method': 'animate',
+                                'args': [None, {
+                                    'frame': {'duration': 200, 'redraw': True},
+                                    'mode': 'immediate',
+                                    'transition': {'duration': 0}
+                                }]
+                            }
+                        ]
+                    }],
+                    'sliders': [{
+                        'active': 0,
+                        'yanchor': 'top',
+                        'xanchor': 'left',
+                        'currentvalue': {
+                            'font': {'size': 20},
+                            'prefix': 'Frame:',
+                            'visible': True,
+                            'xanchor': 'right'
+                        },
+                        'transition': {'duration': 100, 'easing': 'cubic-in-out'},
+                        'pad': {'b': 10, 't': 50},
+                        'len': 0.9,
+                        'x': 0.1,
+                        'y': 0,
+                        'steps': [
+                            {
+                                'args': [[str(i)], {
+                                    'frame': {'duration': 100, 'redraw': True},
+                                    'mode': 'immediate',
+                                    'transition': {'duration': 100}
+                                }],
+                                'label': str(i),
+                                'method': 'animate'
+                            } for i in frame_idx
+                        ]
+                    }]
+                },
+                'frames': frames_list
+            }
+
+            fig = go.Figure(fig_dict, skip_invalid=True)
+            print(f"🎨 Configuración de animación completada")
+
+            if mode == 'show':
+                # Sólo navegador: sin segunda serialización a disco
+                print(f"🌐 Abriendo animación en el navegador...")
+                fig.show()
+                return True
+
+            # Guardar como HTML: la figura se serializa una única vez;
+            # plotly.js desde CDN (no incrusta ~3 MB por animación) y
+            # rasterización WebGL a ratio 1: resolución por rendimiento
+            safe_name = satellite_name.translate(_SAFE_NAME_TABLE)
+            filename = f"animacion_orbital_{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+            fig.write_html(filename, include_plotlyjs='cdn', full_html=True,
+                           auto_play=False,
+                           config={'plotGlPixelRatio': 1})
+            print(f"💾 Animación guardada como: {filename}")
+            print(f"📁 Ubicación: {os.path.abspath(filename)}")
+
+            if mode == 'both':
+                # Reutilizar el HTML recién escrito en vez de que
+                # fig.show() vuelva a codificar la figura completa
+                print(f"🌐 Abriendo animación en el navegador...")
+                webbrowser.open('file://' + os.path.abspath(filename))
+
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error creando animación: {str(e)}")
+            print(f"💡 Sugerencias:")
+            print(f"   1. Verifica que el nombre del satélite sea correcto")
+            print(f"   2. Intenta con menos frames (ej: 20-30)")
+            print(f"   3. Reduce las horas (ej: 2-6 horas)")
+            return False
+
+
+    def comprehensive_collision_analysis(self, satellite1_name: str, satellite2_name: str = None,
+                                       threshold_km: float = 10.0, days_ahead: int = 7) -> Dict:
+        """
+        Análisis completo de colisión incluyendo cálculo de tiempo de maniobra
+        
+        Args:
+            satellite1_name: Primer satélite a analizar
+            satellite2_name: Segundo satélite (si None, analiza contra muestra)
+            threshold_km: Distancia mínima para considerar riesgo (km)
+            days_ahead: Días a analizar hacia el futuro
+            
+        Returns:
+            Dict: Análisis completo de colisión y tiempo de maniobra
+        """
+        print(f"🔍 Iniciando análisis completo de colisión para {satellite1_name}...")
+        
+        # Realizar análisis de colisión básico
+        collision_analysis = self.analyze_collision_risk(
+            satellite1_name, satellite2_name, threshold_km, days_ahead
+        )
+        
+        if 'error' in collision_analysis:
+            return collision_analysis
+        
+        # Si hay encuentros cercanos, calcular parámetros de maniobra
+        maneuver_analyses = []
+        
+        if collision_analysis['close_encounters']:
+            print(f"⚠️  {len(collision_analysis['close_encounters'])} encuentros cercanos detectados")
+            
+            for encounter in collision_analysis['close_encounters'][:5]:  # Analizar los primeros 5
+                # Calcular velocidad relativa estimada para el encuentro
+                sat1_pos = np.array(encounter['satellite1_pos'])
+                sat2_pos = np.array(encounter['satellite2_pos'])
+                distance_km = encounter['distance_km']
+                
+                # Estimar velocidad relativa basada en la órbita LEO típica
+                # Para satélites LEO: velocidad orbital ~7.8 km/s
+                orbital_velocity = 7800  # m/s
+                
+                # Estimar velocidad relativa basada en el tipo de encuentro
+                if distance_km < 1:
+                    # Encuentro muy cercano, probablemente frontal
+                    v_rel_estimate = orbital_velocity * 1.8  # ~14,000 m/s
+                elif distance_km < 5:
+                    # Encuentro cercano, ángulo moderado  
+                    v_rel_estimate = orbital_velocity * 1.2  # ~9,400 m/s
+                else:
+                    # Encuentro lejano, paralelo
+                    v_rel_estimate = orbital_velocity * 0.2  # ~1,560 m/s
+                
+                # Parámetros típicos para análisis
+                params_scenarios = [
+                    {
+                        'nombre': 'Conservador',
+                        'R_req': 1000,  # 1 km de seguridad
+                        'sigma_0': 200,  # 200 m de incertidumbre
+                        'k': 0.002,     # Crecimiento moderado
+                        'n': 3          # 3 sigma
+                    },
+                    {
+                        'nombre': 'Estándar',
+                        'R_req': 500,   # 500 m de seguridad
+                        'sigma_0': 100,  # 100 m de incertidumbre
+                        'k': 0.001,     # Crecimiento normal
+                        'n': 2.5        # 2.5 sigma
+                    },
+                    {
+                        'nombre': 'Agresivo',
+                        'R_req': 200,   # 200 m de seguridad
+                        'sigma_0': 50,   # 50 m de incertidumbre
+                        'k': 0.0005,    # Bajo crecimiento
+                        'n': 2          # 2 sigma
+                    }
+                ]
+                
+                encounter_maneuvers = []
+                
+                for scenario in params_scenarios:
+                    maneuver_calc = self.calculate_maneuver_time(
+                        v_rel=v_rel_estimate,
+                        R_req=scenario['R_req'],
+                        sigma_0=scenario['sigma_0'],
+                        k=scenario['k'],
+                        n=scenario['n']
+                    )
+                    
+                    if 'error' not in maneuver_calc:
+                        encounter_maneuvers.append({
+                            'escenario': scenario['nombre'],
+                            'parametros': scenario,
+                            'tiempo_maniobra': maneuver_calc['tiempo_maniobra'],
+                            'criticidad': maneuver_calc['evaluacion']['criticidad'],
+                            'recomendacion': maneuver_calc['evaluacion']['recomendacion']
+                        })
+                
+                fecha = encounter['datetime'].strftime('%Y-%m-%d %H:%M:%S UTC')
+                maneuver_analyses.append({
+                    'encuentro': {
+                        'fecha': fecha,
+                        'satelite_2': encounter['satellite2'],
+                        'distancia_km': distance_km,
+                        'velocidad_relativa_estimada': v_rel_estimate
+                    },
+                    'analisis_maniobra': encounter_maneuvers,
+                    # Resumen preformateado en el momento del análisis (con
+                    # los datos calientes en caché): la pantalla sólo lo
+                    # imprime sin volver a formatear campo a campo
+                    'resumen': (f"Encuentro: {fecha}\n"
+                                f"      Con: {encounter['satellite2']}\n"
+                                f"      Distancia: {distance_km:.2f} km\n"
+                                f"      V_rel estimada: {v_rel_estimate:.0f} m/s")
+                })
+        
+        # Generar recomendaciones generales
+        recomendaciones_generales = self._generate_general_recommendations(
+            collision_analysis, maneuver_analyses
+        )
+        
+        # Calcular tiempo hasta primer encuentro
+        tiempo_primer_encuentro = None
+        if collision_analysis['close_encounters']:
+            primer_encuentro = min(collision_analysis['close_encounters'], 
+                                 key=lambda x: x['datetime'])
+            tiempo_primer_encuentro = {
+                'fecha': primer_encuentro['datetime'],
+                'horas_restantes': (primer_encuentro['datetime'] - datetime.now()).total_seconds() / 3600,
+                'distancia_km': primer_encuentro['distance_km']
+            }
+        
+        return {
+            'analisis_colision': collision_analysis,
+            'analisis_maniobras': maneuver_analyses,
+            'tiempo_primer_encuentro': tiempo_primer_encuentro,
+            'recomendaciones_generales': recomendaciones_generales,
+            'resumen_ejecutivo': self._generate_executive_summary(
+                collision_analysis, maneuver_analyses, tiempo_primer_encuentro
+            )
+        }
+    
+    def _generate_general_recommendations(self, collision_analysis: Dict, 
+                                        maneuver_analyses: List[Dict]) -> List[str]:
+        """Generar recomendaciones generales basadas en el análisis"""
+        recommendations = []
+        
+        risk_level = collision_analysis.get('risk_level', 'BAJO')
+        total_encounters = collision_analysis.get('total_encounters', 0)
+        
+        if risk_level == 'CRÍTICO':
+            recommendations.extend([
+                "🚨 ALERTA CRÍTICA: Implementar protocolo de emergencia inmediatamente",
+                "📡 Establecer comunicación continua con centros de control",
+                "⚡ Preparar maniobra de emergencia automática",
+                "🎯 Considerar múltiples opciones de maniobra"
+            ])
+        elif risk_level == 'ALTO':
+            recommendations.extend([
+                "⚠️ RIESGO ALTO: Planificar maniobra en las próximas 24 horas",
+                "📊 Refinar datos orbitales con tracking adicional",
+                "🤝 Coordinar con otros operadores si es necesario",
+                "📋 Preparar plan de contingencia"
+            ])
+        elif risk_level == 'MEDIO':
+            recommendations.extend([
+                "🟡 RIESGO MEDIO: Monitoreo incrementado requerido",
+                "📈 Análisis detallado de conjunción",
+                "🔍 Evaluación de opciones de maniobra",
+                "📅 Planificación preventiva"
+            ])
+        
+        if total_encounters > 3:
+            recommendations.append(f"📊 Múltiples encuentros ({total_encounters}) - considerar cambio orbital mayor")
+        
+        if maneuver_analyses:
+            min_time = min([
+                min([m['tiempo_maniobra']['horas'] for m in analysis['analisis_maniobra']])
+                for analysis in maneuver_analyses if analysis['analisis_maniobra']
+            ], default=float('inf'))
+            
+            if min_time < 1:
+                recommendations.append("⏰ Tiempo de maniobra < 1 hora - Acción inmediata requerida")
+            elif min_time < 6:
+                recommendations.append("⏰ Tiempo de maniobra < 6 horas - Preparación urgente")
+        
+        return recommendations
+    
+    def _generate_executive_summary(self, collision_analysis: Dict, 
+                                  maneuver_analyses: List[Dict], 
+                                  primer_encuentro: Dict) -> Dict:
+        """Generar resumen ejecutivo del análisis"""
+        
+        summary = {
+            'satelite': collision_analysis.get('satellite', 'Desconocido'),
+            'nivel_riesgo': collision_analysis.get('risk_level', 'BAJO'),
+            'total_encuentros': collision_analysis.get('total_encounters', 0),
+            'periodo_analisis_dias': collision_analysis.get('analysis_period_days', 0)
+        }
+        
+        if primer_encuentro:
+            summary['primer_encuentro'] = {
+                'tiempo_horas': primer_encuentro['horas_restantes'],
+                'distancia_km': primer_encuentro['distancia_km'],
+                'fecha': primer_encuentro['fecha'].strftime('%Y-%m-%d %H:%M UTC')
+            }
+        
+        if maneuver_analyses:
+            # Tiempos de maniobra de todos los escenarios en un solo array:
+            # min/max/media salen de una pasada NumPy en vez de tres bucles
+            tiempos = np.fromiter(
+                (maneuver['tiempo_maniobra']['horas']
+                 for analysis in maneuver_analyses
+                 for maneuver in analysis['analisis_maniobra']),
+                dtype=np.float64)
+
+            if len(tiempos):
+                summary['tiempo_maniobra'] = {
+                    'minimo_horas': float(tiempos.min()),
+                    'maximo_horas': float(tiempos.max()),
+                    'promedio_horas': float(tiempos.mean())
+                }
+        
+        # Determinar acción recomendada
+        if summary['nivel_riesgo'] == 'CRÍTICO':
+            summary['accion_recomendada'] = "MANIOBRA INMEDIATA"
+        elif summary['nivel_riesgo'] == 'ALTO':
+            summary['accion_recomendada'] = "PREPARAR MANIOBRA URGENTE"
+        elif summary['nivel_riesgo'] == 'MEDIO':
+            summary['accion_recomendada'] = "MONITOREO INCREMENTADO"
+        else:
+            summary['accion_recomendada'] = "SEGUIMIENTO RUTINARIO"
+        
+        return summary
+    
+    def find_collision_cases(self, threshold_km: float = 50.0, days_ahead: int = 7, 
+                           max_satellites: int = 500) -> List[Dict]:
+        """
+        Buscar casos reales de colisión entre satélites
+        Función específica para encontrar encuentros cercanos reales
+        
+        Args:
+            threshold_km: Distancia máxima para considerar encuentro cercano
+            days_ahead: Días a analizar
+            max_satellites: Máximo número de satélites a analizar
+            
+        Returns:
+            List[Dict]: Lista de casos de colisión encontrados
+        """
+        print(f"🔍 BÚSQUEDA EXHAUSTIVA DE CASOS DE COLISIÓN")
+        print(f"📊 Analizando hasta {max_satellites} satélites...")
+        print(f"📏 Umbral: {threshold_km} km | 📅 Período: {days_ahead} días")
+        print("-" * 60)
+        
+        collision_cases = []
+        # El índice de nombres ya está materializado (se reconstruye al
+        # recargar TLEs): evita copiar el catálogo completo en cada llamada
+        sample_size = min(max_satellites, len(self._names))
+        sample_satellites = self._names[:sample_size]
+        
+        now_tt = self.ts.now().tt  # instante de referencia, calculado una vez
+
+        # Malla temporal compartida: cada 2 horas durante todo el período,
+        # construida una sola vez para todos los pares
+        hours_arr = np.arange(0, days_ahead * 24, 2)
+        t_arr = self.ts.tt_jd(now_tt + hours_arr / 24.0)
+
+        # Prefiltro sin propagación: bandas perigeo/apogeo derivadas de los
+        # elementos TLE ya indexados (r = a·(1∓e)). Un satélite cuya banda
+        # no solapa la de ningún otro no puede acercarse al umbral, así que
+        # ni siquiera entra a SGP4
+        if self._orb and len(sample_satellites) > 1:
+            rows = np.array([self._orb_index.get(name, -1)
+                             for name in sample_satellites])
+            known = rows >= 0
+            a = np.where(known, self._orb['a'][rows], np.nan)
+            ecc = np.where(known, self._orb['ecc'][rows], np.nan)
+            perigee_r = a * (1.0 - ecc)
+            apogee_r = a * (1.0 + ecc)
+            band_overlap = ((apogee_r[:, None] + threshold_km >= perigee_r[None, :]) &
+                            (perigee_r[:, None] <= apogee_r[None, :] + threshold_km))
+            np.fill_diagonal(band_overlap, False)
+            keep = band_overlap.any(axis=1) | ~known  # sin elementos: se conserva
+            if not keep.all():
+                sample_satellites = [name for name, k
+                                     in zip(sample_satellites, keep) if k]
+                print(f"📊 Prefiltro TLE: {len(sample_satellites)} satélites con bandas de altitud compatibles")
+
+        # Propagación por lotes en formato SoA: un solo SatrecArray.sgp4
+        # sobre todo el período produce el tensor (N, n_times, 3) sin
+        # bucles Python por satélite. Las distancias mutuas son idénticas
+        # en TEME e ITRF (la rotación terrestre es ortogonal), así que no
+        # hace falta cambiar de marco
+        names = []
+        models = []
+        for sat_name in sample_satellites:
+            try:
+                models.append(self._get_satrec(sat_name))
+                names.append(sat_name)
+            except Exception:
+                continue  # TLE problemático: se excluye de la búsqueda
+
+        if not models:
+            print(f"✅ Búsqueda completada. Casos encontrados: 0")
+            return collision_cases
+
+        fr, jd = np.modf(t_arr.ut1)
+        n_workers = os.cpu_count() or 1
+        if n_workers > 1 and len(models) >= 4 * n_workers:
+            # Propagación repartida entre procesos: SGP4 es aritmética
+            # independiente por satélite, así que cada trabajador propaga
+            # un bloque de TLEs y sólo las posiciones vuelven al principal
+            tle_pairs = [(self.satellites[name]['line1'],
+                          self.satellites[name]['line2']) for name in names]
+            bounds = np.linspace(0, len(tle_pairs), n_workers + 1, dtype=int)
+            chunks = [(tle_pairs[lo:hi], jd, fr)
+                      for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+            with multiprocessing.Pool(len(chunks)) as pool:
+                parts = pool.starmap(_propagate_tle_chunk, chunks)
+            errors = np.concatenate([part[0] for part in parts])
+            r_teme = np.concatenate([part[1] for part in parts])
+        else:
+            errors, r_teme, _ = SatrecArray(models).sgp4(jd, fr)
+
+        # Conservar sólo satélites propagables en toda la ventana
+        ok = ~(errors != 0).any(axis=1)
+        P = np.ascontiguousarray(r_teme[ok])  # (N, n_times, 3)
+        names = [name for name, good in zip(names, ok) if good]
+
+        if not len(P):
+            print(f"✅ Búsqueda completada. Casos encontrados: 0")
+            return collision_cases
+
+        # Prefiltro de capas radiales: sólo los pares cuyas envolventes
+        # [r_min, r_max] se solapan (con margen del umbral) pueden acercarse
+        radii = np.sqrt(np.einsum('ntk,ntk->nt', P, P))
+        r_min = radii.min(axis=1)
+        r_max = radii.max(axis=1)
+        overlap = ((r_max[:, None] + threshold_km >= r_min[None, :]) &
+                   (r_min[:, None] <= r_max[None, :] + threshold_km))
+        overlap &= np.triu(np.ones_like(overlap), k=1)  # cada par una sola vez
+        pairs = np.argwhere(overlap)
+
+        print(f"📊 Pares candidatos tras prefiltro: {len(pairs)} de {len(names) * (len(names) - 1) // 2}")
+
+        threshold_sq = threshold_km ** 2
+
+        if NUMBA_AVAILABLE and len(pairs):
+            # Núcleo compilado: prange sobre los pares candidatos, con
+            # salidas preasignadas (sin objetos Python en el bucle caliente)
+            hit_i, hit_j, hit_t, hit_d = _pair_scan(
+                P, np.ascontiguousarray(pairs), float(threshold_km))
+            hits = list(zip(hit_i, hit_j, hit_t, hit_d))
+        elif CKDTREE_AVAILABLE:
+            # Índice espacial por época: el KD-tree reduce el cruce N×N a
+            # N·log N y devuelve directamente los pares bajo el umbral
+            hits = []
+            for t_idx in range(P.shape[1]):
+                snapshot = P[:, t_idx, :]
+                tree = cKDTree(snapshot)
+                for i, j in tree.query_pairs(r=threshold_km, output_type='ndarray'):
+                    diff = snapshot[i] - snapshot[j]
+                    hits.append((i, j, t_idx, np.sqrt(diff @ diff)))
+                if len(hits) >= 5:
+                    break
+        else:
+            hits = []
+            for pair_idx, (i, j) in enumerate(pairs):
+                if pair_idx % 5000 == 0 and pair_idx:
+                    progress = (pair_idx / len(pairs)) * 100
+                    print(f"📈 Progreso: {progress:.1f}% ({pair_idx}/{len(pairs)}) - Casos encontrados: {len(hits)}")
+
+                # Distancias cuadradas de todo el período en una sola
+                # pasada; el caso común (sin aciertos) no toca Python
+                d2 = ((P[i] - P[j]) ** 2).sum(-1)
+                hit_t = np.nonzero(d2 < threshold_sq)[0]
+                for idx in hit_t:
+                    hits.append((i, j, idx, np.sqrt(d2[idx])))
+
+                # Parada temprana a granularidad de par, no por instante
+                if len(hits) >= 5:
+                    break
+
+        for i, j, idx, dist in hits:
+            # ¡Encontramos un caso de colisión!
+            i, j, idx = int(i), int(j), int(idx)
+            distance_km = float(dist)
+            t = t_arr[idx]
+            collision_cases.append({
+                'satellite1': names[i],
+                'satellite2': names[j],
+                'datetime': t.utc_datetime(),
+                'distance_km': distance_km,
+                'hours_from_now': int(hours_arr[idx]),
+                'satellite1_pos': P[i, idx],
+                'satellite2_pos': P[j, idx],
+                'relative_velocity_estimated': self._estimate_relative_velocity(
+                    P[i, idx], P[j, idx], distance_km
+                )
+            })
+
+            print(f"🚨 CASO ENCONTRADO: {names[i]} vs {names[j]}")
+            print(f"   📅 {t.utc_datetime().strftime('%Y-%m-%d %H:%M')} UTC")
+            print(f"   📏 Distancia: {distance_km:.2f} km")
+
+            # Si encontramos varios casos, no necesitamos más
+            if len(collision_cases) >= 5:
+                print(f"✅ Suficientes casos encontrados. Deteniendo búsqueda.")
+                return collision_cases
+        
+        print(f"✅ Búsqueda completada. Casos encontrados: {len(collision_cases)}")
+        return collision_cases
+    
+    def _estimate_relative_velocity(self, pos1: np.ndarray, pos2: np.ndarray,
+                                  distance_km: float) -> float:
+        """Estimar velocidad relativa basada en posiciones y distancia"""
+        return _rel_velocity_estimate(float(distance_km))
+    
+    def demonstrate_collision_case(self) -> None:
+        """
+        Demostrar un caso de colisión encontrado con análisis completo
+        """
+        print("🔍 DEMOSTRACIÓN DE CASO DE COLISIÓN REAL")
+        print("=" * 60)
+        
+        # Buscar casos de colisión
+        cases = self.find_collision_cases(threshold_km=100, days_ahead=3, max_satellites=200)
+        
+        if not cases:
+            print("❌ No se encontraron casos de colisión en la muestra analizada")
+            print("💡 Esto puede ocurrir porque:")
+            print("   • Los satélites están bien separados")
+            print("   • La muestra analizada es pequeña")
+            print("   • Los umbrales son muy estrictos")
+            print("\n🎭 Generando caso simulado para demostración...")
+            
+            # Crear un caso simulado basado en datos reales
+            self._create_simulated_case()
+            return
+        
+        # Analizar el primer caso encontrado
+        case = cases[0]
+        print(f"\n🚨 CASO DE COLISIÓN DETECTADO:")
+        print(f"🛰️  Satélite 1: {case['satellite1']}")
+        print(f"🛰️  Satélite 2: {case['satellite2']}")
+        print(f"📅 Fecha/Hora: {case['datetime'].strftime('%Y-%m-%d %H:%M')} UTC")
+        print(f"📏 Distancia: {case['distance_km']:.2f} km")
+        print(f"⏰ En: {case['hours_from_now']} horas")
+        
+        # Calcular tiempo de maniobra para este caso
+        v_rel = case['relative_velocity_estimated']
+        print(f"\n⚡ ANÁLISIS DE TIEMPO DE MANIOBRA:")
+        print(f"🚀 Velocidad relativa estimada: {v_rel:.0f} m/s")
+        
+        # Varios escenarios de maniobra
+        scenarios = [
+            {'name': 'Conservador', 'R_req': 2000, 'sigma_0': 200, 'k': 0.002, 'n': 3},
+            {'name': 'Estándar', 'R_req': 1000, 'sigma_0': 100, 'k': 0.001, 'n': 2.5},
+            {'name': 'Agresivo', 'R_req': 500, 'sigma_0': 50, 'k': 0.0008, 'n': 2}
+        ]
+        
+        print(f"\n📊 ESCENARIOS DE MANIOBRA:")
+        for scenario in scenarios:
+            result = self.calculate_maneuver_time(
+                v_rel=v_rel,
+                R_req=scenario['R_req'],
+                sigma_0=scenario['sigma_0'],
+                k=scenario['k'],
+                n=scenario['n']
+            )
+            
+            if 'error' not in result:
+                tiempo = result['tiempo_maniobra']
+                print(f"   • {scenario['name']}: {tiempo['horas']:.2f} horas")
+                print(f"     {result['evaluacion']['criticidad']}")
+            else:
+                print(f"   • {scenario['name']}: {result['error']}")
+        
+        # Mostrar todos los casos encontrados
+        if len(cases) > 1:
+            print(f"\n📋 OTROS CASOS DETECTADOS:")
+            for i, other_case in enumerate(cases[1:], 2):
+                print(f"   {i}. {other_case['satellite1']} vs {other_case['satellite2']}")
+                print(f"      📅 {other_case['datetime'].strftime('%Y-%m-%d %H:%M')} UTC")
+                print(f"      📏 {other_case['distance_km']:.2f} km")
+    
+    def _create_simulated_case(self) -> None:
+        """Crear un caso simulado basado en satélites reales"""
+        print("🎭 CASO SIMULADO DE DEMOSTRACIÓN:")
+        print("=" * 50)
+        
+        # Usar satélites reales para crear escenario creíble: el índice de
+        # nombres cacheado evita copiar el catálogo sólo para dos posiciones
+        satellite_names = self._names
+        sat1 = satellite_names[10] if len(satellite_names) > 10 else satellite_names[0]
+        sat2 = satellite_names[50] if len(satellite_names) > 50 else satellite_names[1]
+        
+        import datetime
+        future_time = datetime.datetime.now() + datetime.timedelta(hours=28, minutes=45)
+        
+        print(f"🛰️  Satélite 1: {sat1}")
+        print(f"🛰️  Satélite 2: {sat2}")
+        print(f"📅 Encuentro proyectado: {future_time.strftime('%Y-%m-%d %H:%M')} UTC")
+        print(f"📏 Distancia mínima estimada: 15.3 km")
+        print(f"🚀 Velocidad relativa: 8,200 m/s")
+        print(f"⏰ Tiempo hasta encuentro: 28.75 horas")
+        
+        print(f"\n⚡ ANÁLISIS DE TIEMPO DE MANIOBRA:")
+        result = self.calculate_maneuver_time(
+            v_rel=8200,
+            R_req=1000,
+            sigma_0=120,
+            k=0.001,
+            n=3
+        )
+        
+        if 'error' not in result:
+            tiempo = result['tiempo_maniobra']
+            print(f"⏰ Tiempo de maniobra requerido: {tiempo['horas']:.2f} horas")
+            print(f"{result['evaluacion']['criticidad']}")
+            print(f"💡 {result['evaluacion']['recomendacion']}")
+            
+            print(f"\n📊 EVALUACIÓN:")
+            tiempo_disponible = 28.75
+            tiempo_requerido = tiempo['horas']
+            
+            if tiempo_disponible > tiempo_requerido:
+                margen = tiempo_disponible - tiempo_requerido
+                print(f"✅ MARGEN SEGURO: {margen:.1f} horas disponibles")
+                print(f"🎯 Ejecutar maniobra antes de: {(future_time - datetime.timedelta(hours=tiempo_requerido)).strftime('%Y-%m-%d %H:%M')} UTC")
+            else:
+                deficit = tiempo_requerido - tiempo_disponible
+                print(f"🚨 SITUACIÓN CRÍTICA: Déficit de {deficit:.1f} horas")
+                print(f"⚡ Maniobra inmediata requerida")
+        
+        print(f"\n💡 Este es un ejemplo de cómo el sistema detectaría y analizaría")
+        print(f"   un caso real de conjunción satelital.")
+
+
+# NUEVO MÓDULO PARA EL HACKATÓN - SISTEMA ISL CONTROL
+# Comandos ISL en orden estable para codificación binaria (un byte)
+_ISL_COMMANDS = ("ROUTE_NORMAL", "THRUST_PRESERVE", "THRUST_PLANNED",
+                 "THRUST_CONDITIONAL", "THRUST_IMMINENT", "THRUST_IMPOSSIBLE")
+
+
+@dataclass(slots=True, frozen=True)
+class ISLProtocol:
+    """
+    Protocolo de comunicación entre satélites
+
+    Inmutable y con slots: el bucle de enrutamiento por vecino crea uno
+    por decisión, así que se evita el __dict__ de ~6 claves por mensaje.
+    """
+    message_type: str
+    source: str
+    destination: str
+    priority: str
+    encryption: str
+    compression: str
+    payload: Dict
+
+    def to_dict(self) -> Dict:
+        """Representación dict para exportación JSON"""
+        return asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class ISLDecision:
+    """
+    Decisión autónoma del sistema ISL (resultado de _make_isl_decision)
+
+    Sustituye al dict de ~14 claves que se asignaba por llamada en el
+    camino caliente; to_dict() conserva la forma anterior para JSON.
+    """
+    timestamp_ns: int
+    command: str
+    action: str
+    urgency_level: str
+    risk_assessment: str
+    propellant_status: str
+    time_to_maneuver_hours: float
+    network_priority: str
+    bandwidth_allocation: float
+    target_satellite: str
+    isl_protocol: ISLProtocol
+    maneuver_data: Optional[Dict]
+    has_maneuver: bool = False
+    autonomous_decision: bool = True
+    chip_location: str = 'IENAI_PROCESSOR'
+
+    @property
+    def timestamp(self) -> str:
+        """Marca de tiempo formateada; sólo se construye al leerla"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9).strftime('%Y-%m-%d %H:%M:%S')
+
+    def to_dict(self) -> Dict:
+        """Representación dict para exportación JSON"""
+        d = asdict(self)
+        d['timestamp'] = self.timestamp
+        del d['timestamp_ns']
+        return d
+
+    def pack_to_bytes(self) -> bytes:
+        """
+        Trama binaria de tamaño fijo (14 bytes) para el radioenlace ISL
+
+        La telemetría continua se cuantiza a float32 y los campos
+        discretos a un byte cada uno: más que suficiente para el enlace
+        simulado y un orden de magnitud menos que el JSON equivalente.
+        """
+        command_idx = _ISL_COMMANDS.index(self.command)
+        urgency_idx = ISLControlSystem._URGENCY_LABELS.index(self.urgency_level)
+        propellant = float(self.propellant_status.rstrip('%')) / 100.0
+        return struct.pack('<BBfff',
+                           command_idx,
+                           urgency_idx,
+                           np.float32(self.bandwidth_allocation),
+                           np.float32(propellant),
+                           np.float32(self.time_to_maneuver_hours))
+
+
+class ISLControlSystem:
+    """
+    Sistema de Control de Enlaces Inter-Satelitales (ISL) con conciencia de propulsión
+    
+    Este módulo simula la lógica que se ejecutaría en el chip IENAI para:
+    - Gestionar el tráfico de red satelital basado en riesgo de colisión
+    - Optimizar el enrutamiento considerando el estado del propulsor
+    - Tomar decisiones autónomas de maniobra y comunicación
+    """
+    
+    # Tabla de decisión precalculada: urgencia (filas, umbrales en horas)
+    # × nivel de propelente (columnas, cortes 5%/15%/25%). Cada celda es
+    # (comando, plantilla de acción, prioridad de red, ancho de banda);
+    # dos searchsorted sustituyen a la escalera if/elif original
+    _URGENCY_BINS = np.array([1.0, 6.0, 24.0])
+    _URGENCY_LABELS = ("CRÍTICO_INMEDIATO", "CRÍTICO_CORTO_PLAZO", "MODERADO", "BAJO")
+    _PROPELLANT_BINS = np.array([0.05, 0.15, 0.25])
+    _D_IMMINENT = ("THRUST_IMMINENT",
+                   "Preparando maniobra de evasión. Desviando tráfico crítico al satélite {sat_neighbor}",
+                   "HIGH_REROUTE", 0.2)   # 20% del ancho de banda para coordinar maniobra
+    _D_CONDITIONAL = ("THRUST_CONDITIONAL",
+                      "Maniobra condicional. Evaluando alternativas. Alertando a {sat_neighbor}",
+                      "MEDIUM_REROUTE", 0.1)  # 10% para coordinación
+    _D_IMPOSSIBLE = ("THRUST_IMPOSSIBLE",
+                     "Combustible insuficiente. Emitiendo alerta de posición. Transferencia total a {sat_neighbor}",
+                     "EMERGENCY_REROUTE", 0.05)  # 5% mínimo para alertas
+    _D_PLANNED = ("THRUST_PLANNED",
+                  "Maniobra planificada. Coordinando con {sat_neighbor} para redistribución de tráfico",
+                  "PLANNED_REROUTE", 0.8)  # 80% operación normal
+    _D_PRESERVE = ("THRUST_PRESERVE",
+                   "Conservando combustible. Solicitando soporte de red a {sat_neighbor}",
+                   "FUEL_CONSERVATION", 0.6)  # 60% operación reducida
+    _D_NORMAL = ("ROUTE_NORMAL",
+                 "Operación normal. Sin amenaza inmediata de colisión",
+                 "NORMAL", 1.0)  # 100% operación normal
+    _CRITICAL_ROW = (_D_IMPOSSIBLE, _D_CONDITIONAL, _D_IMMINENT, _D_IMMINENT)
+    _DECISION_TABLE = (
+        _CRITICAL_ROW,                                        # < 1 h
+        _CRITICAL_ROW,                                        # 1-6 h
+        (_D_PRESERVE, _D_PRESERVE, _D_PRESERVE, _D_PLANNED),  # 6-24 h
+        (_D_NORMAL, _D_NORMAL, _D_NORMAL, _D_NORMAL)          # ≥ 24 h
+    )
+    # Cargas útiles estáticas del protocolo por comando, construidas una
+    # sola vez a nivel de clase (los consumidores sólo las leen); la
+    # variante condicional depende del propelente y se materializa por
+    # llamada en _generate_isl_protocol
+    _PAYLOAD_IMMINENT = {
+        'alert_type': 'IMMINENT_MANEUVER',
+        'maneuver_window': '< 1 hour',
+        'requested_action': 'TAKE_TRAFFIC_LOAD',
+        'backup_required': True,
+        'telemetry_sharing': True
+    }
+    _PAYLOAD_IMPOSSIBLE = {
+        'alert_type': 'PROPULSION_FAILURE',
+        'maneuver_capability': False,
+        'requested_action': 'EMERGENCY_BACKUP',
+        'position_alert': True,
+        'ground_notification': True
+    }
+    _PAYLOAD_NORMAL = {
+        'alert_type': 'STATUS_NORMAL',
+        'maneuver_capability': True,
+        'requested_action': 'MAINTAIN_NORMAL_OPS',
+        'health_check': True
+    }
+
+    # Vistas en array de la misma tabla para la variante por lotes:
+    # un gather fancy-index por columna en vez de indexar celda a celda
+    _CMD_TABLE = np.array([[cell[0] for cell in row] for row in _DECISION_TABLE])
+    _PRIORITY_TABLE = np.array([[cell[2] for cell in row] for row in _DECISION_TABLE])
+    _BANDWIDTH_TABLE = np.array([[cell[3] for cell in row] for row in _DECISION_TABLE])
+
+    def __init__(self, analyzer: SatelliteAnalyzer):
+        self.analyzer = analyzer
+        self.network_nodes = []  # Lista de satélites en la red
+        self.current_routes = {}  # Rutas actuales de comunicación
+        # Análisis de maniobra memorizados por parámetros discretos: el
+        # enrutamiento sólo usa tres v_rel estimadas con el resto fijo
+        self._maneuver_cache = {}
+        
+    def determine_thrust_aware_routing(self, sat_local_name: str, sat_neighbor_name: str, 
+                                       collision_risk_data: Dict, propellant_level: float) -> ISLDecision:
+        """
+        Simula la lógica de enrutamiento basada en el riesgo de colisión y el estado del propulsor IENAI.
+        ESTA FUNCIÓN SE EJECUTARÍA EN EL CHIP DEL IENAI.
+        
+        Args:
+            sat_local_name: Nombre del satélite local (este satélite)
+            sat_neighbor_name: Satélite vecino en la red
+            collision_risk_data: Datos de riesgo de colisión
+            propellant_level: Nivel de propelente (0.0 a 1.0)
+            
+        Returns:
+            ISLDecision: Comandos y decisiones del sistema ISL
+        """
+        
+        # 1. Evaluar si se necesita una maniobra (usando la lógica existente)
+        risk_level = collision_risk_data.get('risk_level', 'BAJO')
+        close_encounters = collision_risk_data.get('close_encounters', [])
+        
+        # 2. Calcular parámetros de maniobra basados en el riesgo
+        maneuver_analysis = None
+        time_to_maneuver_hours = 0.0
+        has_maneuver = False
+        
+        if risk_level in ['ALTO', 'CRÍTICO'] and close_encounters:
+            # Obtener el encuentro más cercano
+            nearest_encounter = min(close_encounters, key=lambda x: x['distance_km'])
+            
+            # Estimar velocidad relativa basada en la distancia del encuentro
+            if nearest_encounter['distance_km'] < 5:
+                v_rel_estimate = 12000  # Encuentro frontal crítico
+            elif nearest_encounter['distance_km'] < 20:
+                v_rel_estimate = 8000   # Encuentro perpendicular
+            else:
+                v_rel_estimate = 3000   # Encuentro lateral
+            
+            # Calcular tiempo de maniobra requerido (memorizado: las
+            # combinaciones de parámetros son un conjunto discreto)
+            key = (v_rel_estimate, 500.0, 100.0, 0.001, 3.0)
+            maneuver_analysis = self._maneuver_cache.get(key)
+            if maneuver_analysis is None:
+                maneuver_analysis = self.analyzer.calculate_maneuver_time(
+                    v_rel=v_rel_estimate,
+                    R_req=500.0,     # 500m de seguridad para satélites comerciales
+                    sigma_0=100.0,   # 100m de incertidumbre estándar
+                    k=0.001,         # Crecimiento normal de incertidumbre
+                    n=3.0            # 3 sigma de confianza
+                )
+                self._maneuver_cache[key] = maneuver_analysis
+            
+            if 'error' not in maneuver_analysis:
+                time_to_maneuver_hours = maneuver_analysis['tiempo_maniobra']['horas']
+                has_maneuver = True
+        
+        # 3. LÓGICA DE DECISIÓN ISL (El corazón del proyecto)
+        decision_result = self._make_isl_decision(
+            sat_local_name, sat_neighbor_name, risk_level,
+            time_to_maneuver_hours, propellant_level, maneuver_analysis,
+            has_maneuver
+        )
+        
+        return decision_result
+    
+    def _make_isl_decision(self, sat_local: str, sat_neighbor: str, risk_level: str,
+                          time_hours: float, propellant: float,
+                          maneuver_data: Dict, has_maneuver: bool = False) -> ISLDecision:
+        """
+        Núcleo de la lógica de decisión ISL
+        """
+        # Entero de reloj en vez de datetime.now().strftime: el formateo
+        # se hace de forma diferida al leer .timestamp
+        timestamp_ns = time.time_ns()
+
+        # Clasificación sin ramas: dos searchsorted indexan directamente
+        # la tabla de decisión urgencia × propelente. Sin maniobra
+        # pendiente no hay centinela inf que comparar: urgencia BAJO
+        if has_maneuver:
+            urgency_idx = int(np.searchsorted(self._URGENCY_BINS, time_hours, side='right'))
+        else:
+            urgency_idx = len(self._URGENCY_BINS)  # BAJO
+        urgency = self._URGENCY_LABELS[urgency_idx]
+        prop_idx = int(np.searchsorted(self._PROPELLANT_BINS, propellant, side='left'))
+
+        command, action_tpl, network_priority, bandwidth_allocation = \
+            self._DECISION_TABLE[urgency_idx][prop_idx]
+        action = action_tpl.format(sat_neighbor=sat_neighbor)
+        
+        # Generar protocolo de comunicación ISL
+        isl_protocol = self._generate_isl_protocol(
+            command, sat_local, sat_neighbor, urgency, propellant
+        )
+        
+        return ISLDecision(
+            timestamp_ns=timestamp_ns,
+            command=command,
+            action=action,
+            urgency_level=urgency,
+            risk_assessment=risk_level,
+            propellant_status=f"{propellant*100:.1f}%",
+            time_to_maneuver_hours=time_hours,
+            network_priority=network_priority,
+            bandwidth_allocation=bandwidth_allocation,
+            target_satellite=sat_neighbor,
+            isl_protocol=isl_protocol,
+            maneuver_data=maneuver_data,
+            has_maneuver=has_maneuver
+        )
+    
+    def decide_batch(self, time_hours: np.ndarray,
+                     propellants: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Versión vectorizada del clasificador urgencia × propelente: evalúa
+        muchos pares vecinos en una sola pasada NumPy. Dos searchsorted
+        producen los índices de fila y columna y un único gather sobre las
+        vistas en array de la tabla devuelve comando, prioridad de red y
+        ancho de banda para todo el lote.
+
+        Args:
+            time_hours: Tiempos hasta maniobra en horas (uno por par)
+            propellants: Niveles de propelente (0.0 a 1.0, uno por par)
+
+        Returns:
+            Tuple: (comandos, prioridades, anchos_de_banda) como arrays
+        """
+        time_hours = np.asarray(time_hours, dtype=np.float64)
+        propellants = np.asarray(propellants, dtype=np.float64)
+
+        urgency_idx = np.searchsorted(self._URGENCY_BINS, time_hours, side='right')
+        prop_idx = np.searchsorted(self._PROPELLANT_BINS, propellants, side='left')
+
+        commands = self._CMD_TABLE[urgency_idx, prop_idx]
+        priorities = self._PRIORITY_TABLE[urgency_idx, prop_idx]
+        bandwidths = self._BANDWIDTH_TABLE[urgency_idx, prop_idx]
+        return commands, priorities, bandwidths
+
+    def _generate_isl_protocol(self, command: str, sat_local: str, sat_neighbor: str,
+                              urgency: str, propellant: float) -> ISLProtocol:
+        """
+        Generar protocolo de comunicación entre satélites
+        """
+        if command == "THRUST_IMMINENT":
+            payload = self._PAYLOAD_IMMINENT
+        elif command == "THRUST_IMPOSSIBLE":
+            payload = self._PAYLOAD_IMPOSSIBLE
+        elif command == "ROUTE_NORMAL":
+            payload = self._PAYLOAD_NORMAL
+        else:
+            payload = {
+                'alert_type': 'CONDITIONAL_MANEUVER',
+                'maneuver_probability': f"{min(1.0, (1.0 - propellant) + 0.5):.2f}",
+                'requested_action': 'STANDBY_SUPPORT',
+                'monitoring_required': True
+            }
+
+        return ISLProtocol(
+            message_type='ISL_COORDINATION',
+            source=sat_local,
+            destination=sat_neighbor,
+            priority='HIGH' if urgency.startswith('CRÍTICO') else 'MEDIUM',
+            encryption='AES256_QUANTUM_SAFE',
+            compression='SATELLITE_OPTIMIZED',
+            payload=payload
+        )
+    
+    def simulate_constellation_response(self, decision_result: ISLDecision,
+                                      constellation_size: int = 5) -> Dict:
+        """
+        Simular la respuesta de una constelación de satélites al comando ISL
+        """
+        constellation_response = {
+            'constellation_id': 'IENAI_NETWORK_ALPHA',
+            'total_satellites': constellation_size,
+            'responding_satellites': [],
+            'network_adaptation': {},
+            'collective_decision': None
+        }
+        
+        # Simular respuesta de otros satélites: sorteos vectorizados en un
+        # solo draw y exclusión del satélite objetivo por máscara booleana
+        sat_ids = np.array([f"IENAI_SAT_{i+1:02d}"
+                            for i in range(constellation_size)], dtype=object)
+        mask = sat_ids != decision_result.target_satellite
+        capacities = _RNG.uniform(0.6, 1.0, constellation_size)[mask]  # 60-100%
+        fuels = _RNG.uniform(0.1, 0.9, constellation_size)[mask]       # 10-90%
+
+        constellation_response['responding_satellites'] = [
+            {
+                'satellite_id': sat_id,
+                'available_capacity': f"{sat_capacity*100:.1f}%",
+                'fuel_level': f"{sat_fuel*100:.1f}%",
+                'can_assist': sat_capacity > 0.3,
+                'priority_level': 'HIGH' if sat_capacity > 0.7 else 'MEDIUM'
+            }
+            for sat_id, sat_capacity, sat_fuel in zip(sat_ids[mask], capacities, fuels)
+        ]
+
+        # Capacidad total directamente de los valores numéricos,
+        # sin re-parsear las cadenas con porcentajes
+        total_capacity = float(capacities.sum())
+        
+        constellation_response['network_adaptation'] = {
+            'total_available_capacity': f"{total_capacity*100:.1f}%",
+            'load_distribution': 'AUTOMATIC',
+            'failover_ready': total_capacity > 1.5,
+            'latency_impact': 'MINIMAL' if total_capacity > 2.0 else 'MODERATE'
+        }
+        
+        # Decisión colectiva de la constelación
+        if decision_result.urgency_level.startswith('CRÍTICO'):
+            constellation_response['collective_decision'] = 'EMERGENCY_PROTOCOL_ACTIVATED'
+        elif total_capacity > 1.8:
+            constellation_response['collective_decision'] = 'FULL_SUPPORT_GRANTED'
+        else:
+            constellation_response['collective_decision'] = 'LIMITED_SUPPORT_AVAILABLE'
+        
+        return constellation_response
+
+
+class HackathonDemo:
+    """
+    Clase para demostrar el sistema ISL en el hackathon
+    """
+    
+    def __init__(self, analyzer: SatelliteAnalyzer):
+        self.analyzer = analyzer
+        self.isl_system = ISLControlSystem(analyzer)
+        
+    def run_complete_demo(self):
+        """
+        Ejecutar demostración completa del sistema ISL para el hackathon
+        """
+        print("🚀 DEMOSTRACIÓN COMPLETA DEL SISTEMA ISL-IENAI")
+        print("=" * 70)
+        print("🎯 Sistema de Control de Enlaces Inter-Satelitales con Conciencia de Propulsión")
+        print("💡 Simulando operación autónoma en chip IENAI")
+        print("-" * 70)
+        
+        # Escenarios de prueba
+        scenarios = [
+            {
+                'name': '🔴 ESCENARIO CRÍTICO: Encuentro Frontal Inminente',
+                'risk_data': {
+                    'risk_level': 'CRÍTICO',
+                    'close_encounters': [{'distance_km': 2.5, 'datetime': datetime.now()}]
+                },
+                'propellant': 0.85,  # 85% combustible
+                'description': 'Satélite con buen combustible detecta colisión inminente'
+            },
+            {
+                'name': '🟠 ESCENARIO CRÍTICO: Combustible Bajo',
+                'risk_data': {
+                    'risk_level': 'ALTO',
+                    'close_encounters': [{'distance_km': 8.3, 'datetime': datetime.now()}]
+                },
+                'propellant': 0.03,  # 3% combustible
+                'description': 'Satélite con combustible crítico detecta amenaza'
+            },
+            {
+                'name': '🟡 ESCENARIO MODERADO: Encuentro Planificado',
+                'risk_data': {
+                    'risk_level': 'MEDIO',
+                    'close_encounters': [{'distance_km': 25.7, 'datetime': datetime.now()}]
+                },
+                'propellant': 0.60,  # 60% combustible
+                'description': 'Encuentro detectado con tiempo para planificar'
+            },
+            {
+                'name': '🟢 ESCENARIO NORMAL: Operación Rutinaria',
+                'risk_data': {
+                    'risk_level': 'BAJO',
+                    'close_encounters': []
+                },
+                'propellant': 0.75,  # 75% combustible
+                'description': 'Operación normal sin amenazas detectadas'
+            }
+        ]
+        
+        for i, scenario in enumerate(scenarios, 1):
+            print(f"\n{i}. {scenario['name']}")
+            print(f"   📝 {scenario['description']}")
+            print(f"   ⛽ Combustible: {scenario['propellant']*100:.1f}%")
+            
+            # Ejecutar análisis ISL
+            decision = self.isl_system.determine_thrust_aware_routing(
+                sat_local_name="IENAI_SAT_01",
+                sat_neighbor_name="IENAI_SAT_02", 
+                collision_risk_data=scenario['risk_data'],
+                propellant_level=scenario['propellant']
+            )
+            
+            # Mostrar resultados
+            print(f"   🤖 DECISIÓN AUTÓNOMA: {decision.command}")
+            print(f"   ⚡ Acción: {decision.action}")
+            print(f"   📡 Prioridad de red: {decision.network_priority}")
+            print(f"   📊 Ancho de banda: {decision.bandwidth_allocation*100:.0f}%")
+            
+            if decision.has_maneuver:
+                print(f"   ⏰ Tiempo para maniobra: {decision.time_to_maneuver_hours:.2f} horas")
+            
+            # Simular respuesta de constelación
+            constellation_response = self.isl_system.simulate_constellation_response(decision)
+            print(f"   🛰️  Respuesta de constelación: {constellation_response['collective_decision']}")
+            print(f"   🌐 Capacidad disponible: {constellation_response['network_adaptation']['total_available_capacity']}")
+            
+            print("   " + "-" * 50)
+        
+        print(f"\n✅ DEMOSTRACIÓN COMPLETADA")
+        print(f"🎯 El sistema ISL-IENAI está listo para:")
+        print(f"   • Detección autónoma de riesgos de colisión")
+        print(f"   • Toma de decisiones basada en estado de propulsión")
+        print(f"   • Gestión inteligente de red satelital")
+        print(f"   • Coordinación de constelación en tiempo real")
+        print(f"   • Operación completamente autónoma en el espacio")
+
+
+# Menú y banner precompuestos en el import: una sola llamada a write
+# (un syscall) por redibujado en vez de ~20 prints individuales
+_MENU_STR = "\n" + "=" * 60 + "\n" + "\n".join((
+    "🎯 OPCIONES DISPONIBLES:",
+    "   1. Buscar satélite (búsqueda inteligente)",
+    "   2. Ver satélites populares por categoría",
+    "   3. Información detallada de un satélite",
+    "   4. Calcular órbitas futuras",
+    "   5. Análizar riesgo de colisión",
+    "   6. Visualizar órbita (2D)",
+    "   7. Visualización 3D (Tierra + Satélites)",
+    "   8. Animación orbital 3D",
+    "   9. Exportar lista completa de satélites",
+    "  10. Cálculo de tiempo de maniobra de evasión",
+    "  11. Análisis completo de colisión + maniobra",
+    "  12. 🔍 BUSCAR CASOS REALES DE COLISIÓN",
+    "  13. 🚀 DEMO SISTEMA ISL-IENAI (HACKATHON)",
+    "  14. 🤖 Simulador ISL Individual",
+    "  15. 🧪 ANÁLISIS AVANZADO DE COLISIÓN (J2 + Probabilidad)",
+    "  16. Salir",
+)) + "\n" + "=" * 60 + "\n"
+
+_BANNER_STR = ("=" * 60 + "\n"
+               "🛰️  SISTEMA DE ANÁLISIS DE SATÉLITES\n"
+               "    NASA Space App Challenge 2025 - Malkie Space\n"
+               + "=" * 60 + "\n")
+
+
+def mostrar_menu():
+    """Mostrar el menú de opciones"""
+    sys.stdout.write(_MENU_STR)
+
+
+# Cola de entradas pre-programadas: en modo por lotes _ask() las consume
+# en orden antes de recurrir a los valores por defecto, de modo que los
+# mismos handlers sirven al menú interactivo y a las ejecuciones scriptadas
+_scripted_inputs = deque()
+_batch_mode = False
+
+
+def _ask(prompt: str, default: str = '') -> str:
+    """Leer una entrada del usuario o de la cola de comandos por lotes"""
+    if _batch_mode:
+        return _scripted_inputs.popleft().strip() if _scripted_inputs else default
+    return input(prompt).strip()
+
+
+def handle_search(analyzer):
+    """Opción 1: búsqueda inteligente de satélite"""
+    search_term = _ask("🔍 Ingresa el nombre del satélite a buscar: ")
+    if search_term:
+        results = analyzer.smart_search(search_term)
+
+        if results['total_found'] > 0:
+            print(f"\n✅ Encontrados {results['total_found']} satélites:")
+
+            # Mostrar coincidencias exactas primero
+            if results['exact_matches']:
+                print("\n🎯 COINCIDENCIAS EXACTAS:")
+                for i, name in enumerate(results['exact_matches'], 1):
+                    print(f"   {i}. {name}")
+
+            # Mostrar coincidencias parciales por categoría
+            if results['category_matches']:
+                print("\n📊 RESULTADOS POR CATEGORÍA:")
+                for category, satellites in results['category_matches'].items():
+                    print(f"\n   📂 {category.capitalize()}:")
+                    for i, name in enumerate(satellites[:5], 1):  # Máximo 5 por categoría
+                        print(f"      {i}. {name}")
+                    if len(satellites) > 5:
+                        print(f"      ... y {len(satellites) - 5} más en esta categoría")
+
+            # Mostrar sugerencias si hay pocas coincidencias
+            if results['suggestions'] and results['total_found'] < 5:
+                print(f"\n💡 SUGERENCIAS RELACIONADAS:")
+                for i, suggestion in enumerate(results['suggestions'][:8], 1):
+                    print(f"   {i}. {suggestion}")
+        else:
+            print("❌ No se encontraron satélites con ese nombre")
+
+            # Mostrar ejemplos populares
+            print("\n🌟 ¿Quizás buscabas alguno de estos satélites populares?")
+            analyzer.show_satellite_examples()
+
+
+def handle_popular(analyzer):
+    """Opción 2: satélites populares por categoría"""
+    print("🌟 Satélites populares por categoría:")
+    popular = analyzer.get_popular_satellites()
+    for category, satellites in popular.items():
+        print(f"\n📂 {category.upper()}:")
+        for i, name in enumerate(satellites, 1):
+            print(f"   {i}. {name}")
+
+
+def handle_info(analyzer):
+    """Opción 3: información detallada de un satélite"""
+    sat_name = _ask("📋 Nombre del satélite: ")
+    if sat_name:
+        info = analyzer.get_satellite_info(sat_name)
+        if info is not None:
+            print(f"\n🛰️  INFORMACIÓN DETALLADA: {info['name']}")
+            print("=" * 50)
+            print(f"📂 Categoría: {info['category']}")
+            pos = info['current_position']
+            print(f"📍 Posición actual:")
+            print(f"   • Latitud: {pos['latitude']:.4f}°")
+            print(f"   • Longitud: {pos['longitude']:.4f}°")
+            print(f"   • Altitud: {pos['altitude_km']:.2f} km")
+            oe = info['orbital_elements']
+            print(f"📊 Parámetros orbitales:")
+            print(f"   • Inclinación: {oe['inclination_deg']:.2f}°")
+            print(f"   • Excentricidad: {oe['eccentricity']:.6f}")
+            print(f"   • Período orbital: {oe['period_hours']:.2f} horas")
+            print(f"   • Altitud aprox: {oe['approx_altitude_km']:.0f} km")
+            print(f"   • Revoluciones/día: {oe['mean_motion_rev_per_day']:.6f}")
+        else:
+            print(f"❌ Satélite '{sat_name}' no encontrado")
+            # Ofrecer sugerencias de nombres parecidos
+            suggestions = analyzer.suggest_satellites(sat_name)
+            if suggestions:
+                print(f"\n🔍 ¿Quisiste decir alguno de estos?")
+                for i, suggestion in enumerate(suggestions[:5], 1):
+                    print(f"   {i}. {suggestion}")
+
+
+def handle_future_positions(analyzer):
+    """Opción 4: calcular órbitas futuras"""
+    sat_name = _ask("🚀 Nombre del satélite: ")
+    if sat_name:
+        try:
+            days = int(_ask("📅 Días a calcular (default 7): ") or "7")
+            days = min(days, 180)  # Limitar a máximo 180 días
+            print(f"⏳ Calculando posiciones futuras para {days} días...")
+            positions = analyzer.calculate_future_positions(sat_name, days)
+
+            if len(positions):
+                # Informe completo acumulado en un StringIO y emitido con
+                # una sola escritura: una adquisición del lock de stdout y
+                # un syscall en vez de ~50 prints individuales
+                buf = io.StringIO()
+                w = buf.write
+                w(f"\n🛰️  PREDICCIONES ORBITALES: {sat_name}\n")
+                w("=" * 60 + "\n")
+                # Mostrar primeros 20 con las fechas formateadas por lotes:
+                # datetime_as_string amortiza el parseo del formato en C en
+                # vez de un strftime por fila
+                shown = positions[:20]  # vista sin copia del array estructurado
+                dts = np.array([dt.replace(tzinfo=None) for dt in shown['datetime']],
+                               dtype='datetime64[m]')
+                labels = np.char.replace(np.datetime_as_string(dts, unit='m'), 'T', ' ')
+                for label, pos in zip(labels, shown):
+                    w(f"📅 {label} UTC\n")
+                    w(f"   Lat: {pos['latitude']:7.3f}°  Lon: {pos['longitude']:8.3f}°  Alt: {pos['altitude_km']:7.1f} km\n")
+
+                if len(positions) > 20:
+                    w(f"   ... y {len(positions) - 20} predicciones más\n")
+
+                # Mostrar estadísticas: el array estructurado expone cada
+                # campo como vista contigua, así que las reducciones operan
+                # directamente sobre la columna sin extraer nada por fila
+                altitudes = positions['altitude_km']
+                w(f"\n📈 ESTADÍSTICAS:\n")
+                w(f"   • Altitud mínima: {altitudes.min():.1f} km\n")
+                w(f"   • Altitud máxima: {altitudes.max():.1f} km\n")
+                w(f"   • Altitud promedio: {altitudes.mean():.1f} km\n")
+                sys.stdout.write(buf.getvalue())
+            else:
+                print("❌ No se pudieron calcular las posiciones")
+                print("💡 Sugerencias:")
+                print("   • Verifica que el nombre del satélite sea exacto")
+                print("   • Usa la opción 1 para buscar satélites disponibles")
+                print("   • Intenta con nombres populares como: ISS (ZARYA), STARLINK-1007")
+        except ValueError:
+            print("❌ Número de días inválido. Debe ser un número entero.")
+
+
+def handle_collision_risk(analyzer):
+    """Opción 5: analizar riesgo de colisión"""
+    sat_name = _ask("⚠️  Satélite principal: ")
+    if sat_name:
+        sat2_name = _ask("🎯 Segundo satélite (Enter para analizar contra todos): ") or None
+        try:
+            threshold = float(_ask("📏 Distancia mínima en km (default 10): ") or "10")
+            days = int(_ask("📅 Días a analizar (4): ") or "4")
+
+            print("⏳ Analizando riesgo de colisión...")
+            risk_analysis = analyzer.analyze_collision_risk(sat_name, sat2_name, threshold, days)
+
+            if 'error' not in risk_analysis:
+                # Informe acumulado y emitido en una sola escritura
+                buf = io.StringIO()
+                w = buf.write
+                w(f"\n⚠️  ANÁLISIS DE RIESGO DE COLISIÓN\n")
+                w("=" * 50 + "\n")
+                w(f"🛰️  Satélite: {risk_analysis['satellite']}\n")
+                w(f"📊 Nivel de riesgo: {risk_analysis['risk_level']}\n")
+                w(f"📈 Encuentros cercanos: {risk_analysis['total_encounters']}\n")
+                w(f"📅 Período analizado: {risk_analysis['analysis_period_days']} días\n")
+                w(f"📏 Umbral: {risk_analysis['threshold_km']} km\n")
+
+                if risk_analysis['close_encounters']:
+                    w(f"\n🚨 ENCUENTROS CERCANOS DETECTADOS:\n")
+                    for enc in islice(risk_analysis['close_encounters'], 10):  # Primeros 10
+                        w(f"  • {enc['datetime'].strftime('%Y-%m-%d %H:%M')} UTC\n")
+                        w(f"    Con: {enc['satellite2']}\n")
+                        w(f"    Distancia: {enc['distance_km']:.2f} km\n")
+                else:
+                    w("✅ No se detectaron encuentros cercanos\n")
+                sys.stdout.write(buf.getvalue())
+            else:
+                print(f"❌ {risk_analysis['error']}")
+        except ValueError:
+            print("❌ Valores inválidos")
+
+
+def handle_plot_2d(analyzer):
+    """Opción 6: visualizar órbita 2D"""
+    sat_name = _ask("📈 Nombre del satélite: ")
+    if sat_name:
+        try:
+            hours = int(_ask("⏰ Horas de órbita a mostrar (default 24): ") or "24")
+            print("⏳ Generando visualización 2D...")
+            analyzer.plot_orbit(sat_name, hours)
+        except ValueError:
+            print("❌ Número de horas inválido")
+
+
+def handle_plot_3d(analyzer):
+    """Opción 7: visualización 3D de la Tierra con satélites"""
+    print("🌍 Visualización 3D de satélites alrededor de la Tierra")
+    satellites_input = _ask("🛰️  Nombres de satélites (separados por coma): ")
+    if satellites_input:
+        # Una pasada de regex en vez de split + strip por nombre; se
+        # descartan entradas vacías ("A, ,B") y duplicados conservando orden
+        satellite_names = list(dict.fromkeys(
+            name for name in _SPLIT_CSV.split(satellites_input.strip()) if name))
+        try:
+            hours = int(_ask("⏰ Horas de trayectoria (default 12): ") or "12")
+            print("⏳ Generando visualización 3D...")
+            analyzer.plot_3d_earth_with_satellites(satellite_names, hours,
+                                                   interactive=not _batch_mode)
+        except ValueError:
+            print("❌ Número de horas inválido")
+
+
+def handle_animation(analyzer):
+    """Opción 8: animación orbital 3D"""
+    sat_name = _ask("🎬 Nombre del satélite para animar: ")
+    if sat_name:
+        try:
+            hours = int(_ask("⏰ Horas de órbita a animar (default 6): ") or "6")
+            frames = int(_ask("🎞️  Número de frames (default 50): ") or "50")
+            print("⏳ Generando animación 3D...")
+            analyzer.plot_orbital_animation(sat_name, hours, frames,
+                                            mode='save' if _batch_mode else 'both')
+        except ValueError:
+            print("❌ Valores inválidos")
+
+
+def handle_export(analyzer):
+    """Opción 9: exportar lista completa de satélites"""
+    filename = _ask("📁 Nombre del archivo (default: satelites_disponibles.txt): ") or "satelites_disponibles.txt"
+    print("⏳ Exportando lista de satélites...")
+    if analyzer.export_satellites_list(filename):
+        print(f"✅ Lista exportada exitosamente a: {filename}")
+    else:
+        print("❌ Error al exportar la lista")
+
+
+def handle_maneuver_time(analyzer):
+    """Opción 10: cálculo de tiempo de maniobra de evasión"""
+    print("⏰ CÁLCULO DE TIEMPO DE MANIOBRA DE EVASIÓN")
+    print("=" * 50)
+    try:
+        v_rel = float(_ask("🚀 Velocidad relativa (m/s) [100-14000]: "))
+        R_req = float(_ask("📏 Distancia de seguridad (m) [default 1000]: ") or "1000")
+        sigma_0 = float(_ask("📊 Incertidumbre posicional (m) [default 100]: ") or "100")
+        k = float(_ask("📈 Tasa crecimiento incertidumbre (m/s) [default 0.001]: ") or "0.001")
+        n = float(_ask("🎯 Factor de confianza (sigma) [default 3]: ") or "3")
+
+        result = analyzer.calculate_maneuver_time(v_rel, R_req, sigma_0, k, n)
+
+        if 'error' not in result:
+            print(f"\n⏰ RESULTADO DEL ANÁLISIS DE MANIOBRA")
+            print("=" * 50)
+            print(f"⚡ Tiempo de maniobra requerido:")
+            print(f"   • {result['tiempo_maniobra']['segundos']:.1f} segundos")
+            print(f"   • {result['tiempo_maniobra']['minutos']:.1f} minutos")
+            print(f"   • {result['tiempo_maniobra']['horas']:.2f} horas")
+            print(f"   • {result['tiempo_maniobra']['dias']:.3f} días")
+
+            print(f"\n{result['evaluacion']['criticidad']}")
+            print(f"💡 {result['evaluacion']['recomendacion']}")
+
+            print(f"\n🎯 Contexto del encuentro:")
+            print(f"   • {result['interpretacion']['contexto_leo']['tipo_encuentro']}")
+            print(f"   • {result['interpretacion']['contexto_leo']['descripcion']}")
+
+            print(f"\n📋 Recomendaciones operacionales:")
+            for rec in result['interpretacion']['recomendaciones_operacionales']:
+                print(f"   {rec}")
+
+            if result['escenarios_alternativos']:
+                print(f"\n📊 Escenarios alternativos:")
+                for escenario in result['escenarios_alternativos']:
+                    print(f"   • {escenario['nombre']}: {escenario['tiempo_horas']:.2f} horas")
+        else:
+            print(f"❌ {result['error']}")
+            if 'recommendation' in result:
+                print(f"💡 {result['recommendation']}")
+
+    except ValueError:
+        print("❌ Valores inválidos. Asegúrate de ingresar números válidos.")
+
+
+def handle_comprehensive_analysis(analyzer):
+    """Opción 11: análisis completo de colisión + maniobra"""
+    print("🔍 ANÁLISIS COMPLETO: COLISIÓN + MANIOBRA")
+    print("=" * 50)
+    sat_name = _ask("🛰️  Nombre del satélite principal: ")
+    if sat_name:
+        sat2_name = _ask("🎯 Segundo satélite (Enter para analizar muestra): ") or None
+        try:
+            threshold = float(_ask("📏 Distancia mínima en km (default 10): ") or "10")
+            days = int(_ask("📅 Días a analizar (default 7): ") or "7")
+
+            print("⏳ Realizando análisis completo...")
+            comprehensive = analyzer.comprehensive_collision_analysis(
+                sat_name, sat2_name, threshold, days
+            )
+
+            if 'error' not in comprehensive:
+                # Mostrar resumen ejecutivo
+                summary = comprehensive['resumen_ejecutivo']
+                print(f"\n📊 RESUMEN EJECUTIVO")
+                print("=" * 40)
+                print(f"🛰️  Satélite: {summary['satelite']}")
+                print(f"⚠️  Nivel de riesgo: {summary['nivel_riesgo']}")
+                print(f"📈 Total encuentros: {summary['total_encuentros']}")
+                print(f"🎯 Acción recomendada: {summary['accion_recomendada']}")
+
+                if summary.get('primer_encuentro'):
+                    pe = summary['primer_encuentro']
+                    print(f"\n⏰ PRIMER ENCUENTRO:")
+                    print(f"   • Fecha: {pe['fecha']}")
+                    print(f"   • En: {pe['tiempo_horas']:.1f} horas")
+                    print(f"   • Distancia: {pe['distancia_km']:.2f} km")
+
+                if summary.get('tiempo_maniobra'):
+                    tm = summary['tiempo_maniobra']
+                    print(f"\n⚡ TIEMPO DE MANIOBRA:")
+                    print(f"   • Mínimo: {tm['minimo_horas']:.2f} horas")
+                    print(f"   • Máximo: {tm['maximo_horas']:.2f} horas")
+                    print(f"   • Promedio: {tm['promedio_horas']:.2f} horas")
+
+                # Mostrar recomendaciones generales
+                if comprehensive['recomendaciones_generales']:
+                    print(f"\n💡 RECOMENDACIONES GENERALES:")
+                    for rec in comprehensive['recomendaciones_generales']:
+                        print(f"   {rec}")
+
+                # Mostrar análisis detallado de maniobras si hay encuentros
+                if comprehensive['analisis_maniobras']:
+                    print(f"\n📊 ANÁLISIS DETALLADO DE MANIOBRAS:")
+                    for i, analysis in enumerate(islice(comprehensive['analisis_maniobras'], 3), 1):
+                        # Resumen preformateado en el análisis: sin volver a
+                        # formatear los campos del encuentro al mostrarlos
+                        print(f"\n   {i}. {analysis['resumen']}")
+
+                        for maneuver in analysis['analisis_maniobra']:
+                            print(f"      • {maneuver['escenario']}: {maneuver['tiempo_maniobra']['horas']:.2f} horas")
+                            print(f"        {maneuver['criticidad']}")
+            else:
+                print(f"❌ {comprehensive['error']}")
+
+        except ValueError:
+            print("❌ Valores inválidos")
+
+
+def handle_collision_search(analyzer):
+    """Opción 12: buscar casos reales de colisión"""
+    print("🔍 BÚSQUEDA EXHAUSTIVA DE CASOS DE COLISIÓN")
+    print("=" * 50)
+    print("💡 Esta función buscará casos reales de encuentros cercanos")
+    print("   entre satélites en la base de datos actual.")
+    print()
+
+    try:
+        threshold = float(_ask("📏 Umbral de distancia en km (default 75): ") or "75")
+        days = int(_ask("📅 Días a analizar (default 3): ") or "3")
+        max_sats = int(_ask("🛰️  Máximo satélites a analizar (default 300): ") or "300")
+
+        print("\n⏳ Iniciando búsqueda exhaustiva...")
+        print("⚠️  Esta operación puede tomar varios minutos...")
+
+        # Ejecutar búsqueda de casos de colisión
+        analyzer.demonstrate_collision_case()
+
+    except ValueError:
+        print("❌ Valores inválidos")
+    except KeyboardInterrupt:
+        print("\n⏹️  Búsqueda cancelada por el usuario")
+
+
+def handle_isl_demo(analyzer):
+    """Opción 13: demo completo del sistema ISL-IENAI para hackathon"""
+    print("🚀 INICIANDO DEMOSTRACIÓN DEL SISTEMA ISL-IENAI")
+    print("=" * 60)
+    print("💡 Sistema de Control de Enlaces Inter-Satelitales")
+    print("🎯 Demostrando toma de decisiones autónomas en el espacio")
+    print()
+
+    try:
+        demo = HackathonDemo(analyzer)
+        demo.run_complete_demo()
+    except Exception as e:
+        print(f"❌ Error en demostración: {str(e)}")
+
+
+# Escenarios de riesgo del simulador ISL: (nivel, distancia_km del
+# encuentro o None si no hay amenazas)
+_RISK_TEMPLATES = {
+    '1': ('CRÍTICO', 2.1),
+    '2': ('ALTO', 12.5),
+    '3': ('MEDIO', 35.0),
+    '4': ('BAJO', None),
+}
+
+
+def handle_isl_simulator(analyzer):
+    """Opción 14: simulador ISL individual"""
+    print("🤖 SIMULADOR ISL INDIVIDUAL")
+    print("=" * 50)
+    print("💡 Configura tu propio escenario de análisis ISL")
+    print()
+
+    try:
+        sat_local = _ask("🛰️  Satélite local (default: IENAI_SAT_01): ") or "IENAI_SAT_01"
+        sat_neighbor = _ask("📡 Satélite vecino (default: IENAI_SAT_02): ") or "IENAI_SAT_02"
+
+        print("\n🎯 Configurar escenario de riesgo:")
+        print("   1. Riesgo CRÍTICO (encuentro < 5 km)")
+        print("   2. Riesgo ALTO (encuentro 5-20 km)")
+        print("   3. Riesgo MEDIO (encuentro 20-50 km)")
+        print("   4. Riesgo BAJO (sin amenazas)")
+
+        risk_choice = _ask("Selecciona nivel de riesgo (1-4): ")
+        propellant = float(_ask("⛽ Nivel de combustible (0.0-1.0): ") or "0.5")
+
+        # Configurar datos de riesgo según la selección: las plantillas
+        # son constantes de módulo y sólo el escenario elegido paga su
+        # datetime.now()
+        level, distance_km = _RISK_TEMPLATES.get(risk_choice, _RISK_TEMPLATES['4'])
+        risk_data = {
+            'risk_level': level,
+            'close_encounters': [] if distance_km is None
+            else [{'distance_km': distance_km, 'datetime': datetime.now()}]
+        }
+
+        # Ejecutar análisis ISL
+        isl_system = ISLControlSystem(analyzer)
+        result = isl_system.determine_thrust_aware_routing(
+            sat_local, sat_neighbor, risk_data, propellant
+        )
+
+        # Mostrar resultados detallados
+        print(f"\n🤖 RESULTADO DEL ANÁLISIS ISL:")
+        print("=" * 50)
+        print(f"⏰ Timestamp: {result.timestamp}")
+        print(f"🚀 Comando: {result.command}")
+        print(f"⚡ Acción: {result.action}")
+        print(f"🎯 Urgencia: {result.urgency_level}")
+        print(f"📊 Riesgo: {result.risk_assessment}")
+        print(f"⛽ Combustible: {result.propellant_status}")
+
+        if result.has_maneuver:
+            print(f"⏰ Tiempo para maniobra: {result.time_to_maneuver_hours:.3f} horas")
+
+        print(f"📡 Prioridad de red: {result.network_priority}")
+        print(f"📶 Ancho de banda: {result.bandwidth_allocation*100:.0f}%")
+        print(f"🎯 Satélite objetivo: {result.target_satellite}")
+        print(f"🧠 Decisión autónoma: {result.autonomous_decision}")
+        print(f"💻 Ubicación: {result.chip_location}")
+
+        # Mostrar protocolo ISL
+        protocol = result.isl_protocol
+        print(f"\n📡 PROTOCOLO ISL:")
+        print(f"   • Tipo: {protocol.message_type}")
+        print(f"   • Prioridad: {protocol.priority}")
+        print(f"   • Encriptación: {protocol.encryption}")
+        print(f"   • Acción solicitada: {protocol.payload['requested_action']}")
+
+        # Simular respuesta de constelación
+        constellation = isl_system.simulate_constellation_response(result)
+        print(f"\n🌐 RESPUESTA DE CONSTELACIÓN:")
+        print(f"   • Decisión colectiva: {constellation['collective_decision']}")
+        print(f"   • Capacidad total: {constellation['network_adaptation']['total_available_capacity']}")
+        print(f"   • Satélites respondiendo: {len(constellation['responding_satellites'])}")
+        print(f"   • Failover listo: {constellation['network_adaptation']['failover_ready']}")
+
+    except ValueError:
+        print("❌ Valores inválidos")
+    except Exception as e:
+        print(f"❌ Error en simulación: {str(e)}")
+
+
+def handle_advanced_analysis(analyzer):
+    """Opción 15: análisis avanzado de colisión"""
+    print("🧪 ANÁLISIS AVANZADO DE COLISIÓN")
+    print("=" * 50)
+    print("Incluye:")
+    print("  • Perturbaciones J2 (achatamiento terrestre)")
+    print("  • Arrastre atmosférico")
+    print("  • Elipsoides de incertidumbre")
+    print("  • Probabilidad estadística real")
+    print("  • Propagación de incertidumbre no-lineal")
+
+    sat_name = _ask("\n🛰️ Nombre del satélite principal: ")
+    if not sat_name:
+        print("❌ Nombre de satélite requerido")
+        return
+
+    sat2_name = _ask("🛰️ Nombre del segundo satélite (Enter para análisis múltiple): ")
+    if not sat2_name:
+        sat2_name = None
+
+    try:
+        threshold = float(_ask("📏 Distancia umbral en km (por defecto 10): ") or "10")
+        days = int(_ask("📅 Días a analizar (por defecto 3): ") or "3")
+
+        print(f"\n🔬 Iniciando análisis avanzado...")
+        print("⚠️ Esto puede tomar varios minutos debido a los cálculos complejos...")
+
+        result = analyzer.advanced_collision_analysis(
+            sat_name, sat2_name, threshold, days
+        )
+
+        if 'error' in result:
+            print(f"❌ {result['error']}")
+        else:
+            print(f"\n🎯 ANÁLISIS AVANZADO COMPLETADO")
+            print("=" * 50)
+            print(f"🛰️ Satélite: {result['satellite']}")
+            print(f"🔬 Tipo de análisis: {result['analysis_type']}")
+            print(f"🎯 Nivel de riesgo global: {result['global_risk_level']}")
+            print(f"📊 Probabilidad máxima de colisión: {result['max_collision_probability']:.2e}")
+            print(f"📏 Distancia mínima: {result['min_distance_km']:.3f} km")
+            print(f"🔍 Encuentros detectados: {result['total_encounters']}")
+            print(f"🛰️ Satélites analizados: {result['satellites_analyzed']}")
+
+            print(f"\n✅ Características avanzadas aplicadas:")
+            for perturbation in result['perturbations_included']:
+                print(f"   • {perturbation}")
+            print(f"   • Modelado de incertidumbre: {'✅' if result['uncertainty_modeling'] else '❌'}")
+            print(f"   • Análisis estadístico: {'✅' if result['statistical_analysis'] else '❌'}")
+
+            if result['most_critical_encounter']:
+                critical = result['most_critical_encounter']
+                print(f"\n🚨 ENCUENTRO MÁS CRÍTICO:")
+                print(f"   📅 Fecha: {critical['datetime']}")
+                print(f"   🛰️ Satélite: {critical['satellite2']}")
+                print(f"   📊 Probabilidad: {critical['collision_probability']:.2e}")
+                print(f"   📏 Distancia: {critical['distance_km']:.3f} km")
+                print(f"   ⚠️ Nivel de riesgo: {critical['risk_level']}")
+                print(f"   📊 Incertidumbre posicional: {critical['position_uncertainty_km']:.3f} km")
+
+            if result['detailed_encounters']:
+                print(f"\n📋 RESUMEN DE ENCUENTROS:")
+                for i, enc in enumerate(result['detailed_encounters'][:5], 1):
+                    print(f"   {i}. {enc['satellite2']} - "
+                          f"Prob: {enc['collision_probability']:.2e}, "
+                          f"Dist: {enc['distance_km']:.3f} km, "
+                          f"Riesgo: {enc['risk_level']}")
+
+                if len(result['detailed_encounters']) > 5:
+                    print(f"   ... y {len(result['detailed_encounters']) - 5} encuentros más")
+
+    except ValueError:
+        print("❌ Valores numéricos inválidos")
+    except Exception as e:
+        print(f"❌ Error durante análisis: {str(e)}")
+
+
+# Despacho O(1) de opciones del menú: cada handler es una función de
+# nivel de módulo reutilizable tanto por el bucle interactivo como por
+# los modos --batch/--script
+HANDLERS = {
+    '1': handle_search,
+    '2': handle_popular,
+    '3': handle_info,
+    '4': handle_future_positions,
+    '5': handle_collision_risk,
+    '6': handle_plot_2d,
+    '7': handle_plot_3d,
+    '8': handle_animation,
+    '9': handle_export,
+    '10': handle_maneuver_time,
+    '11': handle_comprehensive_analysis,
+    '12': handle_collision_search,
+    '13': handle_isl_demo,
+    '14': handle_isl_simulator,
+    '15': handle_advanced_analysis,
+}
+
+
+def _parse_args():
+    """Argumentos de línea de comandos para ejecuciones no interactivas"""
+    parser = argparse.ArgumentParser(
+        description='Sistema de Análisis de Satélites - NASA Space App Challenge 2025')
+    parser.add_argument('--script', metavar='ARCHIVO',
+                        help='Archivo con un comando por línea (formato opcion:arg1:arg2)')
+    parser.add_argument('--batch', metavar='COMANDOS',
+                        help='Comandos separados por coma, p.ej. "1:ISS,4:ISS (ZARYA):7"')
+    return parser.parse_args()
+
+
+def _run_batch(analyzer, commands):
+    """Ejecutar una lista de comandos opcion:arg1:arg2 sin menú ni prompts"""
+    global _batch_mode
+    _batch_mode = True
+    try:
+        for cmd in commands:
+            option, *params = cmd.split(':')
+            handler = HANDLERS.get(option.strip())
+            if handler is None:
+                print(f"❌ Comando desconocido: {cmd}")
+                continue
+            _scripted_inputs.clear()
+            _scripted_inputs.extend(params)
+            try:
+                handler(analyzer)
+            except Exception as e:
+                print(f"❌ Error ejecutando '{cmd}': {str(e)}")
+    finally:
+        _batch_mode = False
+        _scripted_inputs.clear()
+
+
+def main():
+    """Función principal del programa"""
+    args = _parse_args()
+
+    # Modo por lotes: lista de comandos desde --batch o un archivo --script;
+    # sin redibujar el menú ni bloquear en input() entre operaciones
+    commands = []
+    if args.script:
+        with open(args.script, 'r', encoding='utf-8') as f:
+            commands = [line.strip() for line in f
+                        if line.strip() and not line.lstrip().startswith('#')]
+    elif args.batch:
+        commands = [cmd.strip() for cmd in args.batch.split(',') if cmd.strip()]
+
+    interactive = not commands and sys.stdin.isatty()
+
+    if interactive:
+        sys.stdout.write(_BANNER_STR)
+
+    # Inicializar el analizador
+    analyzer = SatelliteAnalyzer()
+
+    # Descargar datos de satélites
+    if not analyzer.download_tle_data():
+        print("❌ Error al descargar datos. Terminando programa.")
+        return
+
+    if interactive:
+        print("\n� ¡Sistema cargado exitosamente!")
+
+    if commands:
+        _run_batch(analyzer, commands)
+        return
+
+    # El menú se mostrará automáticamente en cada iteración del bucle;
+    # con la entrada redirigida (script por tubería) se omite el redibujado
+    while True:
+        try:
+            if interactive:
+                # Mostrar menú en cada iteración
+                mostrar_menu()
+                print("\n" + "-" * 40)
+            try:
+                option = input("Selecciona una opción (1-16): ").strip()
+            except EOFError:
+                break
+            # Las claves literales de HANDLERS ya están internadas por el
+            # compilador: internar la entrada convierte la comparación del
+            # lookup en un chequeo de identidad de puntero
+            if option in HANDLERS:
+                option = sys.intern(option)
+
+            if option == '16':
+                print("👋 ¡Gracias por usar el Sistema de Análisis de Satélites!")
+                break
+
+            handler = HANDLERS.get(option)
+            if handler is not None:
+                handler(analyzer)
+            else:
+                print("❌ Opción inválida. Selecciona 1-16.")
+
+        except KeyboardInterrupt:
+            print("\n\n👋 Programa interrumpido por el usuario. ¡Hasta luego!")
+            break
+        except Exception as e:
+            print(f"❌ Error inesperado: {str(e)}")
+
+
+
+
+class RealisticOrbitPropagator:
+    """
+    Propagador orbital avanzado con perturbaciones físicas reales
+    Implementa: J2, arrastre atmosférico, presión de radiación solar
+    """
+    
+    def __init__(self):
+        self.earth_radius = 6378.137  # km
+        self.J2 = 1.08262668e-3      # Coeficiente J2 (achatamiento terrestre)
+        self.GM = 398600.4418        # km³/s² (constante gravitacional terrestre)
+        self.earth_rotation_rate = 7.2921159e-5  # rad/s
+        
+    def calculate_perturbations(self, satellite, t):
+        """
+        Calcular perturbaciones J2 (achatamiento terrestre)
+        La perturbación J2 es la más significativa para órbitas LEO
+        """
+        try:
+            # Obtener posición actual
+            position = satellite.position.km
+            r = np.linalg.norm(position)
+            
+            if r == 0:
+                return np.array([0, 0, 0])
+                
+            # Coordenadas normalizadas
+            x, y, z = position / r
+            
+            # Latitud geocéntrica
+            lat = np.arcsin(z)
+            
+            # Factor J2
+            factor = -1.5 * self.J2 * (self.earth_radius**2 / r**4) * self.GM
+            
+            # Componentes de aceleración J2
+            accel_x = factor * x * (1 - 5 * z**2)
+            accel_y = factor * y * (1 - 5 * z**2)
+            accel_z = factor * z * (3 - 5 * z**2)
+            
+            return np.array([accel_x, accel_y, accel_z])
+            
+        except Exception as e:
+            print(f"⚠️ Error calculando perturbaciones J2: {e}")
+            return np.array([0, 0, 0])
+    
+    def atmospheric_drag(self, satellite, t, solar_activity='moderate'):
+        """
+        Arrastre atmosférico (modelo MSIS-E00 simplificado)
+        Factores: densidad atmosférica, área/masa, coeficiente de arrastre
+        """
+        try:
+            position = satellite.position.km
+            r = np.linalg.norm(position)
+            altitude = r - self.earth_radius
+            
+            # Solo aplicar arrastre por debajo de 2000 km
+            if altitude > 2000:
+                return np.array([0, 0, 0])
+            
+            # Modelo de densidad atmosférica exponencial mejorado
+            if altitude > 1000:
+                # Exosfera
+                scale_height = 268
+                rho_0 = 3.019e-15  # kg/m³ a 1000 km
+            elif altitude > 500:
+                # Termosfera alta
+                scale_height = 60
+                rho_0 = 2.418e-11  # kg/m³ a 500 km
+            elif altitude > 200:
+                # Termosfera baja
+                scale_height = 37
+                rho_0 = 2.789e-11  # kg/m³ a 200 km
+            else:
+                # Mesosfera/Estratosfera
+                scale_height = 22
+                rho_0 = 3.899e-9   # kg/m³ a 200 km
+            
+            # Densidad con variación de actividad solar
+            solar_factors = {
+                'low': 0.7,
+                'moderate': 1.0,
+                'high': 1.5,
+                'extreme': 2.2
+            }
+            
+            solar_factor = solar_factors.get(solar_activity, 1.0)
+            
+            # Densidad atmosférica
+            rho = rho_0 * solar_factor * np.exp(-(altitude - 200) / scale_height)
+            
+            # Velocidad relativa (considerando rotación terrestre)
+            velocity = satellite.velocity.km_per_s
+            v_rel_mag = np.linalg.norm(velocity)
+            
+            if v_rel_mag == 0:
+                return np.array([0, 0, 0])
+            
+            # Parámetros típicos de satélites
+            drag_coefficient = 2.2  # Coeficiente de arrastre típico
+            area_to_mass = 0.01     # m²/kg (típico para satélites pequeños)
+            
+            # Aceleración por arrastre
+            drag_magnitude = -0.5 * rho * drag_coefficient * area_to_mass * v_rel_mag**2
+            drag_direction = velocity / v_rel_mag
+            
+            # Convertir a km/s²
+            drag_accel = drag_magnitude * drag_direction * 1e-3
+            
+            return drag_accel
+            
+        except Exception as e:
+            print(f"⚠️ Error calculando arrastre atmosférico: {e}")
+            return np.array([0, 0, 0])
+    
+    def solar_radiation_pressure(self, satellite, t):
+        """
+        Presión de radiación solar (significativa para satélites con grandes paneles)
+        """
+        try:
+            # Constante solar a 1 AU
+            solar_constant = 1361  # W/m²
+            c = 299792458  # m/s velocidad de la luz
+            
+            # Presión de radiación
+            radiation_pressure = solar_constant / c  # N/m²
+            
+            # Área efectiva (simplificado - depende de orientación)
+            effective_area = 10  # m² (estimación para satélite típico)
+            
+            # Factor de reflexión (0 = absorción total, 1 = reflexión total)
+            reflectance_factor = 0.6
+            
+            # Solo aplicar cuando el satélite está iluminado por el sol
+            # (simplificación: asumimos siempre iluminado)
+            
+            position = satellite.position.km
+            r = np.linalg.norm(position)
+            
+            if r == 0:
+                return np.array([0, 0, 0])
+            
+            # Dirección desde el centro de la Tierra hacia el satélite
+            direction = position / r
+            
+            # Masa típica del satélite (kg)
+            satellite_mass = 1000  # kg
+            
+            # Aceleración debida a presión de radiación (muy pequeña)
+            srp_magnitude = radiation_pressure * effective_area * (1 + reflectance_factor) / satellite_mass
+            
+            # Convertir a km/s²
+            srp_accel = srp_magnitude * direction * 1e-3
+            
+            return srp_accel
+            
+        except Exception as e:
+            print(f"⚠️ Error calculando presión de radiación solar: {e}")
+            return np.array([0, 0, 0])
+
+
+class AdvancedCollisionAnalyzer:
+    """
+    Analizador de colisiones avanzado con probabilidad estadística real
+    Implementa elipsoides de incertidumbre y análisis de covarianza
+    """
+    
+    def __init__(self):
+        self.min_distance_threshold = 5.0  # km
+        self.high_risk_threshold = 1.0     # km
+        
+    def calculate_collision_probability(self, sat1_data, sat2_data, time_window_hours=24):
+        """
+        Calcular probabilidad REAL de colisión usando:
+        - Elipsoides de incertidumbre
+        - Covarianza posicional
+        - Tamaños físicos de los satélites
+        """
+        try:
+            # Datos básicos de los satélites
+            pos1 = np.array(sat1_data['position'])
+            pos2 = np.array(sat2_data['position'])
+            vel1 = np.array(sat1_data['velocity'])
+            vel2 = np.array(sat2_data['velocity'])
+            
+            # Matrices de covarianza (6x6: posición + velocidad)
+            # En la realidad, estas vienen de análisis de tracking
+            covar1 = self._generate_covariance_matrix(sat1_data)
+            covar2 = self._generate_covariance_matrix(sat2_data)
+            
+            # Combinar matrices de covarianza
+            P = covar1 + covar2
+            
+            # Vector de estado relativo [Δx, Δy, Δz, Δvx, Δvy, Δvz]
+            relative_state = np.concatenate([pos1 - pos2, vel1 - vel2])
+            
+            # Extraer covarianza posicional (3x3)
+            P_pos = P[:3, :3]
+            
+            # Distancia de miss normalizada (distancia de Mahalanobis)
+            try:
+                P_pos_inv = np.linalg.inv(P_pos)
+                miss_distance_normalized = np.sqrt(
+                    relative_state[:3].T @ P_pos_inv @ relative_state[:3]
+                )
+            except np.linalg.LinAlgError:
+                # Si la matriz no es invertible, usar método simplificado
+                miss_distance_normalized = np.linalg.norm(relative_state[:3]) / np.sqrt(np.trace(P_pos))
+            
+            # Tamaños físicos combinados
+            radius1 = sat1_data.get('radius', 5.0)  # metros
+            radius2 = sat2_data.get('radius', 5.0)  # metros
+            combined_radius = (radius1 + radius2) / 1000  # convertir a km
+            
+            # Cálculo de probabilidad usando función de error complementaria
+            # Esta es una aproximación de la integral de probabilidad
+            sigma_miss = np.sqrt(np.trace(P_pos)) / 1000  # convertir a km
+            
+            if sigma_miss > 0:
+                # Probabilidad basada en distribución normal multivariada
+                if SCIPY_AVAILABLE:
+                    from scipy.special import erfc
+                    prob_collision = 0.5 * erfc(
+                        (miss_distance_normalized - combined_radius) / (sigma_miss * np.sqrt(2))
+                    )
+                else:
+                    # Fallback: aproximación usando función exponencial
+                    # No es tan precisa como erfc pero funciona sin SciPy
+                    normalized_distance = (miss_distance_normalized - combined_radius) / (sigma_miss * np.sqrt(2))
+                    # Aproximación: erfc(x) ≈ exp(-x²) para x > 0
+                    if normalized_distance > 0:
+                        prob_collision = 0.5 * np.exp(-normalized_distance**2)
+                    else:
+                        prob_collision = 0.5  # Caso crítico
+                
+                # Limitar probabilidad entre 0 y 1
+                prob_collision = max(0, min(1, prob_collision))
+            else:
+                # Fallback: análisis determinístico
+                actual_distance = np.linalg.norm(relative_state[:3])
+                prob_collision = 1.0 if actual_distance < combined_radius else 0.0
+            
+            return {
+                'probability': prob_collision,
+                'miss_distance_km': np.linalg.norm(relative_state[:3]),
+                'combined_radius_km': combined_radius,
+                'uncertainty_ellipsoid': self._calculate_uncertainty_ellipsoid(P_pos),
+                'risk_level': self._assess_risk_level(prob_collision, np.linalg.norm(relative_state[:3]))
+            }
+            
+        except Exception as e:
+            print(f"⚠️ Error calculando probabilidad de colisión: {e}")
+            return {
+                'probability': 0.0,
+                'miss_distance_km': float('inf'),
+                'error': str(e)
+            }
+    
+    def _generate_covariance_matrix(self, sat_data):
+        """
+        Generar matriz de covarianza 6x6 realista basada en el tipo de satélite
+        """
+        # Valores típicos de incertidumbre basados en capacidades de tracking
+        position_std = {
+            'LEO': [100, 50, 30],      # m [along-track, cross-track, radial]
+            'MEO': [200, 100, 60],     # m
+            'GEO': [500, 250, 150],    # m
+            'HEO': [1000, 500, 300]   # m
+        }
+        
+        velocity_std = {
+            'LEO': [0.1, 0.05, 0.03],   # m/s
+            'MEO': [0.2, 0.1, 0.06],    # m/s
+            'GEO': [0.5, 0.25, 0.15],   # m/s
+            'HEO': [1.0, 0.5, 0.3]      # m/s
+        }
+        
+        # Determinar tipo de órbita basado en altitud
+        altitude = sat_data.get('altitude', 500)
+        if altitude < 2000:
+            orbit_type = 'LEO'
+        elif altitude < 20000:
+            orbit_type = 'MEO'
+        elif altitude < 50000:
+            orbit_type = 'GEO'
+        else:
+            orbit_type = 'HEO'
+        
+        # Crear matriz de covarianza diagonal (simplificada)
+        pos_std = position_std[orbit_type]
+        vel_std = velocity_std[orbit_type]
+        
+        covariance = np.zeros((6, 6))
+        
+        # Covarianza posicional (convertir a km)
+        for i in range(3):
+            covariance[i, i] = (pos_std[i] / 1000) ** 2
+        
+        # Covarianza de velocidad (convertir a km/s)
+        for i in range(3):
+            covariance[i+3, i+3] = (vel_std[i] / 1000) ** 2
+        
+        # Agregar correlaciones cruzadas (simplificado)
+        # En realidad, estas correlaciones son complejas y dependen de la geometría orbital
+        correlation_factor = 0.1
+        for i in range(3):
+            covariance[i, i+3] = correlation_factor * np.sqrt(covariance[i, i] * covariance[i+3, i+3])
+            covariance[i+3, i] = covariance[i, i+3]
+        
+        return covariance
+    
+    def _calculate_uncertainty_ellipsoid(self, P_pos):
+        """
+        Calcular parámetros del elipsoide de incertidumbre 3D
+        """
+        try:
+            # Eigenvalores y eigenvectores de la matriz de covarianza
+            eigenvalues, eigenvectors = np.linalg.eigh(P_pos)
+            
+            # Semi-ejes del elipsoide (3-sigma)
+            semi_axes = 3 * np.sqrt(eigenvalues) * 1000  # convertir a metros
+            
+            return {
+                'semi_axes_m': semi_axes,
+                'orientation': eigenvectors,
+                'volume_km3': (4/3) * np.pi * np.prod(semi_axes) / 1e9
+            }
+        except:
+            return {'error': 'No se pudo calcular elipsoide de incertidumbre'}
+    
+    def _assess_risk_level(self, probability, distance_km):
+        """Evaluar nivel de riesgo basado en probabilidad y distancia"""
+        if probability > 1e-4 or distance_km < 1.0:
+            return 'CRÍTICO'
+        elif probability > 1e-6 or distance_km < 5.0:
+            return 'ALTO'
+        elif probability > 1e-8 or distance_km < 10.0:
+            return 'MODERADO'
+        else:
+            return 'BAJO'
+
+
+class UncertaintyModel:
+    """
+    Modelo avanzado de propagación de incertidumbre orbital
+    """
+    
+    def __init__(self):
+        self.base_uncertainty = {
+            'along_track': 100,    # m (dirección del movimiento)
+            'cross_track': 50,     # m (perpendicular al plano orbital)
+            'radial': 30,          # m (hacia el centro de la Tierra)
+        }
+        
+        # Tasas de crecimiento de incertidumbre (no lineales)
+        self.growth_rates = {
+            'along_track': 0.002,  # m/s (crece más rápido)
+            'cross_track': 0.001,  # m/s
+            'radial': 0.0005,      # m/s (crece más lento)
+        }
+        
+        # Factores de acoplamiento (perturbaciones aumentan incertidumbre)
+        self.coupling_factors = {
+            'J2_coupling': 1.2,
+            'drag_coupling': 1.5,
+            'solar_pressure_coupling': 1.1
+        }
+    
+    def propagate_uncertainty(self, time_hours, orbital_period_hours, perturbation_level='moderate'):
+        """
+        Propagar incertidumbre en el tiempo con modelo no-lineal
+        
+        En realidad esto requiere integrar las ecuaciones de Ricatti
+        junto con las ecuaciones de movimiento
+        """
+        try:
+            # Número de órbitas
+            n_orbits = time_hours / orbital_period_hours
+            
+            # Factor de crecimiento no-lineal
+            # La incertidumbre crece más rápido en órbitas excéntricas
+            nonlinear_factor = 1 + 0.1 * n_orbits  # crecimiento cuadrático simplificado
+            
+            # Factor de perturbación
+            perturbation_factors = {
+                'low': 1.0,
+                'moderate': 1.3,
+                'high': 1.8,
+                'extreme': 2.5
+            }
+            
+            pert_factor = perturbation_factors.get(perturbation_level, 1.3)
+            
+            # Matriz de covarianza propagada (6x6)
+            propagated_covariance = np.zeros((6, 6))
+            
+            # Incertidumbre posicional propagada
+            for i, direction in enumerate(['along_track', 'cross_track', 'radial']):
+                base_std = self.base_uncertainty[direction]
+                growth_rate = self.growth_rates[direction]
+                
+                # Crecimiento cuadrático con el tiempo
+                propagated_std = base_std + growth_rate * time_hours * 3600  # convertir a segundos
+                propagated_std *= nonlinear_factor * pert_factor
+                
+                # Convertir a km y elevar al cuadrado para varianza
+                propagated_covariance[i, i] = (propagated_std / 1000) ** 2
+            
+            # Incertidumbre de velocidad (derivada de la posicional)
+            for i in range(3):
+                # La incertidumbre de velocidad está relacionada con la posicional
+                # dividida por el período orbital
+                pos_std_km = np.sqrt(propagated_covariance[i, i])
+                vel_std_km_s = pos_std_km / (orbital_period_hours * 3600)
+                propagated_covariance[i+3, i+3] = vel_std_km_s ** 2
+            
+            # Correlaciones cruzadas (simplificadas)
+            correlation_strength = min(0.3, 0.1 * n_orbits)  # aumenta con el tiempo
+            
+            for i in range(3):
+                cross_correlation = correlation_strength * np.sqrt(
+                    propagated_covariance[i, i] * propagated_covariance[i+3, i+3]
+                )
+                propagated_covariance[i, i+3] = cross_correlation
+                propagated_covariance[i+3, i] = cross_correlation
+            
+            return {
+                'covariance_matrix': propagated_covariance,
+                'position_uncertainty_km': np.sqrt(np.diag(propagated_covariance[:3])),
+                'velocity_uncertainty_km_s': np.sqrt(np.diag(propagated_covariance[3:])),
+                'total_position_uncertainty_km': np.sqrt(np.trace(propagated_covariance[:3, :3])),
+                'propagation_time_hours': time_hours,
+                'orbits_completed': n_orbits
+            }
+            
+        except Exception as e:
+            print(f"⚠️ Error propagando incertidumbre: {e}")
+            return {'error': str(e)}
+    
+    def calculate_maneuver_uncertainty(self, delta_v_m_s, execution_accuracy=0.1):
+        """
+        Calcular incertidumbre introducida por maniobras de evasión
+        """
+        try:
+            # La ejecución de maniobras introduce incertidumbre adicional
+            # debido a errores en el control de propulsión
+            
+            maneuver_uncertainty = {
+                'delta_v_error': delta_v_m_s * execution_accuracy,  # error típico 10%
+                'pointing_error_deg': 0.5,  # error de apuntamiento
+                'timing_error_s': 1.0       # error de tiempo de ejecución
+            }
+            
+            # Convertir a incertidumbre posicional después de la maniobra
+            # (simplificación - en realidad requiere propagación completa)
+            
+            position_uncertainty_km = maneuver_uncertainty['delta_v_error'] * 0.1 / 1000  # regla empírica
+            
+            return {
+                'maneuver_uncertainty': maneuver_uncertainty,
+                'additional_position_uncertainty_km': position_uncertainty_km,
+                'confidence_degradation': execution_accuracy
+            }
+            
+        except Exception as e:
+            print(f"⚠️ Error calculando incertidumbre de maniobra: {e}")
+            return {'error': str(e)}
+
+
+if __name__ == "__main__":
+    main()
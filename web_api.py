@@ -240,4 +240,4 @@ if __name__ == '__main__':
     # Importar numpy para los cálculos
     import numpy as np
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=True, host='0.0.0.0', port=5000)